@@ -11,4 +11,5 @@ class ClassRoomAdmin(admin.ModelAdmin):
     search_fields = ['name']
     ordering = ['base', 'field']
     list_per_page = 10
+    list_select_related = ['field']
     list_filter = ['field']
\ No newline at end of file
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('field', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClassRoom',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, verbose_name='ClassRoom Name')),
+                ('base', models.PositiveIntegerField(verbose_name='Base of student')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now_add=True)),
+                ('field', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='field.field', verbose_name='Field')),
+            ],
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('classroom', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='classroom',
+            name='students',
+            field=models.ManyToManyField(limit_choices_to={'user_type': 'student'}, related_name='classroom', to=settings.AUTH_USER_MODEL, verbose_name='Student Users'),
+        ),
+        migrations.AddField(
+            model_name='classroom',
+            name='teachers',
+            field=models.ManyToManyField(limit_choices_to={'user_type': 'teacher'}, related_name='teaching_classroom', to=settings.AUTH_USER_MODEL, verbose_name='Teacher Users'),
+        ),
+    ]
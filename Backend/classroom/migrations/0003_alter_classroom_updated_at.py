@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classroom', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='classroom',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
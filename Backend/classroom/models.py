@@ -37,7 +37,7 @@ class ClassRoom(models.Model):
     )
 
     updated_at = models.DateTimeField(
-        auto_now_add=True 
+        auto_now=True 
     )
 
     def __str__(self):
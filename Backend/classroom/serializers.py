@@ -1,7 +1,10 @@
 from rest_framework import serializers 
 from classroom.models import ClassRoom
+from common.querysets import OptimizedQuerysetMixin
+
+class ClassRoomSerializer(OptimizedQuerysetMixin, serializers.ModelSerializer):
+    prefetch_related_fields = ["students", "teachers"]
 
-class ClassRoomSerializer(serializers.ModelSerializer):
     class Meta:
         model = ClassRoom 
         fields = [
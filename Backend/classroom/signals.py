@@ -0,0 +1,15 @@
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+from django.utils import timezone
+from classroom.models import ClassRoom
+
+@receiver(m2m_changed, sender=ClassRoom.students.through)
+@receiver(m2m_changed, sender=ClassRoom.teachers.through)
+def touch_classroom(sender, instance, action, reverse, pk_set, **kwargs):
+    # Adding or removing students and teachers counts as an update of the classroom.
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        ClassRoom.objects.filter(pk=instance.pk).update(updated_at=timezone.now())
+    elif pk_set:
+        ClassRoom.objects.filter(pk__in=pk_set).update(updated_at=timezone.now())
@@ -0,0 +1,38 @@
+import pytest
+from rest_framework.test import APIClient
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from reportcard.models import ReportCard
+from common.testing import assert_constant_queries
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestListQueryCounts:
+    def setup_method(self):
+        self.admin = create_user("test_admin1", "admin", 1)
+        teacher = create_user("test_teacher1", "teacher", 2)
+        students = [create_user(f"test_student{index}", "student", index) for index in range(3, 8)]
+        field = Field.objects.create(name="Math")
+        for index in range(10):
+            classroom = ClassRoom.objects.create(name=f"10-{index}", base=10, field=field)
+            classroom.students.add(*students)
+            classroom.teachers.add(teacher)
+            ReportCard.objects.create(user=students[0], class_room=classroom, disciplinary_status="good")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_classroom_list_has_no_n_plus_one(self):
+        assert_constant_queries(self.client, "/classroom/")
+
+    def test_reportcard_list_has_no_n_plus_one(self):
+        assert_constant_queries(self.client, "/reportcard/")
@@ -12,7 +12,7 @@ Decorators:
     - @admin_required: Ensures the user has admin privileges.
 
 Pagination:
-    - PageNumberPagination is used to paginate the classroom list.
+    - common.pagination.get_paginator paginates the classroom list (page or cursor mode).
 """
 
 from classroom.models import ClassRoom
@@ -23,9 +23,12 @@ from rest_framework.response import Response
 from rest_framework import status 
 from drf_yasg.utils import swagger_auto_schema 
 from drf_yasg import openapi 
-from rest_framework.pagination import PageNumberPagination
+from common.pagination import get_paginator, PAGINATION_PARAMETERS
 from common.is_admin import admin_required
 from common.is_authenticated import authenticated_required
+from common.conditional import conditional
+from user.models import User
+from common.access import get_access
 
 @swagger_auto_schema(
     method="get",
@@ -36,10 +39,12 @@ from common.is_authenticated import authenticated_required
         openapi.Parameter("teacher", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Teacher Name"),
         openapi.Parameter("base", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Base Name"),
         openapi.Parameter("field", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Field Name"),
-    ]
+    ] + PAGINATION_PARAMETERS
 )
 @api_view(["GET"])
 @authenticated_required
+# Users are tracked too: deleting one removes their classroom links without a signal.
+@conditional(ClassRoom, User)
 def classroomGetView(request, *args, **kwargs):
     """
     Retrieve a list of classrooms.
@@ -50,7 +55,7 @@ def classroomGetView(request, *args, **kwargs):
     user = request.user 
     
     # Filter classrooms based on user type (staff or student)
-    queryset = ClassRoom.objects.filter(students=user) if not user.is_staff else ClassRoom.objects.all()
+    queryset = ClassRoom.objects.filter(students=user) if not get_access(request).is_staff else ClassRoom.objects.all()
 
     # Apply filters from query parameters
     filters = {
@@ -63,9 +68,11 @@ def classroomGetView(request, *args, **kwargs):
     filters = {k: v for k, v in filters.items() if v} 
     queryset = queryset.filter(**filters)
 
+    # Load the students and teachers of the whole page in two queries
+    queryset = ClassRoomSerializer.optimize_queryset(queryset)
+
     # Paginate the queryset
-    paginator = PageNumberPagination()
-    paginator.page_size = 10
+    paginator = get_paginator(request)
     paginated_queryset = paginator.paginate_queryset(queryset, request)
     serializer = ClassRoomSerializer(paginated_queryset, many=True)
     return paginator.get_paginated_response(serializer.data)
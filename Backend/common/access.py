@@ -0,0 +1,118 @@
+"""
+Access Context
+==============
+This module describes what the requesting user is and belongs to, loaded once per request.
+
+Classes:
+1. `AccessContext` - The role of a user and their classroom and lesson memberships.
+2. `AccessContextMiddleware` - Adds `request.access`, built on first use.
+
+Functions:
+1. `get_access` - Returns the `AccessContext` of a request, memoised on the request.
+2. `get_request` - Returns the request among the arguments of a function view or an APIView method.
+
+Key Features:
+- Role checks (`is_admin`, `is_teacher`, `is_student`, `can_manage`) read the user row only.
+- Memberships are loaded with one query each on first use; later checks are set lookups.
+- The context is built on first use, after DRF has authenticated the JWT user, and is
+  rebuilt if `request.user` changes.
+
+Example:
+    access = get_access(request)
+    if not access.can_manage:
+        return Response({"detail": "..."}, status=status.HTTP_403_FORBIDDEN)
+    if student_id not in access.classroom_student_ids(classroom_id):
+        ...
+"""
+
+from functools import cached_property
+from django.utils.functional import SimpleLazyObject
+from django.views import View
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+
+class AccessContext:
+    def __init__(self, user):
+        self.user = user
+        self.is_authenticated = bool(user is not None and user.is_authenticated)
+        self.user_id = user.pk if self.is_authenticated else None
+        self.user_type = getattr(user, "user_type", None) if self.is_authenticated else None
+        self.is_staff = self.is_authenticated and user.is_staff
+        self._rosters = {}
+
+    @property
+    def is_admin(self):
+        return self.is_staff and self.user_type == "admin"
+
+    @property
+    def is_teacher(self):
+        return self.user_type == "teacher"
+
+    @property
+    def is_student(self):
+        return self.user_type == "student"
+
+    @property
+    def can_manage(self):
+        """Teachers, admins and staff manage attendance and scores."""
+        return self.user_type in ("admin", "teacher") or self.is_staff
+
+    @cached_property
+    def enrolled_classrooms(self):
+        """{classroom id: field id} of the classrooms the user studies in."""
+        if not self.is_authenticated:
+            return {}
+        return dict(ClassRoom.objects.filter(students=self.user_id).values_list("id", "field_id"))
+
+    @property
+    def enrolled_classroom_ids(self):
+        return self.enrolled_classrooms.keys()
+
+    @cached_property
+    def taught_classroom_ids(self):
+        if not self.is_authenticated:
+            return set()
+        return set(ClassRoom.objects.filter(teachers=self.user_id).values_list("id", flat=True))
+
+    @cached_property
+    def lesson_ids(self):
+        if not self.is_authenticated:
+            return set()
+        return set(Lesson.objects.filter(teachers=self.user_id).values_list("id", flat=True))
+
+    def classroom_student_ids(self, classroom_id):
+        """Ids of the students of a classroom, loaded once per classroom."""
+        classroom_id = int(classroom_id)
+        if classroom_id not in self._rosters:
+            self._rosters[classroom_id] = set(
+                ClassRoom.students.through.objects.filter(classroom_id=classroom_id).values_list("user_id", flat=True)
+            )
+        return self._rosters[classroom_id]
+
+def get_request(args):
+    # APIView methods receive (self, request, ...), function views (request, ...).
+    return args[1] if isinstance(args[0], View) else args[0]
+
+def get_access(request):
+    """
+    Returns the access context of `request` (a DRF or Django request).
+    """
+    http_request = getattr(request, "_request", request)
+    user = getattr(request, "user", None)
+    access = getattr(http_request, "_access_context", None)
+    if access is None or access.user is not user:
+        access = AccessContext(user)
+        http_request._access_context = access
+    return access
+
+class AccessContextMiddleware:
+    """
+    Adds `request.access`. It is evaluated when first used, so in DRF views it
+    sees the user authenticated by the view.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.access = SimpleLazyObject(lambda: get_access(request))
+        return self.get_response(request)
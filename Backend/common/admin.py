@@ -0,0 +1,17 @@
+from django.contrib import admin
+from common.models import QueuedTask
+
+@admin.register(QueuedTask)
+class QueuedTaskAdmin(admin.ModelAdmin):
+    list_display = [
+        'id',
+        'name',
+        'status',
+        'attempts',
+        'run_after',
+        'created_at',
+        'finished_at'
+    ]
+    list_filter = ['status', 'name']
+    search_fields = ['idempotency_key']
+    readonly_fields = ['args', 'kwargs', 'error']
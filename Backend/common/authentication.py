@@ -0,0 +1,83 @@
+"""
+Claims-Based JWT Authentication
+===============================
+This module authenticates API requests from the claims of the access token, without loading the `User` row.
+
+Classes:
+1. `ClaimsTokenObtainPairSerializer` - Issues tokens (`api/token/`) carrying the `user_type` and `is_staff` claims.
+2. `ClaimsJWTAuthentication` - Authenticates a request as a `ClaimsUser` built from those claims.
+
+Functions:
+1. `get_user_state` - Returns (is_active, user_type, is_staff) of a user, cached for `settings.AUTH_USER_STATE_TTL` seconds.
+2. `forget_user_state` - Drops the cached state of a user after it changed.
+
+Key Features:
+- `request.user` is a `ClaimsUser`: a real `User` instance whose other fields are loaded with one query on first use.
+- Deactivated users and users whose role changed are refused once their cached state expires, or
+  immediately in processes sharing the cache with the one that saved the change.
+- Tokens issued before the claims were added are authenticated the regular way.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
+from user.models import User
+from common.models import ClaimsUser
+
+CLAIMS = ("user_type", "is_staff")
+
+def _cache():
+    return caches[getattr(settings, "AUTH_USER_STATE_CACHE", "default")]
+
+def _key(user_id):
+    return f"auth:user-state:{user_id}"
+
+def get_user_state(user_id):
+    """
+    Returns [is_active, user_type, is_staff] of the user, or None if it does not exist.
+    """
+    cache = _cache()
+    state = cache.get(_key(user_id))
+    if state is None:
+        row = User.objects.filter(pk=user_id).values_list("is_active", "user_type", "is_staff").first()
+        # An empty list marks a missing user, since None means "not cached".
+        state = list(row) if row else []
+        cache.set(_key(user_id), state, getattr(settings, "AUTH_USER_STATE_TTL", 60))
+    return state or None
+
+def forget_user_state(user_id):
+    _cache().delete(_key(user_id))
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        # Access tokens made from this refresh token copy its claims.
+        token["user_type"] = user.user_type
+        token["is_staff"] = user.is_staff
+        return token
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if any(claim not in validated_token for claim in CLAIMS):
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        state = get_user_state(user_id)
+        if state is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        is_active, user_type, is_staff = state
+        if not is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if (user_type, is_staff) != (validated_token["user_type"], validated_token["is_staff"]):
+            raise AuthenticationFailed(_("The user's role has changed, sign in again."), code="role_changed")
+
+        return ClaimsUser.from_claims(user_id, user_type, is_staff)
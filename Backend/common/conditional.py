@@ -0,0 +1,130 @@
+"""
+Conditional GET
+===============
+This module lets polled GET endpoints answer `304 Not Modified` without querying or serializing.
+
+Decorators:
+    - conditional: Adds an ETag to the responses of a GET view and answers 304 when `If-None-Match` matches.
+
+Functions:
+    - track: Bumps the version of models on `post_save`, `post_delete` and `m2m_changed`.
+    - get_version: Returns the current version of a model.
+    - bump: Bumps the version of a model, for writes that send no signal.
+
+Key Features:
+    - The ETag is a hash of the versions of the models the response is built from, the path and query
+      string, the requesting user and the current date; computing it runs no query.
+    - Versions are counters of the reference cache backend (common/refcache.py): with
+      `CacheVersionBackend` on a shared cache every worker answers with the same ETag. When the counters
+      are private to each process, a write made by another worker does not change them, so the ETag also
+      holds a time bucket of `settings.CONDITIONAL_LOCAL_TTL` seconds; a stale 304 lasts at most that long.
+    - Versions are bumped when a row changes and again when the transaction commits, so a response built
+      from rows that were not committed yet is never tagged with the final version.
+    - Responses carry `Cache-Control: private, max-age=..., must-revalidate` and `Vary: Authorization`.
+    - Writes that skip signals (`bulk_create`, `update`) must call `bump` themselves.
+
+Example:
+    @api_view(["GET"])
+    @authenticated_required
+    @conditional(Event)
+    def eventGetView(request, *args, **kwargs):
+        ...
+"""
+
+import hashlib
+import time
+from datetime import date
+from django.conf import settings
+from functools import wraps
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from rest_framework.response import Response
+from rest_framework import status
+from common import refcache
+from common.access import get_access, get_request
+
+def _name(model):
+    return f"resource:{model._meta.label_lower}"
+
+def get_version(model):
+    return refcache.get_backend().get(_name(model))
+
+def bump(model):
+    backend = refcache.get_backend()
+    backend.bump(_name(model))
+    transaction.on_commit(lambda: backend.bump(_name(model)))
+
+def _bump_sender(model):
+    def receiver(sender, **kwargs):
+        bump(model)
+    return receiver
+
+_receivers = {}
+
+def track(*models):
+    """
+    Bumps the version of every model in `models` when one of its rows or many-to-many links changes.
+    """
+    for model in models:
+        name = _name(model)
+        if name in _receivers:
+            continue
+        # Kept here, since signals hold their receivers weakly.
+        receiver = _receivers[name] = _bump_sender(model)
+        post_save.connect(receiver, sender=model, dispatch_uid=f"conditional-save-{name}")
+        post_delete.connect(receiver, sender=model, dispatch_uid=f"conditional-delete-{name}")
+        for field in model._meta.many_to_many:
+            m2m_changed.connect(receiver, sender=field.remote_field.through, dispatch_uid=f"conditional-m2m-{name}-{field.name}")
+
+def _etag(request, models, validator):
+    backend = refcache.get_backend()
+    parts = [
+        backend.scope,
+        request.path,
+        "&".join(sorted(f"{key}={value}" for key, values in request.query_params.lists() for value in values)),
+        str(get_access(request).user_id),
+        str(date.today()),
+    ]
+    if not backend.shared:
+        parts.append(str(int(time.time() // getattr(settings, "CONDITIONAL_LOCAL_TTL", 5))))
+    parts += [f"{_name(model)}={backend.get(_name(model))}" for model in models]
+    if validator is not None:
+        parts.append(repr(validator(request)))
+    return 'W/"%s"' % hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+def _cache_headers(response, etag, max_age):
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, max_age=max_age, must_revalidate=True)
+    patch_vary_headers(response, ["Authorization"])
+    return response
+
+def conditional(*models, validator=None, max_age=0):
+    """
+    Makes a GET view conditional on the versions of `models`.
+
+    Args:
+        models: The models the response is built from.
+        validator (callable): Returns extra cheap state the response depends on, e.g. an in-memory leaderboard.
+        max_age (int): Seconds a client may reuse a response without revalidating.
+    """
+    track(*models)
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrap_view(*args, **kwargs):
+            request = get_request(args)
+            if request.method not in ("GET", "HEAD"):
+                return view_func(*args, **kwargs)
+
+            etag = _etag(request, models, validator)
+            if_none_match = request.headers.get("If-None-Match", "")
+            if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+                return _cache_headers(Response(status=status.HTTP_304_NOT_MODIFIED), etag, max_age)
+
+            response = view_func(*args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                _cache_headers(response, etag, max_age)
+            return response
+        return _wrap_view
+    return decorator
@@ -0,0 +1,72 @@
+"""
+This module streams querysets out as CSV or NDJSON files.
+
+Functions:
+    - get_export_format: Returns the format requested with the `file_format` query parameter.
+    - stream_export: Returns a StreamingHttpResponse writing the rows of a queryset.
+
+Key Features:
+    - Rows are read with `values_list(...).iterator(chunk_size=...)`, so no model instance is built
+      and at most one chunk of rows is held in memory, whatever the row count.
+    - Each row is encoded and sent as soon as it is read.
+
+Example:
+    columns = [("id", "id"), ("student", "students__username")]
+    return stream_export(queryset, columns, get_export_format(request), "scores")
+"""
+import csv
+import json
+from datetime import date
+
+from django.http import StreamingHttpResponse
+from drf_yasg import openapi
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+EXPORT_PARAMETERS = [
+    openapi.Parameter("file_format", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Export format (csv, ndjson), defaults to csv"),
+]
+
+class _Echo:
+    """A file-like object whose write returns the value, for csv.writer."""
+    def write(self, value):
+        return value
+
+def get_export_format(request):
+    """
+    Returns the requested export format, or None if it is not supported.
+    """
+    file_format = request.query_params.get("file_format", "csv")
+    return file_format if file_format in EXPORT_FORMATS else None
+
+def _csv_rows(headers, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow(row)
+
+def _ndjson_rows(headers, rows):
+    for row in rows:
+        yield json.dumps(dict(zip(headers, row)), default=str) + "\n"
+
+def stream_export(queryset, columns, file_format, name, chunk_size=2000):
+    """
+    Streams `queryset` as a file attachment.
+
+    Args:
+        queryset: The rows to export.
+        columns (list): (header, lookup) pairs; the lookups are passed to `values_list`.
+        file_format (str): "csv" or "ndjson".
+        name (str): The file name, without the date and extension.
+        chunk_size (int): Rows fetched from the database at a time.
+    """
+    headers = [header for header, _ in columns]
+    rows = queryset.order_by("id").values_list(*[lookup for _, lookup in columns]).iterator(chunk_size=chunk_size)
+    encode = _csv_rows if file_format == "csv" else _ndjson_rows
+
+    response = StreamingHttpResponse(encode(headers, rows), content_type=EXPORT_FORMATS[file_format])
+    response["Content-Disposition"] = f'attachment; filename="{name}-{date.today()}.{file_format}"'
+    return response
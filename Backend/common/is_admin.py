@@ -5,7 +5,8 @@ Decorators:
     - admin_required: Ensures that the requesting user has an admin user type or is staff.
 
 Usage:
-    Apply the `@admin_required` decorator to any API view to restrict access to admin users only.
+    Apply the `@admin_required` decorator to any API view or APIView method to restrict access to admin users only.
+    Anonymous users get a 401, so the order in which it is stacked with `@authenticated_required` does not matter.
 
 Example:
     @api_view(["POST"])
@@ -17,15 +18,21 @@ Example:
 from functools import wraps 
 from rest_framework.response import Response 
 from rest_framework import status 
+from common.access import get_access, get_request
 
 def admin_required(view_func):
     @wraps(view_func)
-    def _wraps_view(request, *args, **kwargs):
-        user = request.user 
-        if (not user.is_staff) or (user.user_type != "admin"):
+    def _wraps_view(*args, **kwargs):
+        access = get_access(get_request(args))
+        if not access.is_authenticated:
+            return Response(
+                {"detail":"Authenticated required"},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+        if not access.is_admin:
             return Response(
                 {"detail":"You are not allowed to perform this action"},
                 status=status.HTTP_403_FORBIDDEN
             )
-        return view_func(request, *args, **kwargs)
+        return view_func(*args, **kwargs)
     return _wraps_view
\ No newline at end of file
@@ -5,7 +5,7 @@ Decorators:
     - authenticated_required: Ensures that the requesting user is authenticated.
 
 Usage:
-    Apply the `@authenticated_required` decorator to any API view to restrict access to authenticated users only.
+    Apply the `@authenticated_required` decorator to any API view or APIView method to restrict access to authenticated users only.
 
 Example:
     @api_view(["GET"])
@@ -17,15 +17,15 @@ Example:
 from functools import wraps 
 from rest_framework.response import Response 
 from rest_framework import status 
+from common.access import get_access, get_request
 
 def authenticated_required(view_func):
     @wraps(view_func)
-    def _wraps_view(request, *args, **kwargs):
-        user = request.user 
-        if not user.is_authenticated:
+    def _wraps_view(*args, **kwargs):
+        if not get_access(get_request(args)).is_authenticated:
             return Response(
                 {"detail":"Authenticated required"},
                 status=status.HTTP_401_UNAUTHORIZED
             )
-        return view_func(request, *args, **kwargs)
+        return view_func(*args, **kwargs)
     return _wraps_view
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+Drives the list and create endpoints through the DRF test client and records
+their latency and query counts.
+
+Every request runs in a transaction that is rolled back, so create endpoints
+can be repeated without changing the dataset between runs and commits. The
+JSON report is meant to be kept per commit and diffed, or passed back with
+`--compare`. A scenario answering with a non-2xx status fails the command,
+since its timings would be those of an error page.
+
+Usage:
+    python manage.py seed_school --students 5000
+    python manage.py benchmark_api --label main --output main.json
+    python manage.py benchmark_api --label branch --output branch.json --compare main.json
+"""
+
+import json
+import time
+from collections import Counter
+from datetime import date, timedelta
+from statistics import median, quantiles
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+from user.models import User
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+from score.models import Score
+from event.models import Event
+from common.seeding import seed_school
+
+def _context():
+    """
+    Picks the users and rows the scenarios send requests about.
+    """
+    student = User.objects.filter(user_type="student", classroom__isnull=False, score_student__isnull=False).first()
+    if student is None:
+        raise CommandError("No student with a classroom and scores found, run `seed_school` first or pass --seed.")
+    classroom = ClassRoom.objects.filter(students=student).first()
+    admin = User.objects.filter(user_type="admin").first()
+    if admin is None:
+        admin = User.objects.create_user(
+            username="benchmark_admin",
+            password=None,
+            user_type="admin",
+            phone_number="00000000000",
+            national_code="0000000000"
+        )
+    return {
+        "admin": admin,
+        "teacher": User.objects.filter(user_type="teacher").first(),
+        "student": student,
+        "classroom": classroom,
+        "roster": list(classroom.students.values_list("id", flat=True)),
+        "lesson": Lesson.objects.first(),
+        "scores": list(Score.objects.filter(students=student).values_list("id", flat=True)),
+        "event": Event.objects.filter(date__gte=date.today(), status="not_held").first(),
+    }
+
+def _scenarios(ctx):
+    """
+    Returns (name, method, path, user, data) for every benchmarked endpoint.
+    """
+    today = date.today()
+    scenarios = [
+        ("users_list", "get", "/users/", ctx["admin"], {}),
+        ("classroom_list", "get", "/classroom/", ctx["admin"], {}),
+        ("score_list", "get", "/score/", ctx["admin"], {}),
+        ("reportcard_list", "get", "/reportcard/", ctx["admin"], {}),
+        ("event_list", "get", "/event/", ctx["student"], {}),
+        ("registration_list", "get", "/event/register/", ctx["admin"], {}),
+        ("attending_list", "get", "/attending/", ctx["admin"], {}),
+        ("approval_list", "get", "/attending/approval/", ctx["admin"], {}),
+        ("review_list", "get", "/attending/review/", ctx["admin"], {}),
+        ("attending_stats", "get", "/attending/stats/", ctx["admin"], {"classroom": ctx["classroom"].id}),
+        ("top_students", "get", "/gamification/top-students/", ctx["student"], {}),
+        ("student_profile", "get", "/gamification/student-profile/", ctx["student"], {}),
+        ("classroom_create", "post", "/classroom/create/", ctx["admin"], {
+            "name": "benchmark class",
+            "base": 10,
+            "field": ctx["classroom"].field_id,
+            "students": ctx["roster"][:5],
+            "teachers": [ctx["teacher"].id] if ctx["teacher"] else [],
+        }),
+        ("score_create", "post", "/score/created/", ctx["admin"], {
+            "students": ctx["student"].id,
+            "lesson": ctx["lesson"].id,
+            "classroom": ctx["classroom"].id,
+            "score_value": 20,
+        }),
+        ("score_bulk", "post", "/score/bulk/", ctx["admin"], {
+            "lesson": ctx["lesson"].id,
+            "classroom": ctx["classroom"].id,
+            "scores": [{"student": student_id, "score_value": 20} for student_id in ctx["roster"]],
+        }),
+        ("reportcard_create", "post", "/reportcard/create/", ctx["admin"], {
+            "user": ctx["student"].id,
+            "class_room": ctx["classroom"].id,
+            "scores": ctx["scores"],
+            "disciplinary_status": "good",
+        }),
+        ("attending_create", "post", "/attending/create/", ctx["admin"], {
+            "student": ctx["student"].id,
+            "user": ctx["student"].id,
+            "classroom": ctx["classroom"].id,
+            "status": "present",
+            "date": str(today),
+        }),
+        ("attending_bulk", "post", "/attending/bulk/", ctx["admin"], {
+            "classroom": ctx["classroom"].id,
+            "date": str(today),
+            "attendances": [{"student": student_id, "status": "present"} for student_id in ctx["roster"]],
+        }),
+        ("event_create", "post", "/event/create/", ctx["admin"], {
+            "name": "benchmark event",
+            "description": "benchmark",
+            "date": str(today + timedelta(days=3650)),
+            "time": "23:59",
+        }),
+    ]
+    if ctx["event"]:
+        scenarios.append(("registration_create", "post", "/event/register/create/", ctx["admin"], {
+            "user": ctx["admin"].id,
+            "event": ctx["event"].id,
+        }))
+    return scenarios
+
+def _run(client, method, path, data, iterations, warmup):
+    timings, queries, statuses = [], [], Counter()
+    for iteration in range(warmup + iterations):
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                if method == "get":
+                    response = client.get(path, data)
+                else:
+                    response = client.post(path, data, format="json")
+                elapsed = (time.perf_counter() - start) * 1000
+            transaction.set_rollback(True)
+        statuses[response.status_code] += 1
+        if iteration < warmup:
+            continue
+        timings.append(elapsed)
+        queries.append(len(captured))
+
+    p95 = quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+    return {
+        "status": statuses.most_common(1)[0][0],
+        "statuses": sorted(statuses),
+        "p50_ms": round(median(timings), 3),
+        "p95_ms": round(p95, 3),
+        "queries": int(median(queries)),
+        "queries_max": max(queries),
+    }
+
+class Command(BaseCommand):
+    help = "Benchmark the list/create endpoints and write p50/p95 latency and query counts to a JSON report."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", action="store_true", help="Generate a synthetic school before measuring.")
+        parser.add_argument("--students", type=int, default=2000, help="Number of students generated by --seed.")
+        parser.add_argument("--iterations", type=int, default=30, help="Measured requests per endpoint.")
+        parser.add_argument("--warmup", type=int, default=3, help="Unmeasured requests per endpoint.")
+        parser.add_argument("--only", nargs="*", help="Only run the scenarios with these names.")
+        parser.add_argument("--label", default="", help="Free text stored in the report, e.g. a commit hash.")
+        parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+        parser.add_argument("--compare", help="A previous report to print the changes against.")
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1.")
+
+        if options["seed"]:
+            counts = seed_school(students=options["students"], classrooms=max(1, options["students"] // 30))
+            self.stderr.write(f"Seeded: {counts}")
+
+        ctx = _context()
+        client = APIClient()
+        results = []
+        failed = []
+        # The test client sends its requests to "testserver", which the
+        # deployed ALLOWED_HOSTS rejects with a 400.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            for name, method, path, user, data in _scenarios(ctx):
+                if options["only"] and name not in options["only"]:
+                    continue
+                client.force_authenticate(user=user)
+                result = _run(client, method, path, data, options["iterations"], options["warmup"])
+                results.append({"name": name, "method": method.upper(), "path": path, **result})
+                self.stderr.write(f"{name}: {result['status']} p50 {result['p50_ms']} ms, {result['queries']} queries")
+                if any(not 200 <= code < 300 for code in result["statuses"]):
+                    failed.append(f"{name} ({', '.join(map(str, result['statuses']))})")
+
+        if failed:
+            raise CommandError(f"Non-2xx responses, no report written: {'; '.join(failed)}")
+
+        report = {
+            "label": options["label"],
+            "vendor": connection.vendor,
+            "iterations": options["iterations"],
+            "results": results,
+        }
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(report, output, indent=2)
+            self.stderr.write(self.style.SUCCESS(f"Report written to {options['output']}."))
+        else:
+            self.stdout.write(json.dumps(report, indent=2))
+
+        if options["compare"]:
+            with open(options["compare"]) as previous_file:
+                previous = {result["name"]: result for result in json.load(previous_file)["results"]}
+            for result in results:
+                before = previous.get(result["name"])
+                if not before:
+                    continue
+                self.stderr.write(
+                    f"{result['name']}: p50 {before['p50_ms']} -> {result['p50_ms']} ms, "
+                    f"p95 {before['p95_ms']} -> {result['p95_ms']} ms, "
+                    f"queries {before['queries']} -> {result['queries']}"
+                )
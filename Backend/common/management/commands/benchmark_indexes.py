@@ -0,0 +1,169 @@
+"""
+Measures the query plans and latencies of the hot filter paths.
+
+Each access path covered by a composite index or unique constraint is run
+`--repeat` times against sample values taken from the current data. The
+report holds the SQL, the database's EXPLAIN output and p50/p95 latencies.
+
+To compare, write one report on a database migrated without the indexes and
+one with them, then pass the first to `--compare`:
+
+Usage:
+    python manage.py benchmark_indexes --seed --output before.json
+    python manage.py benchmark_indexes --output after.json --compare before.json
+"""
+
+import json
+import time
+from statistics import median, quantiles
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Max, Min
+from common.seeding import seed_school
+from present_absent.models import PresentAbsent, AttendanceApproval
+from score.models import Score
+from event.models import Event, Registration
+from gamification.models import StudentProfile
+
+def _sample(model, *fields):
+    """
+    Returns `fields` of a row from the middle of the table, or None if it is empty.
+    """
+    bounds = model.objects.aggregate(low=Min("id"), high=Max("id"))
+    if bounds["low"] is None:
+        return None
+    middle = (bounds["low"] + bounds["high"]) // 2
+    return model.objects.filter(id__gte=middle).order_by("id").values(*fields).first()
+
+def _hot_paths():
+    """
+    Yields (name, index, queryset, action) for every hot path that has data to sample.
+    """
+    row = _sample(PresentAbsent, "user", "classroom", "date")
+    if row:
+        yield (
+            "attendance_duplicate_check",
+            "unique_attendance_per_day",
+            PresentAbsent.objects.filter(user=row["user"], classroom=row["classroom"], date=row["date"]),
+            lambda queryset: queryset.exists()
+        )
+        yield (
+            "attendance_classroom_day",
+            "attendance_classroom_date_idx",
+            PresentAbsent.objects.filter(classroom=row["classroom"], date=row["date"]),
+            list
+        )
+
+    row = _sample(Score, "students", "lesson")
+    if row:
+        yield (
+            "score_student_lesson",
+            "score_student_lesson_idx",
+            Score.objects.filter(students=row["students"], lesson=row["lesson"]),
+            list
+        )
+
+    row = _sample(AttendanceApproval, "date", "status_requested")
+    if row:
+        yield (
+            "approval_date_status",
+            "approval_date_status_idx",
+            AttendanceApproval.objects.filter(date=row["date"], status_requested=row["status_requested"]),
+            list
+        )
+
+    row = _sample(Registration, "user")
+    if row:
+        yield (
+            "registration_count_per_user",
+            "unique_registration",
+            Registration.objects.filter(user=row["user"]),
+            lambda queryset: queryset.count()
+        )
+
+    row = _sample(Event, "date", "time")
+    if row:
+        yield (
+            "event_slot_check",
+            "unique_event_slot",
+            Event.objects.filter(date=row["date"], time=row["time"]),
+            lambda queryset: queryset.exists()
+        )
+
+    if StudentProfile.objects.exists():
+        yield (
+            "top_students",
+            "profile_ranking_idx",
+            StudentProfile.objects.order_by("-level", "-total_point")[:3],
+            list
+        )
+
+def _measure(queryset, action, repeat):
+    timings = []
+    for _ in range(repeat):
+        # A fresh clone each time so no result cache is reused.
+        start = time.perf_counter()
+        action(queryset.all())
+        timings.append((time.perf_counter() - start) * 1000)
+    p95 = quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+    return round(median(timings), 4), round(p95, 4)
+
+class Command(BaseCommand):
+    help = "Report query plans and latencies of the indexed filter paths."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", action="store_true", help="Generate a synthetic school before measuring.")
+        parser.add_argument("--students", type=int, default=2000, help="Number of students generated by --seed.")
+        parser.add_argument("--repeat", type=int, default=50, help="Runs per query.")
+        parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+        parser.add_argument("--compare", help="A previous report to print the latency changes against.")
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1.")
+
+        if options["seed"]:
+            counts = seed_school(students=options["students"], classrooms=max(1, options["students"] // 30))
+            self.stderr.write(f"Seeded: {counts}")
+
+        results = []
+        for name, index, queryset, action in _hot_paths():
+            p50, p95 = _measure(queryset, action, options["repeat"])
+            results.append({
+                "name": name,
+                "index": index,
+                "sql": str(queryset.query),
+                "plan": queryset.explain(),
+                "p50_ms": p50,
+                "p95_ms": p95,
+            })
+
+        report = {
+            "vendor": connection.vendor,
+            "repeat": options["repeat"],
+            "rows": {
+                model.__name__: model.objects.count()
+                for model in (PresentAbsent, Score, AttendanceApproval, Registration, Event, StudentProfile)
+            },
+            "results": results,
+        }
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(report, output, indent=2, default=str)
+            self.stderr.write(self.style.SUCCESS(f"Report written to {options['output']}."))
+        else:
+            self.stdout.write(json.dumps(report, indent=2, default=str))
+
+        if options["compare"]:
+            with open(options["compare"]) as previous_file:
+                previous = {result["name"]: result for result in json.load(previous_file)["results"]}
+            for result in results:
+                before = previous.get(result["name"])
+                if not before:
+                    continue
+                plan_changed = "plan changed" if before["plan"] != result["plan"] else "same plan"
+                self.stderr.write(
+                    f"{result['name']}: p50 {before['p50_ms']} -> {result['p50_ms']} ms, "
+                    f"p95 {before['p95_ms']} -> {result['p95_ms']} ms ({plan_changed})"
+                )
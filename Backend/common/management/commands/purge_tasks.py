@@ -0,0 +1,38 @@
+"""
+Deletes the finished tasks of the task queue (see `common.tasks`).
+
+Done and failed rows are kept `TASKS_RETENTION_DAYS` days, to inspect failures and
+to keep deduplicating their idempotency keys, then deleted in batches. Meant to be
+run daily, e.g. from cron.
+
+Usage:
+    python manage.py purge_tasks [--days 30] [--batch-size 1000]
+"""
+
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from common.tasks import purge_finished
+
+class Command(BaseCommand):
+    help = "Delete the done and failed tasks older than the retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=getattr(settings, "TASKS_RETENTION_DAYS", 30),
+            help="Days finished tasks are kept."
+        )
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows deleted per statement.")
+
+    def handle(self, *args, **options):
+        if options["days"] < 0:
+            raise CommandError("--days cannot be negative.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        before = timezone.now() - timedelta(days=options["days"])
+        deleted = purge_finished(before, batch_size=options["batch_size"])
+        self.stderr.write(self.style.SUCCESS(f"Deleted {deleted} finished tasks."))
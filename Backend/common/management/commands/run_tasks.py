@@ -0,0 +1,44 @@
+"""
+Runs the tasks queued in the database (see `common.tasks`).
+
+Needed when `TASKS_BACKEND` is "database". With the "thread" backend it picks
+up the tasks a restarted web process did not get to: pending ones right away,
+and the ones it was running once their lease (`TASKS_LEASE_TIMEOUT`) expires.
+Several workers can run side by side: each task is claimed by exactly one of them.
+
+Usage:
+    python manage.py run_tasks [--interval 1] [--batch-size 100]
+    python manage.py run_tasks --once
+"""
+
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from common.tasks import run_pending
+
+class Command(BaseCommand):
+    help = "Run the queued tasks that are due, polling for new ones."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--interval", type=float, default=1.0, help="Seconds to wait when no task is due.")
+        parser.add_argument("--batch-size", type=int, default=100, help="Tasks picked per poll.")
+        parser.add_argument("--once", action="store_true", help="Exit once no task is due.")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        total = 0
+        try:
+            while True:
+                close_old_connections()
+                count = run_pending(limit=options["batch_size"])
+                total += count
+                if count:
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        self.stderr.write(self.style.SUCCESS(f"Ran {total} tasks."))
@@ -0,0 +1,51 @@
+"""
+Generates a synthetic school for load tests and benchmarks.
+
+Every table is written with bulk inserts; see `common.seeding` for what is
+generated. Runs can be repeated: each one adds a new, independent school.
+
+Usage:
+    python manage.py seed_school [--students 5000] [--classrooms 200] [--seed 1]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from common.seeding import seed_school
+
+class Command(BaseCommand):
+    help = "Generate a synthetic school (students, classrooms, scores, attendance, events) with bulk inserts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--students", type=int, default=2000)
+        parser.add_argument("--teachers", type=int, default=100)
+        parser.add_argument("--classrooms", type=int, default=100)
+        parser.add_argument("--lessons", type=int, default=40)
+        parser.add_argument("--scores-per-student", type=int, default=10)
+        parser.add_argument("--days", type=int, default=60, help="School days of attendance history.")
+        parser.add_argument("--approvals", type=int, default=500)
+        parser.add_argument("--events", type=int, default=200)
+        parser.add_argument("--registrations-per-student", type=int, default=3)
+        parser.add_argument("--student-events-per-student", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator.")
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        if options["students"] < 1 or options["teachers"] < 1 or options["classrooms"] < 1 or options["lessons"] < 1:
+            raise CommandError("--students, --teachers, --classrooms and --lessons must be at least 1.")
+
+        counts = seed_school(
+            students=options["students"],
+            teachers=options["teachers"],
+            classrooms=options["classrooms"],
+            lessons=options["lessons"],
+            scores_per_student=options["scores_per_student"],
+            days=options["days"],
+            approvals=options["approvals"],
+            events=options["events"],
+            registrations_per_student=options["registrations_per_student"],
+            student_events_per_student=options["student_events_per_student"],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+        )
+        for model, count in counts.items():
+            self.stdout.write(f"{model}: {count}")
+        self.stdout.write(self.style.SUCCESS("School generated."))
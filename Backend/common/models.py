@@ -0,0 +1,65 @@
+from django.db import models, router
+from django.utils import timezone
+from user.models import User
+
+class QueuedTask(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed")
+    ]
+    # Registered name of the task, see common/tasks.py
+    name = models.CharField(max_length=100, verbose_name="Name")
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    # A task dispatched again with the same key is not queued twice.
+    idempotency_key = models.CharField(max_length=150, unique=True, null=True, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default="pending",
+        verbose_name="Status"
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    # When the current attempt was claimed; a running task older than the lease is reclaimed.
+    started_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="task_status_run_after_idx"),
+            models.Index(fields=["status", "finished_at"], name="task_status_finished_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} {self.pk} ({self.status})"
+
+class ClaimsUser(User):
+    """
+    The requesting user as built from the claims of their access token (see
+    common/authentication.py). Only `id`, `user_type`, `is_staff` and
+    `is_active` are loaded; the first access to any other field loads them all
+    with one query.
+    """
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_claims(cls, user_id, user_type, is_staff):
+        return cls.from_db(
+            router.db_for_read(User),
+            ["id", "user_type", "is_staff", "is_active"],
+            [user_id, user_type, is_staff, True]
+        )
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        deferred = self.get_deferred_fields()
+        if fields is not None and deferred and set(fields) <= deferred:
+            # Load the whole row on first use instead of one query per field.
+            fields = list(deferred)
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
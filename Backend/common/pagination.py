@@ -0,0 +1,242 @@
+"""
+This module provides the pagination shared by every list endpoint.
+
+Classes:
+    - PagePagination: Page-number pagination with a configurable page size and an optional total count.
+    - KeysetPagination: Opaque-cursor pagination on (ordering field, id) that never uses OFFSET.
+
+Functions:
+    - get_paginator: Returns the paginator selected by the `pagination` query parameter.
+
+Query parameters:
+    - pagination: "page" (default) or "cursor".
+    - page: The page number (page mode only).
+    - cursor: The opaque cursor returned as `next` by the previous page (cursor mode only).
+    - page_size: Number of rows per page, capped by settings.PAGINATION_MAX_PAGE_SIZE.
+    - count: "true"/"false" to include the total row count. It costs a COUNT(*) and is
+      on by default in page mode and off by default in cursor mode.
+
+Example:
+    paginator = get_paginator(request)
+    paginated_queryset = paginator.paginate_queryset(queryset, request)
+    serializer = SomeSerializer(paginated_queryset, many=True)
+    return paginator.get_paginated_response(serializer.data)
+"""
+import base64
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Q
+from drf_yasg import openapi
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+PAGINATION_PARAMETERS = [
+    openapi.Parameter("pagination", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Pagination mode (page, cursor)"),
+    openapi.Parameter("page", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description="Page number (page mode)"),
+    openapi.Parameter("cursor", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Cursor of the next page (cursor mode)"),
+    openapi.Parameter("page_size", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description="Number of rows per page"),
+    openapi.Parameter("count", openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN, description="Include the total row count"),
+]
+
+def _page_size(request):
+    page_size = getattr(settings, "PAGINATION_PAGE_SIZE", 10)
+    max_page_size = getattr(settings, "PAGINATION_MAX_PAGE_SIZE", 100)
+    try:
+        requested = int(request.query_params.get("page_size", page_size))
+    except (TypeError, ValueError):
+        return page_size
+    if requested < 1:
+        return page_size
+    return min(requested, max_page_size)
+
+def _wants_count(request, default):
+    value = request.query_params.get("count")
+    if value is None:
+        return default
+    return value.lower() == "true"
+
+class PagePagination(PageNumberPagination):
+    """
+    Page-number pagination. With `count=false` the COUNT(*) is skipped and one
+    extra row is fetched instead to know whether a next page exists.
+    """
+    page_size_query_param = "page_size"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = _page_size(request)
+        self.max_page_size = getattr(settings, "PAGINATION_MAX_PAGE_SIZE", 100)
+        self.with_count = _wants_count(request, default=True)
+        if self.with_count:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        try:
+            self.page_number = max(int(request.query_params.get(self.page_query_param, 1)), 1)
+        except (TypeError, ValueError):
+            raise NotFound("Invalid page.")
+
+        offset = (self.page_number - 1) * self.page_size
+        rows = list(queryset[offset:offset + self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        return rows[:self.page_size]
+
+    def get_paginated_response(self, data):
+        if self.with_count:
+            return super().get_paginated_response(data)
+
+        url = self.request.build_absolute_uri()
+        next_url = replace_query_param(url, self.page_query_param, self.page_number + 1) if self.has_next else None
+        previous_url = None
+        if self.page_number > 1:
+            previous_url = replace_query_param(url, self.page_query_param, self.page_number - 1)
+        return Response({
+            "next": next_url,
+            "previous": previous_url,
+            "results": data,
+        })
+
+def _encode_value(value):
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+def _resolve(model, field):
+    """
+    Returns the model fields along `field` ("date", "reviewed_by", "attending_approval__date"),
+    raising ParseError unless each is a concrete field, following forward relations only.
+    """
+    path = []
+    for part in field.split("__"):
+        try:
+            model_field = model._meta.get_field(part) if model else None
+        except FieldDoesNotExist:
+            model_field = None
+        if model_field is None or not model_field.concrete or model_field.many_to_many:
+            raise ParseError(f"Invalid order field for cursor pagination: {field}")
+        path.append(model_field)
+        model = model_field.related_model
+    return path
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset pagination on (ordering field, id). The position of the last row of
+    a page is encoded into an opaque cursor, and the next page is fetched with
+    a WHERE clause on that position, so deep pages cost as much as the first.
+
+    Rows whose ordering value is NULL come first in ascending order and last in
+    descending order, as on MySQL; a cursor on such a row has a null value.
+    """
+    cursor_query_param = "cursor"
+
+    def __init__(self, ordering=None):
+        self.ordering = ordering
+
+    def _get_ordering(self, queryset):
+        ordering = self.ordering or next(iter(queryset.query.order_by), None)
+        if not isinstance(ordering, str):
+            ordering = "-id"
+        descending = ordering.startswith("-")
+        field = ordering.lstrip("-")
+        if field == "pk":
+            field = "id"
+        return field, descending
+
+    def _decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            position = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            value, row_id = position["v"], position["id"]
+        except (TypeError, ValueError, KeyError):
+            raise NotFound("Invalid cursor.")
+        # Cursors are only produced by _encode_cursor; anything else was forged.
+        if type(row_id) is not int or not isinstance(value, (str, int, float, type(None))):
+            raise NotFound("Invalid cursor.")
+        return value, row_id
+
+    def _encode_cursor(self, value, row_id):
+        position = json.dumps({"v": _encode_value(value), "id": row_id}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = _page_size(request)
+        self.count = queryset.count() if _wants_count(request, default=False) else None
+
+        field, descending = self._get_ordering(queryset)
+        path = _resolve(queryset.model, field)
+        nullable = any(model_field.null for model_field in path)
+        prefix = "-" if descending else ""
+        if field == "id":
+            queryset = queryset.order_by(f"{prefix}id")
+        elif nullable:
+            # Explicit, so that the WHERE clauses below match the order on every database.
+            order = F(field).desc(nulls_last=True) if descending else F(field).asc(nulls_first=True)
+            queryset = queryset.order_by(order, f"{prefix}id")
+        else:
+            queryset = queryset.order_by(f"{prefix}{field}", f"{prefix}id")
+
+        position = self._decode_cursor(request)
+        if position is not None:
+            value, row_id = position
+            lookup = "lt" if descending else "gt"
+            try:
+                if field == "id":
+                    queryset = queryset.filter(**{f"id__{lookup}": row_id})
+                elif value is None:
+                    # NULLs are last when descending, first (before every value) when ascending.
+                    after = Q(**{f"{field}__isnull": True, f"id__{lookup}": row_id})
+                    queryset = queryset.filter(after if descending else after | Q(**{f"{field}__isnull": False}))
+                else:
+                    after = Q(**{f"{field}__{lookup}": value}) | Q(**{field: value, f"id__{lookup}": row_id})
+                    if descending and nullable:
+                        after |= Q(**{f"{field}__isnull": True})
+                    queryset = queryset.filter(after)
+            except (TypeError, ValueError, ValidationError):
+                # A value that does not fit the ordering field.
+                raise NotFound("Invalid cursor.")
+
+        rows = list(queryset[:self.page_size + 1])
+        self.next_cursor = None
+        if len(rows) > self.page_size:
+            rows = rows[:self.page_size]
+            last = rows[-1]
+            value = last
+            for model_field in path:
+                # The column of a relation, so that its row is not loaded.
+                value = getattr(value, model_field.attname if model_field is path[-1] else model_field.name)
+                if value is None:
+                    break
+            self.next_cursor = self._encode_cursor(value, last.pk)
+        return rows
+
+    def get_paginated_response(self, data):
+        next_url = None
+        if self.next_cursor:
+            url = remove_query_param(self.request.build_absolute_uri(), "page")
+            next_url = replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+        body = {"next": next_url, "results": data}
+        if self.count is not None:
+            body = {"count": self.count, **body}
+        return Response(body)
+
+def get_paginator(request, ordering=None):
+    """
+    Returns the paginator selected by the `pagination` query parameter.
+    `ordering` is the keyset ordering used in cursor mode; when omitted the
+    first ordering of the queryset is used, then "-id".
+    """
+    if request.query_params.get("pagination") == "cursor":
+        return KeysetPagination(ordering)
+    return PagePagination()
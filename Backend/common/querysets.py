@@ -0,0 +1,30 @@
+"""
+This module lets serializers declare the relations they read, so list views can load them up front.
+
+Classes:
+    - OptimizedQuerysetMixin: Serializer mixin that applies the declared select_related/prefetch_related.
+
+Usage:
+    Declare the relations on the serializer and build the list queryset through it.
+
+Example:
+    class SomeSerializer(OptimizedQuerysetMixin, serializers.ModelSerializer):
+        select_related_fields = ["owner"]
+        prefetch_related_fields = ["tags"]
+
+    queryset = SomeSerializer.optimize_queryset(Some.objects.all())
+"""
+
+class OptimizedQuerysetMixin:
+    # Foreign keys / one-to-ones the serializer dereferences (joined in the same query).
+    select_related_fields = []
+    # Many-to-many or reverse relations the serializer reads (one extra query each per page).
+    prefetch_related_fields = []
+
+    @classmethod
+    def optimize_queryset(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        return queryset
@@ -0,0 +1,198 @@
+"""
+Reference Data Cache
+====================
+This module keeps small, rarely changing tables (fields, lessons, event types, level thresholds)
+in process memory, so write paths read them without a query.
+
+Classes:
+1. `ReferenceTable` - A registered table: its rows (or a value built from them) and lookup indexes.
+2. `LocalVersionBackend` - Keeps the version counters in process memory.
+3. `CacheVersionBackend` - Keeps the version counters in the Django cache, shared by every worker.
+
+Functions:
+1. `register` - Registers a model and returns its `ReferenceTable`.
+2. `get_backend` - Returns the version backend selected by `settings.REFCACHE_BACKEND`.
+3. `clear` - Drops every table loaded in this process.
+
+Key Features:
+- Every table has a version counter, increased on `post_save`/`post_delete` of its model (and again
+  when the transaction commits). A process reloads its copy when the counter moved.
+- A transaction that changed a table reads it from the database until it commits, without sharing
+  that copy: rows it wrote are not cached for other threads, and are never cached if it rolls back.
+- Copies are also reloaded after `settings.REFCACHE_TTL` seconds, which bounds staleness when the
+  counters are local to each process.
+- At most `settings.REFCACHE_MAX_TABLES` tables are held; the least recently used one is dropped first.
+- `exists` never answers "missing" from the copy alone: a row created by another process before this
+  one saw the change is found in the database.
+
+Example:
+    lessons = register(Lesson)
+    if not lessons.exists(lesson_id):
+        ...
+"""
+
+import time
+import uuid
+from collections import OrderedDict, namedtuple
+from threading import Lock, RLock, local
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.utils.module_loading import import_string
+
+_Snapshot = namedtuple("_Snapshot", ["version", "loaded_at", "value", "indexes"])
+
+class LocalVersionBackend:
+    def __init__(self):
+        self._versions = {}
+        self._lock = Lock()
+        # Counters of different processes are unrelated; users of the raw
+        # numbers (e.g. ETags) add the scope to tell them apart.
+        self.scope = uuid.uuid4().hex
+        # A write in another process does not move these counters.
+        self.shared = False
+
+    def get(self, name):
+        return self._versions.get(name, 0)
+
+    def bump(self, name):
+        with self._lock:
+            self._versions[name] = self._versions.get(name, 0) + 1
+
+class CacheVersionBackend:
+    scope = "shared"
+
+    def __init__(self):
+        self.cache = caches[getattr(settings, "REFCACHE_CACHE", "default")]
+        # A local-memory cache is private to each process, like LocalVersionBackend.
+        self.shared = not isinstance(self.cache, LocMemCache)
+
+    def _key(self, name):
+        return f"refcache:version:{name}"
+
+    def get(self, name):
+        return self.cache.get(self._key(name), 0)
+
+    def bump(self, name):
+        key = self._key(name)
+        # A counter (re)created after an eviction starts from the clock, so it
+        # does not repeat a version handed out before.
+        if self.cache.add(key, time.time_ns(), timeout=None):
+            return
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # Evicted between add and incr.
+            self.cache.set(key, time.time_ns(), timeout=None)
+
+_backend = None
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        path = getattr(settings, "REFCACHE_BACKEND", "common.refcache.LocalVersionBackend")
+        _backend = import_string(path)()
+    return _backend
+
+_lock = RLock()
+_snapshots = OrderedDict()
+_tables = {}
+# (outermost atomic block, names of the tables it changed) of the current thread.
+_changes = local()
+
+def _transaction():
+    """
+    Returns the outermost atomic block of the current thread, None in autocommit mode.
+    """
+    connection = transaction.get_connection()
+    # The blocks a test case wraps every test in stand for autocommit.
+    return next((block for block in connection.atomic_blocks if not getattr(block, "_from_testcase", False)), None)
+
+def _changed_in_transaction(name):
+    current = _transaction()
+    changes = getattr(_changes, "value", None)
+    return current is not None and changes is not None and changes[0] is current and name in changes[1]
+
+class ReferenceTable:
+    def __init__(self, model, loader=None):
+        self.model = model
+        self.name = model._meta.label_lower
+        # The default copy is the list of rows; a loader can build any value from the table instead.
+        self.loader = loader or (lambda: list(model.objects.all()))
+
+    def _snapshot(self):
+        version = get_backend().get(self.name)
+        if _changed_in_transaction(self.name):
+            # Holds rows that are not committed yet: used by this transaction only.
+            return _Snapshot(version, time.monotonic(), self.loader(), {})
+        with _lock:
+            snapshot = _snapshots.get(self.name)
+            ttl = getattr(settings, "REFCACHE_TTL", 300)
+            if snapshot is None or snapshot.version != version or time.monotonic() - snapshot.loaded_at > ttl:
+                snapshot = _Snapshot(version, time.monotonic(), self.loader(), {})
+                _snapshots[self.name] = snapshot
+                while len(_snapshots) > getattr(settings, "REFCACHE_MAX_TABLES", 32):
+                    _snapshots.popitem(last=False)
+            _snapshots.move_to_end(self.name)
+            return snapshot
+
+    def value(self):
+        """
+        Returns the cached copy: the rows, or what the loader built.
+        """
+        return self._snapshot().value
+
+    def index(self, field):
+        """
+        Returns {value of `field`: row} over the cached rows.
+        """
+        snapshot = self._snapshot()
+        if field not in snapshot.indexes:
+            snapshot.indexes[field] = {getattr(row, field): row for row in snapshot.value}
+        return snapshot.indexes[field]
+
+    def exists(self, pk):
+        """
+        Returns whether the row with primary key `pk` exists. A key missing from the cached copy is
+        looked up in the database, since another process may have created it; if found, the copy is reloaded.
+        """
+        if pk in self.index(self.model._meta.pk.attname):
+            return True
+        if not self.model.objects.filter(pk=pk).exists():
+            return False
+        with _lock:
+            _snapshots.pop(self.name, None)
+        return True
+
+    def invalidate(self):
+        current = _transaction()
+        if current is not None:
+            changes = getattr(_changes, "value", None)
+            if changes is None or changes[0] is not current:
+                changes = _changes.value = (current, set())
+            changes[1].add(self.name)
+        get_backend().bump(self.name)
+        # Readers that loaded the old rows before the commit reload once more afterwards.
+        transaction.on_commit(lambda: get_backend().bump(self.name))
+
+def _invalidate(sender, **kwargs):
+    for table in _tables.values():
+        if table.model is sender:
+            table.invalidate()
+
+def register(model, loader=None):
+    """
+    Returns the `ReferenceTable` of `model`, registering it on first call.
+    """
+    table = _tables.get(model._meta.label_lower)
+    if table is None:
+        table = _tables[model._meta.label_lower] = ReferenceTable(model, loader)
+        post_save.connect(_invalidate, sender=model, dispatch_uid=f"refcache-save-{table.name}")
+        post_delete.connect(_invalidate, sender=model, dispatch_uid=f"refcache-delete-{table.name}")
+    return table
+
+def clear():
+    with _lock:
+        _snapshots.clear()
@@ -0,0 +1,295 @@
+"""
+Load-Data Generator
+===================
+This module fills the database with a synthetic school for benchmarks.
+
+Functions:
+1. `seed_school` - Creates users, classrooms, lessons, scores, report cards, attendance history, approvals,
+   events, registrations and gamification events.
+
+Key Features:
+- Every table is written with `bulk_create` in batches, so seeding thousands of students takes seconds.
+- Rows get a per-run prefix, so the generator can run several times against the same database.
+- Generated values come from a seeded `random.Random`, so two runs with the same arguments produce the same shape of data.
+- `bulk_create` sends no signals: the student profiles and attendance reviews the signals would create are written here,
+  point totals and levels are derived from the generated `StudentEvent`s, and report card grades and the attendance
+  rollup are recomputed at the end. The new users, classrooms, lessons and events are added to the search index.
+"""
+
+import random
+import uuid
+from datetime import date, time, timedelta
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+from score.models import Score
+from reportcard.models import ReportCard
+from reportcard.grading import recompute_grades
+from event.models import Event, Registration
+from event import seats
+from present_absent.models import PresentAbsent, AttendanceApproval, AttendanceReview
+from gamification.models import StudentProfile, StudentEvent
+from gamification.levels import levels_for_points
+from gamification.ledger import EVENT_TYPES, get_event_type
+from present_absent import rollup
+from common import refcache, conditional
+from search import indexing
+
+ATTENDANCE_WEIGHTS = {"present": 85, "absent": 10, "excused": 5}
+
+def _ids(model, **lookup):
+    # MySQL does not return primary keys from bulk_create, so rows are read back.
+    return list(model.objects.filter(**lookup).order_by("id").values_list("id", flat=True))
+
+def _school_days(count, end):
+    days = []
+    day = end
+    while len(days) < count:
+        if day.weekday() != 4:  # Friday is off.
+            days.append(day)
+        day -= timedelta(days=1)
+    return sorted(days)
+
+def seed_school(
+    students=1000,
+    teachers=50,
+    classrooms=40,
+    lessons=30,
+    scores_per_student=10,
+    days=60,
+    approvals=500,
+    events=200,
+    registrations_per_student=3,
+    student_events_per_student=20,
+    seed=0,
+    batch_size=2000,
+):
+    """
+    Creates a synthetic school and returns the number of rows written per model.
+    """
+    rng = random.Random(seed)
+    prefix = f"seed{uuid.uuid4().hex[:6]}"
+    # Phone numbers and national codes are unique; the run token keeps them apart between runs.
+    number_base = int(uuid.uuid4().int % 10**4) * 10**5
+    password = make_password("seed-password")
+    today = date.today()
+    counts = {}
+
+    with transaction.atomic():
+        fields = max(1, classrooms // 10)
+        Field.objects.bulk_create([Field(name=f"{prefix} field {index}") for index in range(fields)])
+        field_ids = _ids(Field, name__startswith=prefix)
+
+        def user(index, user_type):
+            number = number_base + index
+            return User(
+                username=f"{prefix}_{user_type}_{index}",
+                password=password,
+                user_type=user_type,
+                phone_number=f"09{number:09d}",
+                national_code=f"{number:010d}",
+            )
+
+        User.objects.bulk_create(
+            [user(index, "teacher") for index in range(teachers)] +
+            [user(teachers + index, "student") for index in range(students)],
+            batch_size=batch_size
+        )
+        teacher_ids = _ids(User, username__startswith=f"{prefix}_teacher_")
+        student_ids = _ids(User, username__startswith=f"{prefix}_student_")
+        counts["users"] = len(teacher_ids) + len(student_ids)
+
+        # Profiles start with the totals of the events generated for them below.
+        event_types = [get_event_type(code) for code in EVENT_TYPES]
+        awarded = {
+            student_id: [rng.choice(event_types) for _ in range(student_events_per_student)]
+            for student_id in student_ids
+        }
+        totals = [sum(event_type.point for event_type in awarded[student_id]) for student_id in student_ids]
+        StudentProfile.objects.bulk_create(
+            [
+                StudentProfile(students_id=student_id, total_point=total, level=level)
+                for student_id, total, level in zip(student_ids, totals, levels_for_points(totals))
+            ],
+            batch_size=batch_size
+        )
+        profile_of = dict(
+            StudentProfile.objects.filter(students_id__in=student_ids).values_list("students_id", "id")
+        )
+        StudentEvent.objects.bulk_create(
+            (
+                StudentEvent(
+                    student_profile_id=profile_of[student_id],
+                    event_type=event_type,
+                    note=EVENT_TYPES[event_type.code]["note"]
+                )
+                for student_id, event_types_awarded in awarded.items()
+                for event_type in event_types_awarded
+            ),
+            batch_size=batch_size
+        )
+        counts["student_profiles"] = len(profile_of)
+        counts["student_events"] = len(student_ids) * student_events_per_student
+
+        ClassRoom.objects.bulk_create(
+            [
+                ClassRoom(name=f"{prefix} class {index}", base=rng.randint(7, 12), field_id=rng.choice(field_ids))
+                for index in range(classrooms)
+            ],
+            batch_size=batch_size
+        )
+        classroom_ids = _ids(ClassRoom, name__startswith=prefix)
+        counts["classrooms"] = len(classroom_ids)
+
+        # Every student sits in one classroom; every classroom has two teachers.
+        classroom_of = {student_id: classroom_ids[index % len(classroom_ids)] for index, student_id in enumerate(student_ids)}
+        ClassRoom.students.through.objects.bulk_create(
+            [ClassRoom.students.through(classroom_id=classroom_id, user_id=student_id) for student_id, classroom_id in classroom_of.items()],
+            batch_size=batch_size
+        )
+        ClassRoom.teachers.through.objects.bulk_create(
+            [
+                ClassRoom.teachers.through(classroom_id=classroom_id, user_id=teacher_id)
+                for classroom_id in classroom_ids
+                for teacher_id in rng.sample(teacher_ids, min(2, len(teacher_ids)))
+            ],
+            batch_size=batch_size
+        )
+
+        Lesson.objects.bulk_create(
+            [Lesson(name=f"{prefix} lesson {index}", teachers_id=rng.choice(teacher_ids)) for index in range(lessons)],
+            batch_size=batch_size
+        )
+        lesson_ids = _ids(Lesson, name__startswith=prefix)
+        counts["lessons"] = len(lesson_ids)
+
+        Score.objects.bulk_create(
+            (
+                Score(
+                    students_id=student_id,
+                    lesson_id=rng.choice(lesson_ids),
+                    classroom_id=classroom_id,
+                    score_value=rng.randint(0, 20)
+                )
+                for student_id, classroom_id in classroom_of.items()
+                for _ in range(scores_per_student)
+            ),
+            batch_size=batch_size
+        )
+        counts["scores"] = len(student_ids) * scores_per_student
+
+        # One report card per student holding all of their scores.
+        last_report_card_id = ReportCard.objects.order_by("-id").values_list("id", flat=True).first() or 0
+        ReportCard.objects.bulk_create(
+            [
+                ReportCard(
+                    user_id=student_id,
+                    class_room_id=classroom_id,
+                    disciplinary_status=rng.choice(ReportCard.DISCPLINARY_STATUS_CHOICES)[0]
+                )
+                for student_id, classroom_id in classroom_of.items()
+            ],
+            batch_size=batch_size
+        )
+        report_card_ids = _ids(ReportCard, id__gt=last_report_card_id)
+        report_card_of = dict(
+            ReportCard.objects.filter(id__in=report_card_ids).values_list("user_id", "id")
+        )
+        ReportCard.scores.through.objects.bulk_create(
+            (
+                ReportCard.scores.through(reportcard_id=report_card_of[student_id], score_id=score_id)
+                for score_id, student_id in Score.objects.filter(
+                    students_id__in=student_ids
+                ).values_list("id", "students_id").iterator(chunk_size=batch_size)
+            ),
+            batch_size=batch_size
+        )
+        counts["report_cards"] = len(report_card_ids)
+
+        statuses = list(ATTENDANCE_WEIGHTS)
+        weights = list(ATTENDANCE_WEIGHTS.values())
+        school_days = _school_days(days, today - timedelta(days=1))
+        PresentAbsent.objects.bulk_create(
+            (
+                PresentAbsent(
+                    user_id=student_id,
+                    classroom_id=classroom_id,
+                    date=day,
+                    status=rng.choices(statuses, weights)[0]
+                )
+                for day in school_days
+                for student_id, classroom_id in classroom_of.items()
+            ),
+            batch_size=batch_size
+        )
+        counts["attendances"] = len(school_days) * len(student_ids)
+
+        approval_students = [rng.choice(student_ids) for _ in range(approvals)]
+        last_approval_id = AttendanceApproval.objects.order_by("-id").values_list("id", flat=True).first() or 0
+        AttendanceApproval.objects.bulk_create(
+            [
+                AttendanceApproval(
+                    teacher_id=rng.choice(teacher_ids),
+                    student_id=student_id,
+                    classroom_id=classroom_of[student_id],
+                    status_requested=rng.choices(statuses, weights)[0],
+                    date=today + timedelta(days=rng.randint(0, 30))
+                )
+                for student_id in approval_students
+            ],
+            batch_size=batch_size
+        )
+        AttendanceReview.objects.bulk_create(
+            [AttendanceReview(attending_approval_id=approval_id) for approval_id in _ids(AttendanceApproval, id__gt=last_approval_id)],
+            batch_size=batch_size
+        )
+        counts["approvals"] = approvals
+
+        # Eight slots a day from 8:00, starting after the latest existing event.
+        latest = Event.objects.order_by("-date").values_list("date", flat=True).first()
+        first_day = max(today, latest + timedelta(days=1)) if latest else today
+        Event.objects.bulk_create(
+            [
+                Event(
+                    name=f"{prefix} event {index}",
+                    description="Generated event",
+                    date=first_day + timedelta(days=index // 8),
+                    time=time(8 + index % 8, 0)
+                )
+                for index in range(events)
+            ],
+            batch_size=batch_size
+        )
+        event_ids = _ids(Event, name__startswith=prefix)
+        counts["events"] = len(event_ids)
+
+        Registration.objects.bulk_create(
+            (
+                Registration(user_id=student_id, event_id=event_id)
+                for student_id in student_ids
+                for event_id in rng.sample(event_ids, min(registrations_per_student, len(event_ids)))
+            ),
+            batch_size=batch_size
+        )
+        counts["registrations"] = len(student_ids) * min(registrations_per_student, len(event_ids))
+        # Seats taken by the bulk inserted registrations.
+        seats.recount(event_ids)
+
+    recompute_grades(report_card_ids, batch_size=batch_size)
+    rollup.rebuild()
+    # bulk_create sends no post_save either for the caches kept on versions.
+    for model in (Field, Lesson):
+        refcache.register(model).invalidate()
+    for model in (User, ClassRoom, Event, Registration):
+        conditional.bump(model)
+    for kind, ids in (
+        ("user", teacher_ids + student_ids),
+        ("classroom", classroom_ids),
+        ("lesson", lesson_ids),
+        ("event", event_ids),
+    ):
+        indexing.index(kind, ids, batch_size=batch_size)
+    return counts
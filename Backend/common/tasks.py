@@ -0,0 +1,290 @@
+"""
+Task Queue
+==========
+This module runs the side-effects of a request (points, reviews, profiles, PDFs) outside of it.
+
+Functions:
+1. `task` - Decorator registering a function as a task; the task gets a `dispatch` method.
+2. `dispatch` - Queues a registered task by name.
+3. `run_task` - Runs a queued task once, recording its outcome or scheduling its retry.
+4. `reclaim_expired` - Queues again the tasks whose worker died while running them.
+5. `run_pending` - Runs the queued tasks that are due (used by the `run_tasks` worker).
+6. `purge_finished` - Deletes the done and failed tasks finished before a date (used by `purge_tasks`).
+7. `get_backend` - Returns the backend selected by `settings.TASKS_BACKEND`.
+
+Backends (`settings.TASKS_BACKEND`):
+- "sync": Runs the task right away in the caller and raises its errors. Meant for tests and scripts.
+- "thread": Queues the task once the transaction commits and runs it in a pool of
+  `settings.TASKS_THREAD_WORKERS` threads of the web process.
+- "database": Writes the task in the caller's transaction; `python manage.py run_tasks` runs it.
+
+Key Features:
+- Arguments are stored as JSON, so tasks take ids rather than model instances.
+- A task dispatched again with the same `idempotency_key` is not queued twice.
+- Failed tasks are retried up to `max_attempts` times, waiting `retry_delay` seconds doubled on every attempt.
+- A task is claimed with a conditional UPDATE, so two workers never run the same row.
+- A task runs in one transaction with the UPDATE marking it done, so a worker dying in between leaves
+  no effect behind and the task is run again as a whole.
+- A claim is a lease of `settings.TASKS_LEASE_TIMEOUT` seconds: a task still "running" after it, because
+  its process died, is queued again by `run_pending` (or failed if it has no attempt left). A task
+  outliving its lease has its transaction rolled back, so the lease must be longer than the slowest task.
+- Done and failed rows are deleted after `settings.TASKS_RETENTION_DAYS` days by `python manage.py purge_tasks`.
+
+Example:
+    @task(name="gamification.award_points")
+    def award_points_task(student_ids, code):
+        ...
+
+    award_points_task.dispatch([student.id], "score_20", idempotency_key=f"score_20:{score.id}")
+"""
+
+import json
+import logging
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from common.models import QueuedTask
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+
+class LeaseLost(Exception):
+    """
+    Raised inside a task's transaction when its lease expired and the row was claimed again.
+    """
+
+class Task:
+    def __init__(self, func, name, max_attempts, retry_delay, atomic):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.atomic = atomic
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def dispatch(self, *args, idempotency_key=None, **kwargs):
+        """
+        Queues a call of the task with the current backend.
+        """
+        # Round trip through JSON so every backend gets the values a queued row would give back.
+        args, kwargs = json.loads(json.dumps([args, kwargs]))
+        get_backend().enqueue(self, args, kwargs, idempotency_key)
+
+def task(name=None, max_attempts=3, retry_delay=5, atomic=True):
+    """
+    Registers the decorated function as a task under `name` (its dotted path by default).
+
+    With `atomic` (the default) the task runs in one transaction with the update marking
+    it done, so its writes are committed exactly once. A task writing progress that must
+    be visible while it runs passes `atomic=False` and has to be safe to run again.
+    """
+    def decorator(func):
+        task_name = name or f"{func.__module__}.{func.__name__}"
+        _registry[task_name] = Task(func, task_name, max_attempts, retry_delay, atomic)
+        return _registry[task_name]
+    return decorator
+
+def dispatch(name, *args, idempotency_key=None, **kwargs):
+    if name not in _registry:
+        raise LookupError(f"Unknown task: {name}")
+    _registry[name].dispatch(*args, idempotency_key=idempotency_key, **kwargs)
+
+def _queue(task, args, kwargs, idempotency_key, **fields):
+    """
+    Inserts the row of a task; returns None if `idempotency_key` was queued before.
+    """
+    try:
+        with transaction.atomic():
+            return QueuedTask.objects.create(
+                name=task.name,
+                args=args,
+                kwargs=kwargs,
+                idempotency_key=idempotency_key,
+                max_attempts=task.max_attempts,
+                **fields
+            )
+    except IntegrityError:
+        if idempotency_key is None:
+            raise
+        return None
+
+def run_task(task_id):
+    """
+    Runs the queued task `task_id` if it is pending and due.
+
+    Returns:
+        float: Seconds until the task is retried, or None if it finished, failed
+        for good, or was not claimed.
+    """
+    now = timezone.now()
+    claimed = QueuedTask.objects.filter(pk=task_id, status="pending", run_after__lte=now).update(
+        status="running",
+        attempts=F("attempts") + 1,
+        started_at=now
+    )
+    if not claimed:
+        return None
+
+    row = QueuedTask.objects.get(pk=task_id)
+    task = _registry.get(row.name)
+    # Only the worker holding the lease may record the outcome: once it expired,
+    # `reclaim_expired` may have handed the row to another worker.
+    leased = QueuedTask.objects.filter(pk=task_id, status="running", started_at=now)
+    try:
+        if task is None:
+            raise LookupError(f"Unknown task: {row.name}")
+        with transaction.atomic() if task.atomic else nullcontext():
+            task.func(*row.args, **row.kwargs)
+            if not leased.update(status="done", error="", finished_at=timezone.now()):
+                raise LeaseLost()
+    except LeaseLost:
+        logger.warning("Task %s (%s) outlived its lease; its result was discarded.", row.name, task_id)
+        return None
+    except Exception as error:
+        if task is not None and row.attempts < row.max_attempts:
+            delay = task.retry_delay * 2 ** (row.attempts - 1)
+            leased.update(
+                status="pending",
+                run_after=now + timedelta(seconds=delay),
+                error=repr(error)
+            )
+            return delay
+        logger.exception("Task %s (%s) failed after %s attempts.", row.name, task_id, row.attempts)
+        leased.update(status="failed", error=repr(error), finished_at=timezone.now())
+        return None
+    return None
+
+def reclaim_expired():
+    """
+    Queues again the tasks whose lease expired while running, failing those without attempts left.
+
+    Returns:
+        int: The number of tasks reclaimed.
+    """
+    now = timezone.now()
+    expired = QueuedTask.objects.filter(
+        status="running",
+        started_at__lt=now - timedelta(seconds=getattr(settings, "TASKS_LEASE_TIMEOUT", 1800))
+    )
+    error = "The worker running the task stopped before it finished."
+    failed = expired.filter(attempts__gte=F("max_attempts")).update(status="failed", error=error, finished_at=now)
+    requeued = expired.update(status="pending", run_after=now, error=error)
+    if failed or requeued:
+        logger.warning("Reclaimed %s expired task(s), %s of them failed for good.", failed + requeued, failed)
+    return failed + requeued
+
+def purge_finished(before, batch_size=1000):
+    """
+    Deletes the done and failed tasks finished before `before`, `batch_size` rows per statement.
+
+    Returns:
+        int: The number of tasks deleted.
+    """
+    deleted = 0
+    while True:
+        task_ids = list(QueuedTask.objects.filter(
+            status__in=["done", "failed"],
+            finished_at__lt=before
+        ).values_list("id", flat=True)[:batch_size])
+        if not task_ids:
+            return deleted
+        deleted += QueuedTask.objects.filter(id__in=task_ids).delete()[0]
+
+def run_pending(limit=100):
+    """
+    Runs up to `limit` due tasks, oldest first, and returns how many were picked.
+    """
+    reclaim_expired()
+    task_ids = list(QueuedTask.objects.filter(
+        status="pending",
+        run_after__lte=timezone.now()
+    ).order_by("run_after", "id").values_list("id", flat=True)[:limit])
+    for task_id in task_ids:
+        run_task(task_id)
+    return len(task_ids)
+
+class SyncBackend:
+    """
+    Runs tasks immediately, without retries. A keyed task is recorded as done
+    so it still runs only once.
+    """
+    def enqueue(self, task, args, kwargs, idempotency_key):
+        if idempotency_key is not None:
+            row = _queue(task, args, kwargs, idempotency_key, status="done", attempts=1, finished_at=timezone.now())
+            if row is None:
+                return
+        task.func(*args, **kwargs)
+
+class ThreadBackend:
+    """
+    Queues tasks once the transaction commits and runs them in a thread pool.
+    The rows stay in the database, so a `run_tasks` worker can pick up what a
+    restarted process did not run.
+    """
+    def __init__(self):
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _submit(self, task_id, delay=0):
+        if delay:
+            timer = threading.Timer(delay, self._submit, args=(task_id,))
+            timer.daemon = True
+            timer.start()
+            return
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "TASKS_THREAD_WORKERS", 4),
+                    thread_name_prefix="tasks"
+                )
+        self._executor.submit(self._run, task_id)
+
+    def _run(self, task_id):
+        delay = None
+        try:
+            delay = run_task(task_id)
+        except Exception:
+            logger.exception("Task %s could not be run.", task_id)
+        finally:
+            connection.close()
+        if delay:
+            self._submit(task_id, delay)
+
+    def enqueue(self, task, args, kwargs, idempotency_key):
+        def queue():
+            row = _queue(task, args, kwargs, idempotency_key)
+            if row is not None:
+                self._submit(row.pk)
+        transaction.on_commit(queue, robust=True)
+
+class DatabaseBackend:
+    """
+    Writes tasks in the caller's transaction: they become visible to the
+    `run_tasks` worker when it commits, and are dropped if it rolls back.
+    """
+    def enqueue(self, task, args, kwargs, idempotency_key):
+        _queue(task, args, kwargs, idempotency_key)
+
+BACKENDS = {
+    "sync": SyncBackend,
+    "thread": ThreadBackend,
+    "database": DatabaseBackend,
+}
+_backends = {}
+
+def get_backend():
+    name = getattr(settings, "TASKS_BACKEND", "thread")
+    if name not in _backends:
+        if name not in BACKENDS:
+            raise ImproperlyConfigured(f"TASKS_BACKEND must be one of: {', '.join(BACKENDS)}.")
+        _backends[name] = BACKENDS[name]()
+    return _backends[name]
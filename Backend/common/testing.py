@@ -0,0 +1,40 @@
+"""
+This module provides test helpers shared by the app test suites.
+
+Functions:
+    - assert_constant_queries: Asserts that a list endpoint runs the same number of queries
+      whatever the page size, which catches N+1 regressions in serializers.
+
+Example:
+    def test_list_has_no_n_plus_one(self):
+        assert_constant_queries(client, "/classroom/")
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+def assert_constant_queries(client, url, params=None, page_sizes=(1, 10), expected=None):
+    """
+    Requests `url` once per page size and asserts every request ran the same number of queries.
+
+    Args:
+        client: An authenticated APIClient.
+        url (str): The list endpoint to request.
+        params (dict): Extra query parameters.
+        page_sizes (tuple): The page sizes to compare; the data should fill the largest one.
+        expected (int): If given, the exact number of queries every request must run.
+
+    Returns:
+        int: The number of queries per request.
+    """
+    counts = {}
+    for page_size in page_sizes:
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url, {**(params or {}), "page_size": page_size})
+        assert response.status_code == 200, response.data
+        counts[page_size] = len(context.captured_queries)
+
+    assert len(set(counts.values())) == 1, f"Query count depends on page size: {counts}"
+    count = counts[page_sizes[0]]
+    if expected is not None:
+        assert count == expected, f"Expected {expected} queries, got {count}"
+    return count
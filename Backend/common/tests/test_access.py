@@ -0,0 +1,69 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+from common.access import get_access
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestAccessContext:
+    def setup_method(self):
+        self.teacher = create_user("test_teacher1", "teacher", 1)
+        self.student = create_user("test_student1", "student", 2)
+        self.classroom = ClassRoom.objects.create(name="10-A", base=10, field=Field.objects.create(name="Math"))
+        self.classroom.students.add(self.student)
+        self.classroom.teachers.add(self.teacher)
+        self.lesson = Lesson.objects.create(name="Algebra", teachers=self.teacher)
+
+    def test_memberships_are_loaded_once_per_request(self, django_assert_num_queries):
+        # Arrange
+        request = APIRequestFactory().get("/")
+        request.user = self.teacher
+
+        # Act
+        with django_assert_num_queries(3):
+            for _ in range(3):
+                access = get_access(request)
+                taught = self.classroom.id in access.taught_classroom_ids
+                teaches_lesson = self.lesson.id in access.lesson_ids
+                has_student = self.student.id in access.classroom_student_ids(self.classroom.id)
+
+        # Assert
+        assert (taught, teaches_lesson, has_student) == (True, True, True)
+        assert access.can_manage and not access.is_admin
+        assert get_access(request) is access
+
+    def test_context_follows_user_change(self):
+        # Arrange
+        request = APIRequestFactory().get("/")
+        request.user = AnonymousUser()
+        anonymous = get_access(request)
+
+        # Act
+        request.user = self.student
+        access = get_access(request)
+
+        # Assert
+        assert not anonymous.is_authenticated and anonymous.enrolled_classrooms == {}
+        assert access.is_student
+        assert access.enrolled_classrooms == {self.classroom.id: self.classroom.field_id}
+
+    def test_if_anonymous_calls_admin_view_return_401(self):
+        # Act
+        response = APIClient().post("/gamification/student-profile/", {})
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
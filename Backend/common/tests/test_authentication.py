@@ -0,0 +1,80 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from user.models import User
+from common.models import ClaimsUser
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestClaimsJWTAuthentication:
+    def setup_method(self):
+        self.student = create_user("test_student1", "student", 1)
+        self.client = APIClient()
+        response = self.client.post("/api/token/", {"username": "test_student1", "password": "string1234"})
+        self.access = response.data["access"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"JWT {self.access}")
+
+    def test_token_carries_role_claims(self):
+        # Act
+        token = AccessToken(self.access)
+
+        # Assert
+        assert (token["user_type"], token["is_staff"]) == ("student", False)
+
+    def test_if_state_is_cached_user_row_is_not_loaded(self):
+        # Arrange
+        self.client.get("/gamification/leaderboard/me/")
+
+        # Act
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get("/gamification/leaderboard/me/")
+
+        # Assert
+        assert response.status_code != status.HTTP_401_UNAUTHORIZED
+        assert not any('FROM "user_user"' in query["sql"] for query in captured)
+
+    def test_if_user_is_deactivated_return_401(self):
+        # Arrange
+        self.client.get("/gamification/leaderboard/me/")
+        self.student.is_active = False
+        self.student.save()
+
+        # Act
+        response = self.client.get("/gamification/leaderboard/me/")
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_if_role_changed_return_401(self):
+        # Arrange
+        self.student.user_type = "teacher"
+        self.student.save()
+
+        # Act
+        response = self.client.get("/gamification/leaderboard/me/")
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_other_fields_are_loaded_with_one_query(self, django_assert_num_queries):
+        # Arrange
+        user = ClaimsUser.from_claims(self.student.id, "student", False)
+
+        # Act
+        with django_assert_num_queries(1):
+            values = (user.username, user.email, user.national_code)
+
+        # Assert
+        assert values == ("test_student1", "test_student1@domain.com", "0960030001")
@@ -0,0 +1,61 @@
+import json
+import pytest
+from io import StringIO
+from datetime import date, time, timedelta
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from user.models import User
+from score.models import Score
+from reportcard.models import ReportCard
+from gamification.models import StudentProfile, StudentEvent
+from event.models import Event
+
+@pytest.mark.django_db
+class TestSeedSchoolCommand:
+    def test_if_school_is_generated_totals_match_the_events(self):
+        # Act
+        call_command(
+            "seed_school", "--students", "40", "--teachers", "4", "--classrooms", "4",
+            "--lessons", "5", "--days", "5", "--events", "20", stdout=StringIO()
+        )
+
+        # Assert
+        assert User.objects.filter(user_type="student").count() == 40
+        assert StudentEvent.objects.count() == 40 * 20
+        assert Score.objects.count() == 40 * 10
+        assert ReportCard.objects.exclude(grade=None).count() == 40
+        stdout = StringIO()
+        call_command("reconcile_points", "--dry-run", stdout=stdout)
+        assert StudentProfile.objects.filter(total_point__gt=0).count() == 40
+        assert "0 profile(s) drifted." in stdout.getvalue()
+
+@pytest.mark.django_db
+class TestBenchmarkApiCommand:
+    def test_if_seeded_every_endpoint_succeeds_and_nothing_is_kept(self, settings):
+        # Arrange
+        # As deployed: the test client's "testserver" host is not allowed.
+        settings.ALLOWED_HOSTS = []
+        call_command("seed_school", "--students", "30", "--classrooms", "3", "--days", "3", "--events", "10", stdout=StringIO())
+        score_count = Score.objects.count()
+        stdout = StringIO()
+
+        # Act
+        call_command("benchmark_api", "--iterations", "2", "--warmup", "0", stdout=stdout, stderr=StringIO())
+
+        # Assert
+        report = json.loads(stdout.getvalue())
+        assert {result["name"]: result["statuses"] for result in report["results"] if max(result["statuses"]) >= 300} == {}
+        assert all(result["queries_max"] >= result["queries"] >= 0 for result in report["results"])
+        assert Score.objects.count() == score_count
+
+    def test_if_a_scenario_fails_the_command_fails(self):
+        # Arrange
+        call_command("seed_school", "--students", "30", "--classrooms", "3", "--days", "3", "--events", "10", stdout=StringIO())
+        # Takes the date and time slot the event_create scenario asks for, so it is answered with a 400.
+        Event.objects.create(name="Taken", description="Taken", date=date.today() + timedelta(days=3650), time=time(23, 59))
+        stdout = StringIO()
+
+        # Act / Assert
+        with pytest.raises(CommandError, match="event_create \\(400\\)"):
+            call_command("benchmark_api", "--iterations", "1", "--warmup", "0", "--only", "event_create", stdout=stdout, stderr=StringIO())
+        assert stdout.getvalue() == ""
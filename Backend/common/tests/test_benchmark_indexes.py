@@ -0,0 +1,43 @@
+import json
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from present_absent.models import PresentAbsent
+from gamification.models import StudentProfile
+
+@pytest.mark.django_db
+class TestBenchmarkIndexesCommand:
+    def test_if_seeded_report_covers_every_hot_path(self):
+        # Arrange
+        stdout = StringIO()
+
+        # Act
+        call_command(
+            "benchmark_indexes", "--seed", "--students", "60", "--repeat", "2",
+            stdout=stdout, stderr=StringIO()
+        )
+
+        # Assert
+        report = json.loads(stdout.getvalue())
+        assert [result["name"] for result in report["results"]] == [
+            "attendance_duplicate_check",
+            "attendance_classroom_day",
+            "score_student_lesson",
+            "approval_date_status",
+            "registration_count_per_user",
+            "event_slot_check",
+            "top_students",
+        ]
+        assert all(result["plan"] for result in report["results"])
+        assert report["rows"]["StudentProfile"] == StudentProfile.objects.count() == 60
+        assert report["rows"]["PresentAbsent"] == PresentAbsent.objects.count()
+
+    def test_if_database_is_empty_report_has_no_results(self):
+        # Arrange
+        stdout = StringIO()
+
+        # Act
+        call_command("benchmark_indexes", "--repeat", "2", stdout=stdout)
+
+        # Assert
+        assert json.loads(stdout.getvalue())["results"] == []
@@ -0,0 +1,113 @@
+import pytest
+from types import SimpleNamespace
+from datetime import date, time
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from event.models import Event
+from common import conditional
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    @pytest.fixture(autouse=True)
+    def clock(self, monkeypatch):
+        # The tests run with the per-process version counters, whose ETags hold a time bucket.
+        self.now = 1_000_000.0
+        monkeypatch.setattr(conditional, "time", SimpleNamespace(time=lambda: self.now))
+
+    def setup_method(self):
+        self.admin = create_user("test_admin1", "admin", 1)
+        self.student = create_user("test_student1", "student", 2)
+        Event.objects.create(name="Science fair", description="Yearly fair", date=date(2030, 1, 1), time=time(9, 0))
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_if_etag_matches_return_304_without_queries(self, django_assert_num_queries):
+        # Arrange
+        first = self.client.get("/event/")
+
+        # Act
+        with django_assert_num_queries(0):
+            response = self.client.get("/event/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        # Assert
+        assert first.status_code == status.HTTP_200_OK
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == first["ETag"]
+        assert "private" in response["Cache-Control"] and "must-revalidate" in response["Cache-Control"]
+
+    def test_if_rows_changed_return_200(self):
+        # Arrange
+        first = self.client.get("/event/")
+
+        # Act
+        Event.objects.create(name="Book day", description="Books", date=date(2030, 2, 1), time=time(9, 0))
+        response = self.client.get("/event/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != first["ETag"]
+        assert response.data["count"] == 2
+
+    def test_etag_depends_on_query_and_user(self):
+        # Act
+        admin_etag = self.client.get("/event/")["ETag"]
+        filtered_etag = self.client.get("/event/", {"search": "fair"})["ETag"]
+        self.client.force_authenticate(user=self.student)
+        student_etag = self.client.get("/event/")["ETag"]
+
+        # Assert
+        assert len({admin_etag, filtered_etag, student_etag}) == 3
+
+    def test_classroom_membership_change_updates_etag_and_updated_at(self):
+        # Arrange
+        classroom = ClassRoom.objects.create(name="10-A", base=10, field=Field.objects.create(name="Math"))
+        updated_at = classroom.updated_at
+        first = self.client.get("/classroom/")
+
+        # Act
+        classroom.students.add(self.student)
+        response = self.client.get("/classroom/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        classroom.refresh_from_db()
+        assert classroom.updated_at > updated_at
+
+    def test_if_counters_are_local_etag_expires(self, settings):
+        # Arrange
+        settings.CONDITIONAL_LOCAL_TTL = 5
+        first = self.client.get("/event/")
+
+        # Act
+        # A write made by another worker does not move this process's counters.
+        self.now += 5
+        response = self.client.get("/event/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != first["ETag"]
+
+    def test_if_user_unauthenticated_return_401_without_etag(self, django_assert_num_queries):
+        # Arrange
+        client = APIClient()
+
+        # Act
+        with django_assert_num_queries(0):
+            response = client.get("/users/", HTTP_IF_NONE_MATCH="*")
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert not response.has_header("ETag")
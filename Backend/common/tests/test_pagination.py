@@ -0,0 +1,108 @@
+import base64
+import json
+import pytest
+from urllib.parse import urlparse, parse_qs
+from datetime import date, time, timedelta
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework.request import Request
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework import status
+from user.models import User
+from event.models import Event
+from common.pagination import KeysetPagination
+
+@pytest.mark.django_db
+class TestListPagination:
+    def setup_method(self):
+        user = User.objects.create_user(
+            username="test_student1",
+            password="string1234",
+            email="student@domain.com",
+            phone_number="09309500001",
+            national_code="0960030001",
+            user_type="student"
+        )
+        for index in range(25):
+            Event.objects.create(
+                name=f"event {index}",
+                description="description",
+                date=date.today() + timedelta(days=index % 5),
+                time=time(8 + index // 5, 0)
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(user=user)
+
+    def test_page_mode_without_count_return_200(self):
+        # Act
+        response = self.client.get("/event/", {"count": "false", "page_size": 20})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        assert len(response.data["results"]) == 20
+        assert response.data["next"] is not None
+
+    def test_cursor_mode_walks_every_row_once(self):
+        # Act
+        names = []
+        params = {"pagination": "cursor", "page_size": 7}
+        while True:
+            response = self.client.get("/event/", params)
+            assert response.status_code == status.HTTP_200_OK
+            names += [row["name"] for row in response.data["results"]]
+            if not response.data["next"]:
+                break
+            params["cursor"] = parse_qs(urlparse(response.data["next"]).query)["cursor"][0]
+
+        # Assert
+        assert sorted(names) == sorted(f"event {index}" for index in range(25))
+
+    @pytest.mark.parametrize("position", [{"v": 1, "id": "x"}, {"v": [1], "id": 1}, {"v": "x", "id": 1}, [1, 2]])
+    def test_forged_cursor_is_rejected(self, position):
+        # Arrange
+        cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+        request = Request(APIRequestFactory().get("/event/", {"cursor": cursor}))
+
+        # Act / Assert
+        with pytest.raises(NotFound):
+            KeysetPagination(ordering="date").paginate_queryset(Event.objects.all(), request)
+
+    def test_invalid_cursor_return_404(self):
+        # Act
+        response = self.client.get("/event/", {"pagination": "cursor", "cursor": "not-a-cursor"})
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize("ordering", ["max_seats", "-max_seats"])
+    def test_cursor_mode_walks_rows_with_null_ordering_values(self, ordering):
+        # Arrange
+        event_ids = list(Event.objects.order_by("id").values_list("id", flat=True))
+        Event.objects.filter(id__in=event_ids[:10:2]).update(max_seats=30)
+        Event.objects.filter(id__in=event_ids[1:10:2]).update(max_seats=40)
+        paginator = KeysetPagination(ordering=ordering)
+        params = {"page_size": 4}
+
+        # Act
+        ids = []
+        while True:
+            request = Request(APIRequestFactory().get("/event/", params))
+            ids += [event.id for event in paginator.paginate_queryset(Event.objects.all(), request)]
+            if not paginator.next_cursor:
+                break
+            params["cursor"] = paginator.next_cursor
+
+        # Assert
+        assert sorted(ids) == sorted(Event.objects.values_list("id", flat=True))
+        seats = [Event.objects.get(id=event_id).max_seats for event_id in ids]
+        expected = [None] * 15 + [30] * 5 + [40] * 5
+        assert seats == (expected if ordering == "max_seats" else expected[::-1])
+
+    @pytest.mark.parametrize("order_by", ["?", "registrations", "name__length"])
+    def test_cursor_mode_rejects_non_field_ordering(self, order_by):
+        # Arrange
+        request = Request(APIRequestFactory().get("/event/"))
+
+        # Act / Assert
+        with pytest.raises(ParseError):
+            KeysetPagination(ordering=order_by).paginate_queryset(Event.objects.all(), request)
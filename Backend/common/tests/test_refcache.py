@@ -0,0 +1,71 @@
+import pytest
+from field.models import Field
+from gamification.models import EventType
+from common import refcache
+
+@pytest.mark.django_db
+class TestReferenceCache:
+    def setup_method(self):
+        self.fields = refcache.register(Field)
+        self.math = Field.objects.create(name="Math")
+
+    def test_rows_are_cached_until_changed(self, django_assert_num_queries):
+        # Arrange
+        self.fields.value()
+
+        # Act / Assert
+        with django_assert_num_queries(0):
+            assert self.math.id in self.fields.index("id")
+
+        Field.objects.create(name="Physics")
+        with django_assert_num_queries(1):
+            assert sorted(self.fields.index("name")) == ["Math", "Physics"]
+
+    def test_version_bumped_by_another_worker_reloads_table(self, monkeypatch, django_assert_num_queries):
+        # Arrange
+        monkeypatch.setattr(refcache, "_backend", refcache.CacheVersionBackend())
+        self.fields.value()
+        other_worker = refcache.CacheVersionBackend()
+
+        # Act
+        Field.objects.filter(pk=self.math.pk).update(name="Mathematics")
+        other_worker.bump(self.fields.name)
+
+        # Assert
+        with django_assert_num_queries(1):
+            assert self.fields.index("id")[self.math.id].name == "Mathematics"
+
+    def test_row_created_by_another_worker_is_found_and_reloads_table(self, django_assert_num_queries):
+        # Arrange
+        self.fields.value()
+        # bulk_create sends no signal, as if the row was created in another process.
+        physics = Field.objects.bulk_create([Field(name="Physics")])[0]
+
+        # Act / Assert
+        with django_assert_num_queries(2):
+            assert self.fields.exists(physics.id)
+            assert physics.id in self.fields.index("id")
+        with django_assert_num_queries(1):
+            assert not self.fields.exists(physics.id + 1)
+
+    def test_least_recently_used_table_is_dropped(self, settings, django_assert_num_queries):
+        # Arrange
+        settings.REFCACHE_MAX_TABLES = 1
+        event_types = refcache.register(EventType)
+        self.fields.value()
+
+        # Act
+        event_types.value()
+
+        # Assert
+        with django_assert_num_queries(1):
+            self.fields.value()
+
+    def test_if_ttl_expired_table_is_reloaded(self, settings, django_assert_num_queries):
+        # Arrange
+        settings.REFCACHE_TTL = 0
+        self.fields.value()
+
+        # Act / Assert
+        with django_assert_num_queries(1):
+            self.fields.value()
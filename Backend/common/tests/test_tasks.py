@@ -0,0 +1,163 @@
+import pytest
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.utils import timezone
+from common.models import QueuedTask
+from common.tasks import task, run_task
+from user.models import User
+from gamification.models import StudentProfile
+from field.models import Field
+
+calls = []
+
+@task(name="tests.record_call")
+def record_call(value):
+    calls.append(value)
+
+@task(name="tests.fail_once", max_attempts=2, retry_delay=30)
+def fail_once(value):
+    if value not in calls:
+        calls.append(value)
+        raise RuntimeError("first attempt fails")
+
+@task(name="tests.lose_lease")
+def lose_lease(value):
+    Field.objects.create(name=value)
+    # Stands for another worker reclaiming the row while this one still runs it.
+    QueuedTask.objects.filter(name="tests.lose_lease").update(status="pending", started_at=None)
+
+@pytest.mark.django_db
+class TestTasks:
+    def setup_method(self):
+        calls.clear()
+
+    def test_if_database_backend_queues_keyed_task_once(self, settings):
+        # Arrange
+        settings.TASKS_BACKEND = "database"
+
+        # Act
+        record_call.dispatch(1, idempotency_key="record:1")
+        record_call.dispatch(1, idempotency_key="record:1")
+        call_command("run_tasks", "--once", stderr=StringIO())
+
+        # Assert
+        assert calls == [1]
+        assert QueuedTask.objects.get().status == "done"
+
+    def test_if_task_fails_it_is_retried_with_backoff(self, settings):
+        # Arrange
+        settings.TASKS_BACKEND = "database"
+        fail_once.dispatch("a")
+        queued = QueuedTask.objects.get()
+
+        # Act
+        delay = run_task(queued.id)
+        queued.refresh_from_db()
+        not_due = run_task(queued.id)
+        QueuedTask.objects.filter(pk=queued.id).update(run_after=timezone.now() - timedelta(seconds=1))
+        run_task(queued.id)
+
+        # Assert
+        assert (delay, not_due) == (30, None)
+        assert queued.status == "pending" and "first attempt fails" in queued.error
+        queued.refresh_from_db()
+        assert (queued.status, queued.attempts, queued.error) == ("done", 2, "")
+
+    def test_if_attempts_run_out_task_is_failed(self, settings):
+        # Arrange
+        settings.TASKS_BACKEND = "database"
+        fail_once.dispatch("b")
+        QueuedTask.objects.update(max_attempts=1)
+
+        # Act
+        delay = run_task(QueuedTask.objects.get().id)
+
+        # Assert
+        assert delay is None
+        assert QueuedTask.objects.get().status == "failed"
+
+    def test_if_worker_died_running_task_its_lease_is_reclaimed(self, settings):
+        # Arrange
+        settings.TASKS_BACKEND = "database"
+        settings.TASKS_LEASE_TIMEOUT = 60
+        record_call.dispatch(3)
+        fail_once.dispatch("c")
+        started_at = timezone.now() - timedelta(seconds=61)
+        QueuedTask.objects.update(status="running", attempts=1, started_at=started_at)
+        QueuedTask.objects.filter(name="tests.fail_once").update(max_attempts=1)
+        record_call.dispatch(4)
+        QueuedTask.objects.filter(args=[4]).update(status="running", attempts=1, started_at=timezone.now())
+
+        # Act
+        call_command("run_tasks", "--once", stderr=StringIO())
+
+        # Assert
+        assert calls == [3]
+        statuses = dict(QueuedTask.objects.values_list("name", "status").exclude(args=[4]))
+        assert statuses == {"tests.record_call": "done", "tests.fail_once": "failed"}
+        assert QueuedTask.objects.get(args=[4]).status == "running"
+
+    def test_if_lease_was_lost_task_effects_are_rolled_back(self, settings):
+        # Arrange
+        settings.TASKS_BACKEND = "database"
+        lose_lease.dispatch("Physics")
+
+        # Act
+        run_task(QueuedTask.objects.get().id)
+
+        # Assert
+        assert not Field.objects.filter(name="Physics").exists()
+        assert QueuedTask.objects.get().status != "done"
+
+    def test_purge_tasks_deletes_finished_tasks_past_retention(self, settings):
+        # Arrange
+        settings.TASKS_BACKEND = "database"
+        for value in range(4):
+            record_call.dispatch(value)
+        call_command("run_tasks", "--once", stderr=StringIO())
+        old, recent, failed, pending = QueuedTask.objects.order_by("id")
+        QueuedTask.objects.filter(id__in=[old.id, failed.id]).update(finished_at=timezone.now() - timedelta(days=31))
+        QueuedTask.objects.filter(id=failed.id).update(status="failed")
+        QueuedTask.objects.filter(id=pending.id).update(status="pending", finished_at=None)
+
+        # Act
+        call_command("purge_tasks", "--days", "30", "--batch-size", "1", stderr=StringIO())
+
+        # Assert
+        assert set(QueuedTask.objects.values_list("id", flat=True)) == {recent.id, pending.id}
+
+    def test_if_thread_backend_waits_for_commit(self, settings, django_capture_on_commit_callbacks):
+        # Arrange
+        settings.TASKS_BACKEND = "thread"
+
+        # Act
+        with django_capture_on_commit_callbacks() as callbacks:
+            record_call.dispatch(2)
+
+        # Assert
+        assert len(callbacks) == 1
+        assert calls == []
+        assert not QueuedTask.objects.exists()
+
+    def test_if_student_is_created_profile_task_is_queued(self, settings):
+        # Arrange
+        settings.TASKS_BACKEND = "database"
+
+        # Act
+        student = User.objects.create_user(
+            username="test_student1",
+            password="string1234",
+            phone_number="09309500001",
+            national_code="0960030001",
+            user_type="student"
+        )
+        queued_before_run = StudentProfile.objects.filter(students=student).exists()
+        call_command("run_tasks", "--once", stderr=StringIO())
+
+        # Assert
+        assert queued_before_run is False
+        assert StudentProfile.objects.filter(students=student).exists()
+        profile_task = QueuedTask.objects.get(name="gamification.create_student_profile")
+        assert profile_task.idempotency_key == f"student_profile:{student.id}"
+        assert profile_task.status == "done"
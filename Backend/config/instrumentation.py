@@ -0,0 +1,300 @@
+"""
+Request Instrumentation
+=======================
+This module records what every request costs, per URL name, when `settings.INSTRUMENTATION_ENABLED` is True.
+
+Classes:
+1. `Histogram` - Cumulative bucket counts, sum and maximum of one measurement.
+2. `InstrumentationMiddleware` - Measures every request and adds it to the histograms of its URL name.
+
+Functions:
+1. `snapshot` - Returns the per-endpoint report: request count, mean, p50, p95 and max of every measurement,
+   and the slowest queries seen.
+2. `prometheus_text` - Returns the histograms in the Prometheus text exposition format.
+3. `reset` - Clears everything recorded so far.
+
+Measurements (per URL name, e.g. `user-get`, `Get scores`, `Get ReportCards`):
+- `latency_seconds` - Time spent in the view and the middlewares below this one, until a streamed body is sent.
+- `queries` - Number of SQL queries.
+- `db_seconds` - Time spent running those queries.
+- `serializer_seconds` - Time spent building `serializer.data`.
+- `response_bytes` - Size of the response body.
+
+Key Features:
+- Opt-in: the middleware removes itself from the stack while `INSTRUMENTATION_ENABLED` is False.
+- Histograms live in process memory, so every process reports its own requests.
+- A streamed response is recorded once its body is sent, with the queries run while streaming it.
+- `serializer.data` is timed only while an instrumented request is running; DRF is left untouched otherwise.
+- Queries slower than `INSTRUMENTATION_SLOW_QUERY_MS` are logged with the line of project code that ran them;
+  the slowest `INSTRUMENTATION_SLOW_QUERY_LIMIT` are kept for the report.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+import traceback
+from bisect import bisect_left
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework.serializers import BaseSerializer
+
+logger = logging.getLogger(__name__)
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+METRICS = {
+    "latency_seconds": SECONDS_BUCKETS,
+    "queries": (1, 2, 5, 10, 20, 50, 100, 200, 500),
+    "db_seconds": SECONDS_BUCKETS,
+    "serializer_seconds": SECONDS_BUCKETS,
+    "response_bytes": (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+}
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        # One count per bucket plus the +Inf bucket; not cumulative.
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0
+        self.max = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """
+        Returns the upper bound of the bucket holding the q-quantile, capped at the maximum seen.
+        """
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+class _Measurement:
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0
+        self.serializer_seconds = 0
+        self.serializing = False
+        self.slow_queries = []
+        self.start = time.perf_counter()
+
+_current = ContextVar("instrumentation_measurement", default=None)
+_lock = threading.Lock()
+_histograms = {}
+_slow_queries = []
+_sequence = itertools.count()
+
+def _origin():
+    """
+    Returns "path:line in function" of the innermost project frame of the current stack.
+    """
+    base_dir = str(settings.BASE_DIR)
+    for frame in reversed(traceback.extract_stack()[:-2]):
+        if frame.filename.startswith(base_dir) and "site-packages" not in frame.filename and frame.filename != __file__:
+            return f"{Path(frame.filename).relative_to(base_dir)}:{frame.lineno} in {frame.name}"
+    return "unknown"
+
+def _query_wrapper(execute, sql, params, many, context):
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        measurement = _current.get()
+        if measurement is not None:
+            measurement.queries += 1
+            measurement.db_seconds += elapsed
+            if elapsed * 1000 >= getattr(settings, "INSTRUMENTATION_SLOW_QUERY_MS", 100):
+                origin = _origin()
+                logger.warning("Slow query (%.1f ms) at %s: %s", elapsed * 1000, origin, sql[:2000])
+                measurement.slow_queries.append({"ms": round(elapsed * 1000, 3), "origin": origin, "sql": sql[:2000]})
+
+_serializer_data = BaseSerializer.data
+
+def _timed_serializer_data(self):
+    measurement = _current.get()
+    # Nested serializers are timed as part of the outermost one.
+    if measurement is None or measurement.serializing:
+        return _serializer_data.fget(self)
+    measurement.serializing = True
+    start = time.perf_counter()
+    try:
+        return _serializer_data.fget(self)
+    finally:
+        measurement.serializer_seconds += time.perf_counter() - start
+        measurement.serializing = False
+
+_hook_lock = threading.Lock()
+_hook_users = 0
+
+def _hook_serializers():
+    """
+    Times `serializer.data` while at least one instrumented request is running.
+    """
+    global _hook_users
+    with _hook_lock:
+        if not _hook_users:
+            BaseSerializer.data = property(_timed_serializer_data)
+        _hook_users += 1
+
+def _unhook_serializers():
+    global _hook_users
+    with _hook_lock:
+        _hook_users -= 1
+        if not _hook_users:
+            BaseSerializer.data = _serializer_data
+
+@contextmanager
+def _measuring(measurement):
+    """
+    Adds the queries run on every database connection of this thread to `measurement`.
+    """
+    token = _current.set(measurement)
+    try:
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(_query_wrapper))
+            yield
+    finally:
+        _current.reset(token)
+
+def _observe(endpoint, values):
+    with _lock:
+        for metric, value in values.items():
+            key = (endpoint, metric)
+            if key not in _histograms:
+                _histograms[key] = Histogram(METRICS[metric])
+            _histograms[key].observe(value)
+
+def _keep_slow_queries(endpoint, queries):
+    limit = getattr(settings, "INSTRUMENTATION_SLOW_QUERY_LIMIT", 50)
+    with _lock:
+        for query in queries:
+            heapq.heappush(_slow_queries, (query["ms"], next(_sequence), {"endpoint": endpoint, **query}))
+            if len(_slow_queries) > limit:
+                heapq.heappop(_slow_queries)
+
+def _finish(request, measurement, response_bytes):
+    """
+    Adds a finished request to the histograms of its URL name.
+    """
+    _unhook_serializers()
+    match = getattr(request, "resolver_match", None)
+    endpoint = (match.url_name or match.route) if match else "unresolved"
+    _observe(endpoint, {
+        "latency_seconds": time.perf_counter() - measurement.start,
+        "queries": measurement.queries,
+        "db_seconds": measurement.db_seconds,
+        "serializer_seconds": measurement.serializer_seconds,
+        "response_bytes": response_bytes,
+    })
+    _keep_slow_queries(endpoint, measurement.slow_queries)
+
+class _MeasuredStream:
+    """
+    Streamed body measuring the work done while it is sent; the request is
+    finished when the body is exhausted or closed.
+    """
+    def __init__(self, request, measurement, content):
+        self.request = request
+        self.measurement = measurement
+        self.content = iter(content)
+        self.size = 0
+        self.finished = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            with _measuring(self.measurement):
+                chunk = next(self.content)
+        except StopIteration:
+            self.close()
+            raise
+        self.size += len(chunk)
+        return chunk
+
+    def close(self):
+        if not self.finished:
+            self.finished = True
+            _finish(self.request, self.measurement, self.size)
+
+class InstrumentationMiddleware:
+    def __init__(self, get_response):
+        if not getattr(settings, "INSTRUMENTATION_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        measurement = _Measurement()
+        _hook_serializers()
+        try:
+            with _measuring(measurement):
+                response = self.get_response(request)
+        except BaseException:
+            _unhook_serializers()
+            raise
+
+        if response.streaming:
+            # The rows of a streamed export are read while the body is sent, after this returns.
+            response.streaming_content = _MeasuredStream(request, measurement, response.streaming_content)
+        else:
+            _finish(request, measurement, len(response.content))
+        return response
+
+def snapshot():
+    with _lock:
+        endpoints = {}
+        for (endpoint, metric), histogram in sorted(_histograms.items()):
+            row = endpoints.setdefault(endpoint, {"requests": 0})
+            if metric == "latency_seconds":
+                row["requests"] = histogram.count
+            row[metric] = {
+                "mean": round(histogram.sum / histogram.count, 6),
+                "p50": round(histogram.quantile(0.5), 6),
+                "p95": round(histogram.quantile(0.95), 6),
+                "max": round(histogram.max, 6),
+            }
+        slow_queries = [entry for _, _, entry in sorted(_slow_queries, reverse=True)]
+    return {"endpoints": endpoints, "slow_queries": slow_queries}
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def prometheus_text():
+    lines = []
+    with _lock:
+        for metric in METRICS:
+            name = f"api_request_{metric}"
+            lines.append(f"# HELP {name} Per-endpoint request {metric.replace('_', ' ')}.")
+            lines.append(f"# TYPE {name} histogram")
+            for (endpoint, histogram_metric), histogram in sorted(_histograms.items()):
+                if histogram_metric != metric:
+                    continue
+                label = _label(endpoint)
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{endpoint="{label}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_sum{{endpoint="{label}"}} {histogram.sum}')
+                lines.append(f'{name}_count{{endpoint="{label}"}} {histogram.count}')
+    return "\n".join(lines) + "\n"
+
+def reset():
+    with _lock:
+        _histograms.clear()
+        _slow_queries.clear()
@@ -0,0 +1,51 @@
+"""
+Instrumentation API
+===================
+This module exposes the request measurements recorded by `config.instrumentation`.
+1. GET `/metrics/` - Get the per-endpoint report and the slowest queries (admin-only).
+2. GET `/metrics/prometheus/` - Get the histograms in the Prometheus text format (admin-only).
+
+Key Features:
+- Both endpoints report the requests served by the process answering them.
+- Nothing is recorded unless `settings.INSTRUMENTATION_ENABLED` is True.
+"""
+
+from django.http import HttpResponse
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from common.is_authenticated import authenticated_required
+from common.is_admin import admin_required
+from config.instrumentation import snapshot, prometheus_text
+
+@swagger_auto_schema(
+    method="get",
+    responses={
+        200: "Per-endpoint latency, query, serializer and size statistics",
+        401: "Authenticated required",
+        403: "Forbidden",
+    }
+)
+@api_view(["GET"])
+@authenticated_required
+@admin_required
+def getMetricsView(request, *args, **kwargs):
+    return Response(
+        {"detail":"Request metrics of this process.", "data":snapshot()},
+        status=status.HTTP_200_OK
+    )
+
+@swagger_auto_schema(
+    method="get",
+    responses={
+        200: "Prometheus text exposition",
+        401: "Authenticated required",
+        403: "Forbidden",
+    }
+)
+@api_view(["GET"])
+@authenticated_required
+@admin_required
+def getPrometheusMetricsView(request, *args, **kwargs):
+    return HttpResponse(prometheus_text(), content_type="text/plain; version=0.0.4; charset=utf-8")
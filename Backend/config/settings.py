@@ -48,6 +48,9 @@ INSTALLED_APPS = [
     'event',
     'present_absent',
     'gamification',
+    'common',
+    'search',
+    'dashboard',
 
     'rest_framework',
     'rest_framework_simplejwt',
@@ -57,11 +60,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'config.instrumentation.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'common.access.AccessContextMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -111,19 +116,70 @@ DATABASES = {
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'common.authentication.ClaimsJWTAuthentication',
     ),
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend'
     ],
 }
 
+# Per-endpoint request metrics (config/instrumentation.py), served on /metrics/.
+INSTRUMENTATION_ENABLED = False
+INSTRUMENTATION_SLOW_QUERY_MS = 100
+INSTRUMENTATION_SLOW_QUERY_LIMIT = 50
+
+# In-memory copies of small reference tables (common/refcache.py).
+# Use 'common.refcache.CacheVersionBackend' with a shared CACHES backend so that
+# every worker sees a change immediately instead of after REFCACHE_TTL seconds.
+REFCACHE_BACKEND = 'common.refcache.LocalVersionBackend'
+REFCACHE_TTL = 300
+REFCACHE_MAX_TABLES = 32
+# ETags of conditional GETs (common/conditional.py) are only valid for this many seconds
+# while the version counters above are local to each process.
+CONDITIONAL_LOCAL_TTL = 5
+
+# Search index (search/indexing.py): minimum trigram similarity of a fuzzy match, from 0 to 1.
+SEARCH_SIMILARITY_THRESHOLD = 0.3
+
+# Per-student dashboard snapshots (dashboard/snapshots.py), kept in the DASHBOARD_CACHE alias.
+# A snapshot is rebuilt after DASHBOARD_TTL seconds even if no signal dropped it.
+DASHBOARD_CACHE = 'default'
+DASHBOARD_TTL = 600
+
+# Shared list pagination (common/pagination.py)
+PAGINATION_PAGE_SIZE = 10
+PAGINATION_MAX_PAGE_SIZE = 100
+
+# Precomputed student rankings (gamification/leaderboard.py)
+LEADERBOARD_BACKEND = 'gamification.leaderboard.LocalLeaderboardBackend'
+# Seconds before a process reloads a board, to pick up writes made by other processes.
+LEADERBOARD_TTL = 300
+
+# Report card PDFs (reportcard/rendering.py)
+REPORTCARD_PDF_ROOT = BASE_DIR / 'media' / 'reportcards'
+REPORTCARD_RENDER_WORKERS = 4
+
+# Task queue (common/tasks.py): "sync", "thread" or "database".
+# "database" needs a `python manage.py run_tasks` worker.
+TASKS_BACKEND = 'thread'
+TASKS_THREAD_WORKERS = 4
+# Seconds a claimed task may run before `run_tasks` assumes its worker died and queues it again.
+TASKS_LEASE_TIMEOUT = 1800
+# Days done and failed tasks are kept before `python manage.py purge_tasks` deletes them.
+# Their idempotency keys stop deduplicating once deleted.
+TASKS_RETENTION_DAYS = 30
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=365),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=400),
     'AUTH_HEADER_TYPES': ('JWT',),
+    # Adds the user_type and is_staff claims read by common.authentication.
+    'TOKEN_OBTAIN_SERIALIZER': 'common.authentication.ClaimsTokenObtainPairSerializer',
 }
 
+# Seconds a process trusts the cached active flag and role of a token's user (common/authentication.py).
+AUTH_USER_STATE_TTL = 60
+
 
 
 # Password validation
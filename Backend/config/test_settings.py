@@ -0,0 +1,15 @@
+"""
+Settings for the test suite: the project settings on an in-memory SQLite database.
+"""
+
+from config.settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Hashing with the production hashers dominates the run time of tests creating users.
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
@@ -0,0 +1,109 @@
+import pytest
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework.serializers import BaseSerializer
+from user.models import User
+from config import instrumentation
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestInstrumentation:
+    @pytest.fixture(autouse=True)
+    def enable_instrumentation(self, settings):
+        settings.INSTRUMENTATION_ENABLED = True
+        instrumentation.reset()
+        yield
+        instrumentation.reset()
+
+    def setup_method(self):
+        self.admin = create_user("test_admin1", "admin", 1)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_requests_are_reported_per_url_name(self):
+        # Arrange
+        self.client.get("/users/")
+        self.client.get("/users/")
+
+        # Act
+        response = self.client.get("/metrics/")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        users = response.data["data"]["endpoints"]["user-get"]
+        assert users["requests"] == 2
+        assert users["queries"]["max"] >= 1
+        assert users["serializer_seconds"]["max"] > 0
+        assert users["response_bytes"]["p50"] > 0
+
+    def test_streamed_response_is_recorded_once_sent(self):
+        # Arrange
+        response = self.client.get("/reportcard/export/")
+        assert "Export ReportCards" not in instrumentation.snapshot()["endpoints"]
+
+        # Act
+        body = b"".join(response.streaming_content)
+
+        # Assert
+        export = instrumentation.snapshot()["endpoints"]["Export ReportCards"]
+        assert export["requests"] == 1
+        # The rows are read while the body is sent.
+        assert export["queries"]["max"] >= 1
+        assert export["response_bytes"]["max"] == len(body)
+
+    def test_serializers_are_timed_only_during_requests(self):
+        # Arrange
+        original = BaseSerializer.__dict__["data"]
+
+        # Act
+        self.client.get("/users/")
+
+        # Assert
+        assert BaseSerializer.__dict__["data"] is original
+        assert instrumentation.snapshot()["endpoints"]["user-get"]["serializer_seconds"]["max"] > 0
+
+    def test_prometheus_text_has_cumulative_buckets(self):
+        # Arrange
+        self.client.get("/users/")
+
+        # Act
+        response = self.client.get("/metrics/prometheus/")
+
+        # Assert
+        text = response.content.decode()
+        assert response["Content-Type"].startswith("text/plain")
+        assert "# TYPE api_request_latency_seconds histogram" in text
+        assert 'api_request_queries_bucket{endpoint="user-get",le="+Inf"} 1' in text
+        assert 'api_request_queries_count{endpoint="user-get"} 1' in text
+
+    def test_slow_queries_are_kept_with_their_origin(self, settings):
+        # Arrange
+        settings.INSTRUMENTATION_SLOW_QUERY_MS = 0
+
+        # Act
+        self.client.get("/users/")
+
+        # Assert
+        slow_queries = instrumentation.snapshot()["slow_queries"]
+        assert slow_queries
+        assert all(query["endpoint"] == "user-get" for query in slow_queries)
+        assert any(query["origin"].startswith("common/pagination.py:") for query in slow_queries)
+
+    def test_if_user_is_not_admin_return_403(self):
+        # Arrange
+        self.client.force_authenticate(user=create_user("test_student1", "student", 2))
+
+        # Act
+        response = self.client.get("/metrics/")
+
+        # Assert
+        assert response.status_code == status.HTTP_403_FORBIDDEN
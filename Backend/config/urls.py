@@ -21,6 +21,8 @@ from drf_yasg.views import get_schema_view
 from drf_yasg import openapi 
 from rest_framework import permissions
 
+from config.instrumentation_views import getMetricsView, getPrometheusMetricsView
+
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -44,6 +46,8 @@ urlpatterns = [
     path('api/token/verify/', TokenVerifyView.as_view(), name='token_verify'),
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    path('metrics/', getMetricsView, name='metrics'),
+    path('metrics/prometheus/', getPrometheusMetricsView, name='metrics-prometheus'),
 
     path('', include('user.urls')),
     path('', include('classroom.urls')),
@@ -53,4 +57,6 @@ urlpatterns = [
     path('', include('event.urls')),
     path('', include('present_absent.urls')),
     path('', include('gamification.urls')),
+    path('', include('search.urls')),
+    path('', include('dashboard.urls')),
 ]
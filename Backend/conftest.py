@@ -0,0 +1,22 @@
+import pytest
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    # In-process caches outlive the per-test transaction rollback, so rows
+    # cached by one test must not leak into the next one.
+    # Imported here: app modules can only be loaded once pytest-django has set Django up.
+    from django.core.cache import cache
+    from common import refcache
+    from gamification import leaderboard
+    refcache.clear()
+    leaderboard.invalidate()
+    cache.clear()
+    yield
+    refcache.clear()
+    leaderboard.invalidate()
+    cache.clear()
+
+@pytest.fixture(autouse=True)
+def run_tasks_synchronously(settings):
+    # Tasks run inside the test's transaction, so their effects can be asserted right away.
+    settings.TASKS_BACKEND = "sync"
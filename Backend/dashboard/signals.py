@@ -0,0 +1,52 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from user.models import User
+from lesson.models import Lesson
+from score.models import Score
+from reportcard.models import ReportCard
+from present_absent.models import PresentAbsent
+from event.models import Event, Registration
+from gamification.models import StudentProfile
+from dashboard import snapshots
+
+@receiver(post_save, sender=Score)
+@receiver(post_delete, sender=Score)
+def invalidate_score_dashboard(sender, instance, **kwargs):
+    snapshots.invalidate([instance.students_id])
+
+@receiver(post_save, sender=ReportCard)
+@receiver(post_delete, sender=ReportCard)
+def invalidate_report_card_dashboard(sender, instance, **kwargs):
+    snapshots.invalidate([instance.user_id])
+
+@receiver(post_save, sender=PresentAbsent)
+@receiver(post_delete, sender=PresentAbsent)
+def invalidate_attendance_dashboard(sender, instance, **kwargs):
+    snapshots.invalidate([instance.user_id])
+
+@receiver(post_save, sender=Registration)
+@receiver(post_delete, sender=Registration)
+def invalidate_registration_dashboard(sender, instance, **kwargs):
+    snapshots.invalidate([instance.user_id])
+
+@receiver(post_save, sender=Event)
+def invalidate_event_dashboards(sender, instance, created, **kwargs):
+    # Deleted events reach the dashboards through their deleted registrations.
+    if not created:
+        snapshots.invalidate(Registration.objects.filter(event=instance).values_list("user_id", flat=True))
+
+@receiver(post_save, sender=Lesson)
+def invalidate_lesson_dashboards(sender, instance, created, **kwargs):
+    if not created:
+        snapshots.invalidate(Score.objects.filter(lesson=instance).values_list("students_id", flat=True).distinct())
+
+@receiver(post_save, sender=StudentProfile)
+def invalidate_new_profile_dashboard(sender, instance, created, **kwargs):
+    # The profile is created by a queued task, possibly after the first snapshot cached none.
+    if created:
+        snapshots.invalidate([instance.students_id])
+
+@receiver(post_delete, sender=User)
+def forget_dashboard(sender, instance, **kwargs):
+    # A reused primary key must not find the snapshot of a deleted student.
+    snapshots.invalidate([instance.pk])
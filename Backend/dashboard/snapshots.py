@@ -0,0 +1,131 @@
+"""
+Student Dashboard Snapshots
+===========================
+This module keeps one cached snapshot per student with everything their home screen shows.
+
+Functions:
+1. `get` - Returns the snapshot of a student, building it on a miss.
+2. `build` - Builds the snapshot of a student from the database.
+3. `invalidate` - Drops the snapshots of students after their data changed.
+
+Key Features:
+- A snapshot holds the recent scores, the latest report card, this month's attendance, the student
+  profile id and the upcoming registered events. Points, level and rank are read from the leaderboard
+  (gamification/leaderboard.py) when serving, since they change with every award; they are as fresh as
+  the leaderboard, so awards made by another process show up within `LEADERBOARD_TTL` with the local backend.
+- Each student has a version token next to the snapshot; both are read with one `get_many`. A snapshot
+  built under another token, or on another day, is rebuilt.
+- `invalidate` sets new tokens immediately and again when the transaction commits, so a snapshot built
+  from rows that were not committed yet is never kept.
+- The signals in `dashboard.signals` invalidate on single writes; bulk writes (score sheets, roll-calls,
+  bulk reviews, grade recomputation) call `invalidate` themselves.
+"""
+
+import uuid
+from datetime import date
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Count
+from score.models import Score
+from reportcard.models import ReportCard
+from present_absent.models import PresentAbsent
+from gamification.models import StudentProfile
+from event.models import Registration
+
+RECENT_SCORES = 5
+UPCOMING_EVENTS = 5
+
+def _cache():
+    return caches[getattr(settings, "DASHBOARD_CACHE", "default")]
+
+def _version_key(student_id):
+    return f"dashboard:version:{student_id}"
+
+def _snapshot_key(student_id):
+    return f"dashboard:snapshot:{student_id}"
+
+def _attendance(student_id, today):
+    month = today.replace(day=1)
+    counts = dict(
+        PresentAbsent.objects.filter(user_id=student_id, date__gte=month, date__lte=today)
+        .values_list("status").annotate(count=Count("id")).order_by()
+    )
+    total = sum(counts.values())
+    return {
+        "month":f"{month:%Y-%m}",
+        "present":counts.get("present", 0),
+        "absent":counts.get("absent", 0),
+        "excused":counts.get("excused", 0),
+        "rate":round(counts.get("present", 0) / total, 4) if total else None,
+    }
+
+def build(student_id, today=None):
+    today = today or date.today()
+    recent_scores = [
+        {
+            "lesson":lesson_id,
+            "lesson_name":lesson_name,
+            "classroom":classroom_id,
+            "score_value":score_value,
+            "created_at":created_at.isoformat(),
+        }
+        for lesson_id, lesson_name, classroom_id, score_value, created_at in Score.objects.filter(
+            students_id=student_id
+        ).order_by("-created_at", "-id").values_list(
+            "lesson_id", "lesson__name", "classroom_id", "score_value", "created_at"
+        )[:RECENT_SCORES]
+    ]
+    report_card = ReportCard.objects.filter(user_id=student_id).order_by("-created_at", "-id").values(
+        "id", "class_room", "grade", "disciplinary_status", "created_at"
+    ).first()
+    if report_card:
+        # Served as a number, like the report card API.
+        report_card["grade"] = float(report_card["grade"] or 0)
+        report_card["created_at"] = report_card["created_at"].isoformat()
+    upcoming_events = [
+        {"event":event_id, "name":name, "date":day.isoformat(), "time":f"{at:%H:%M}", "status":event_status}
+        for event_id, name, day, at, event_status in Registration.objects.filter(
+            user_id=student_id, event__date__gte=today
+        ).order_by("event__date", "event__time").values_list(
+            "event_id", "event__name", "event__date", "event__time", "event__status"
+        )[:UPCOMING_EVENTS]
+    ]
+    return {
+        "built_on":today.isoformat(),
+        "recent_scores":recent_scores,
+        "report_card":report_card,
+        "attendance":_attendance(student_id, today),
+        "profile_id":StudentProfile.objects.filter(students_id=student_id).values_list("id", flat=True).first(),
+        "upcoming_events":upcoming_events,
+    }
+
+def get(student_id):
+    """
+    Returns the snapshot of the student; a hit costs one cache read.
+    """
+    cache = _cache()
+    version_key, snapshot_key = _version_key(student_id), _snapshot_key(student_id)
+    cached = cache.get_many([version_key, snapshot_key])
+    version = cached.get(version_key)
+    snapshot = cached.get(snapshot_key)
+    today = date.today()
+    if snapshot is None or snapshot["version"] != version or snapshot["built_on"] != today.isoformat():
+        # The version is read before the rows, so an invalidation in between is not lost.
+        snapshot = dict(build(student_id, today), version=version)
+        cache.set(snapshot_key, snapshot, getattr(settings, "DASHBOARD_TTL", 600))
+    return snapshot
+
+def _bump(student_ids):
+    _cache().set_many(
+        {_version_key(student_id): uuid.uuid4().hex for student_id in student_ids},
+        timeout=None
+    )
+
+def invalidate(student_ids):
+    student_ids = set(student_ids)
+    if not student_ids:
+        return
+    _bump(student_ids)
+    # Readers that built a snapshot from the old rows before the commit rebuild once more afterwards.
+    transaction.on_commit(lambda: _bump(student_ids))
@@ -0,0 +1,126 @@
+import pytest
+from datetime import date, time
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+from score.models import Score
+from reportcard.models import ReportCard
+from event.models import Event, Registration
+from gamification.models import StudentProfile
+from gamification.tasks import create_student_profile
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestGetDashboardView:
+    def setup_method(self):
+        self.teacher = create_user("test_teacher1", "teacher", 1)
+        self.student = create_user("test_student1", "student", 2)
+        field = Field.objects.create(name="Math")
+        self.classroom = ClassRoom.objects.create(name="10-A", base=10, field=field)
+        self.classroom.students.add(self.student)
+        self.lesson = Lesson.objects.create(name="Algebra", teachers=self.teacher)
+        self.score = Score.objects.create(students=self.student, lesson=self.lesson, classroom=self.classroom, score_value=18)
+        self.event = Event.objects.create(name="Science fair", description="Yearly fair", date=date(2030, 1, 1), time=time(9, 0))
+        Registration.objects.create(user=self.student, event=self.event)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.student)
+
+    def test_if_user_is_not_student_return_403(self):
+        # Arrange
+        self.client.force_authenticate(user=self.teacher)
+
+        # Act
+        response = self.client.get("/me/dashboard/")
+
+        # Assert
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_dashboard_is_served_from_snapshot(self, django_assert_num_queries):
+        # Arrange
+        first = self.client.get("/me/dashboard/")
+
+        # Act / Assert
+        with django_assert_num_queries(0):
+            second = self.client.get("/me/dashboard/")
+        assert first.status_code == status.HTTP_200_OK
+        assert second.data == first.data
+        assert [score["lesson_name"] for score in second.data["recent_scores"]] == ["Algebra"]
+        assert second.data["upcoming_events"][0]["name"] == "Science fair"
+        assert second.data["rank"] == 1
+        assert second.data["report_card"] is None
+
+    def test_new_score_and_report_card_rebuild_snapshot(self, django_capture_on_commit_callbacks):
+        # Arrange
+        self.client.get("/me/dashboard/")
+
+        # Act
+        # The "score_20" award reaches the leaderboard once the transaction commits.
+        with django_capture_on_commit_callbacks(execute=True):
+            Score.objects.create(students=self.student, lesson=self.lesson, classroom=self.classroom, score_value=20)
+        report_card = ReportCard.objects.create(user=self.student, class_room=self.classroom)
+        response = self.client.get("/me/dashboard/")
+
+        # Assert
+        assert [score["score_value"] for score in response.data["recent_scores"]] == [20, 18]
+        assert response.data["report_card"]["id"] == report_card.id
+        assert response.data["report_card"]["grade"] == 0
+        assert response.data["points"] > 0
+
+    def test_bulk_attendance_rebuilds_snapshot(self):
+        # Arrange
+        self.client.get("/me/dashboard/")
+        self.client.force_authenticate(user=self.teacher)
+        self.client.post(
+            "/attending/bulk/",
+            {
+                "classroom": self.classroom.id,
+                "date": str(date.today()),
+                "attendances": [{"student": self.student.id, "status": "present"}]
+            },
+            format="json"
+        )
+        self.client.force_authenticate(user=self.student)
+
+        # Act
+        response = self.client.get("/me/dashboard/")
+
+        # Assert
+        assert response.data["attendance"]["present"] == 1
+        assert response.data["attendance"]["rate"] == 1
+
+    def test_cancelled_registration_leaves_upcoming_events(self):
+        # Arrange
+        self.client.get("/me/dashboard/")
+
+        # Act
+        Registration.objects.filter(user=self.student).delete()
+        response = self.client.get("/me/dashboard/")
+
+        # Assert
+        assert response.data["upcoming_events"] == []
+
+    def test_profile_created_after_first_load_rebuilds_snapshot(self):
+        # Arrange
+        # As if the queued profile task had not run yet on the first load.
+        StudentProfile.objects.filter(students=self.student).delete()
+        first = self.client.get("/me/dashboard/")
+
+        # Act
+        create_student_profile(self.student.id)
+        response = self.client.get("/me/dashboard/")
+
+        # Assert
+        assert first.data["rank"] is None
+        assert response.data["rank"] == 1
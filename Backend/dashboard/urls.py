@@ -0,0 +1,6 @@
+from django.urls import path
+from dashboard.views import getDashboardView
+
+urlpatterns = [
+    path('me/dashboard/', getDashboardView, name='dashboard'),
+]
@@ -0,0 +1,55 @@
+"""
+Dashboard API
+=============
+This module serves the home screen of a student in one request.
+1. GET `/me/dashboard/` - Recent scores, latest report card, this month's attendance, points, level, rank and upcoming events.
+
+Key Features:
+- The student's data is read from their cached snapshot (dashboard/snapshots.py); a warm load runs no query.
+- Points, level and the school rank come from the precomputed leaderboard, not from the snapshot: awards
+  made in this process show up at once, awards made by other processes once their board is reloaded
+  (`LEADERBOARD_TTL` with the local backend).
+- Only students have a dashboard.
+"""
+
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from common.is_authenticated import authenticated_required
+from common.access import get_access
+from gamification import leaderboard
+from dashboard import snapshots
+
+@swagger_auto_schema(method="get")
+@api_view(["GET"])
+@authenticated_required
+def getDashboardView(request, *args, **kwargs):
+    """
+    Returns the dashboard of the requesting student.
+    """
+    access = get_access(request)
+    if not access.is_student:
+        return Response(
+            {"detail":"Only students have a dashboard."},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    snapshot = snapshots.get(access.user_id)
+    rank, entries = (None, [])
+    if snapshot["profile_id"]:
+        rank, entries = leaderboard.rank_with_neighbours(("school", None), snapshot["profile_id"], 0)
+    entry = entries[0][1] if entries else None
+
+    return Response(
+        {
+            "recent_scores":snapshot["recent_scores"],
+            "report_card":snapshot["report_card"],
+            "attendance":snapshot["attendance"],
+            "points":entry.total_point if entry else 0,
+            "level":entry.level if entry else None,
+            "rank":rank,
+            "upcoming_events":snapshot["upcoming_events"],
+        },
+        status=status.HTTP_200_OK
+    )
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from event.models import Event, Registration
+from event.models import Event, Registration, WaitlistEntry
 
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
@@ -7,6 +7,8 @@ class EventAdmin(admin.ModelAdmin):
         'name',
         'description',
         'image',
+        'max_seats',
+        'registered_count',
         'created_at'
     ]
     search_fields = ['name', 'description']
@@ -26,4 +28,23 @@ class RegistrationAdmin(admin.ModelAdmin):
         "event__name"
     ]
     ordering = ["user__username"]
-    list_per_page = 10 
\ No newline at end of file
+    list_per_page = 10
+    list_select_related = ["user", "event"]
+
+@admin.register(WaitlistEntry)
+class WaitlistEntryAdmin(admin.ModelAdmin):
+    list_display = [
+        "user__username",
+        "event__name",
+        "ticket",
+        "requested_at"
+    ]
+    search_fields = [
+        "user__username",
+        "event__name"
+    ]
+    ordering = ["event", "ticket"]
+    # Tickets are numbered by event/waitlist.py.
+    readonly_fields = ["ticket"]
+    list_per_page = 10
+    list_select_related = ["user", "event"]
@@ -0,0 +1,23 @@
+"""
+Recomputes `Event.registered_count` from the registrations (see `event.seats`).
+
+Registering and deleting through the API keeps the counters exact. Run this
+once after adding the column, and after writing registrations with raw SQL
+or `bulk_create`.
+
+Usage:
+    python manage.py recount_event_seats [--event 12 --event 13]
+"""
+
+from django.core.management.base import BaseCommand
+from event.seats import recount
+
+class Command(BaseCommand):
+    help = "Recompute the seats taken of every event from its registrations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--event", type=int, action="append", help="Event id to recount; may be repeated. Defaults to all.")
+
+    def handle(self, *args, **options):
+        updated = recount(options["event"])
+        self.stderr.write(self.style.SUCCESS(f"Recounted {updated} events."))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Event',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, verbose_name='Name of event')),
+                ('description', models.TextField(verbose_name='Description')),
+                ('image', models.ImageField(blank=True, null=True, upload_to='event_images/')),
+                ('date', models.DateField()),
+                ('time', models.TimeField()),
+                ('status', models.CharField(choices=[('held', 'Held'), ('not_held', 'Not Held'), ('in_progress', 'In Progress')], default='not_held', max_length=255, verbose_name='Status of Event')),
+                ('capacity', models.CharField(choices=[('completed', 'Completed'), ('empty', 'Empty')], default='empty', max_length=255, verbose_name='Capacity of event')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Registration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('register_at', models.DateField(auto_now_add=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='event.event')),
+            ],
+        ),
+    ]
@@ -32,15 +32,28 @@ class Event(models.Model):
         default="not_held"
     )
 
-    CAPACITY_CHOICES = [
-        ("completed", "Completed"),
-        ("empty", "Empty")
-    ]
-    capacity = models.CharField(
-        max_length=255,
-        choices=CAPACITY_CHOICES,
-        verbose_name="Capacity of event",
-        default="empty"
+    # Seats on offer; no limit when empty.
+    max_seats = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="Maximum seats"
+    )
+
+    # Kept by event/seats.py with conditional updates, never read-modify-written.
+    registered_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Registered seats"
+    )
+
+    # The waitlist holds the tickets in (waitlist_start, waitlist_end]; see event/waitlist.py.
+    waitlist_start = models.PositiveIntegerField(
+        default=0,
+        editable=False
+    )
+    waitlist_end = models.PositiveIntegerField(
+        default=0,
+        editable=False
     )
 
     created_at = models.DateTimeField(
@@ -48,8 +61,33 @@ class Event(models.Model):
         verbose_name="Created at"
     )
 
+    # Written only with conditional updates (event/seats.py, event/waitlist.py).
+    COUNTERS = ("registered_count", "waitlist_start", "waitlist_end")
+
+    class Meta:
+        constraints = [
+            # Two events cannot share a slot; makes the check in validate_event race-free.
+            models.UniqueConstraint(fields=["date", "time"], name="unique_event_slot")
+        ]
+
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        # A full save of an instance loaded before some registrations must not write back its stale counters.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTERS
+            ]
+        super().save(*args, **kwargs)
+
+    @property
+    def capacity(self):
+        """Returns "completed" when every seat is taken, "empty" otherwise."""
+        if self.max_seats is not None and self.registered_count >= self.max_seats:
+            return "completed"
+        return "empty"
     
 class Registration(models.Model):
     user = models.ForeignKey(
@@ -62,4 +100,37 @@ class Registration(models.Model):
     )
     register_at = models.DateField(
         auto_now_add=True
-    )
\ No newline at end of file
+    )
+
+    class Meta:
+        constraints = [
+            # Leading `user` column also serves the per-user registration count.
+            models.UniqueConstraint(fields=["user", "event"], name="unique_registration")
+        ]
+
+class WaitlistEntry(models.Model):
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+    )
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name="waitlist"
+    )
+    # Place in the queue; the position is `ticket - event.waitlist_start`.
+    ticket = models.PositiveIntegerField()
+    requested_at = models.DateTimeField(
+        auto_now_add=True
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "event"], name="unique_waitlist_entry")
+        ]
+        indexes = [
+            models.Index(fields=["event", "ticket"], name="waitlist_event_ticket_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} waiting for {self.event_id} (#{self.ticket})"
@@ -6,9 +6,8 @@ The decorators ensure that the requests meet specific criteria before proceeding
 
 Key Features:
 1. `validations_registeration` - Validates registration requests to ensure:
-   - The event is not full (capacity check).
-   - The event is open for registration (status check).
-   - The user has not exceeded the maximum allowed registrations.
+   - The event is open for registration (status check, from the database).
+   - The user has not exceeded the maximum allowed registrations, waitlisted ones included.
 2. `check_registration_exist` - Ensures that the registration exists in the database before performing operations like update or delete.
 
 Usage:
@@ -18,14 +17,14 @@ Usage:
 from functools import wraps
 from rest_framework.response import Response
 from rest_framework import status
-from event.models import Registration
+from event.models import Event, Registration, WaitlistEntry
 
 def validations_registeration(view_func):
     """
     Decorator to validate registration requests.
-    - Ensures that the event is not full (capacity check).
     - Ensures that the event is open for registration (status check).
-    - Ensures that the user has not exceeded the maximum allowed registrations.
+    - Ensures that the user has not exceeded the maximum allowed registrations, waitlisted ones included.
+    - Full events are left to the view, which puts the user on the waitlist.
 
     Args:
         view_func (function): The view function to wrap.
@@ -35,25 +34,22 @@ def validations_registeration(view_func):
     """
     @wraps(view_func)
     def _wrap_view(request, *args, **kwargs):
-        # Check if the event is full
-        event_capacity = request.data.get("event__capacity")
-        if event_capacity == "completed":
-            return Response(
-                {"detail": "Capacity for this event is full"},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
-        # Check if the event is open for registration
-        event_status = request.data.get("event__status")
+        # The state of the event is read from the database, not from the request.
+        event_id = request.data.get("event")
+        event_status = None
+        if str(event_id).isdigit():
+            event_status = Event.objects.filter(pk=event_id).values_list("status", flat=True).first()
+
+        # Check if the event is open for registration; full events put the user on their waitlist.
         if event_status in ["held", "in_progress"]:
             return Response(
                 {"detail": "This event is not open for registrations"},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Check if the user has exceeded the maximum allowed registrations
+        # Check if the user has exceeded the maximum allowed registrations (waitlisted ones included)
         req_user = request.user
-        if Registration.objects.filter(user=req_user).count() >= 3:
+        if Registration.objects.filter(user=req_user).count() + WaitlistEntry.objects.filter(user=req_user).count() >= 3:
             return Response(
                 {"detail": "You are not allowed to register for more events"},
                 status=status.HTTP_403_FORBIDDEN
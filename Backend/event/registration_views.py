@@ -11,22 +11,29 @@ The API includes the following endpoints:
 Key Features:
 - Admin users can manage all registrations.
 - Non-admin users can only view and manage their own registrations.
+- Registering takes a seat of the event atomically (see event/seats.py); deleting a registration frees it.
+- Registering for a full event puts the user on its waitlist; a freed seat goes to the first waitlisted user
+  in the same transaction (see event/waitlist.py).
 - Filtering options for event, user, status, and date-based filters (future, past, today).
 - Pagination for efficient data retrieval.
 - Swagger documentation for API endpoints.
 """
 
 from event.models import Registration
+from event import seats, waitlist
 from event.serializers import RegistrationSerializer
 from rest_framework.decorators import api_view
 from common.is_authenticated import authenticated_required
 from common.is_admin import admin_required
+from common.conditional import conditional
+from common.access import get_access
 from event.registration_permissions import validations_registeration, check_registration_exist
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
+from common.pagination import get_paginator, PAGINATION_PARAMETERS
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from django.db import transaction, IntegrityError
 from django.db.models import Q
 from datetime import date
 
@@ -58,10 +65,11 @@ from datetime import date
             type=openapi.TYPE_STRING,
             description="Search by username or event name"
         )
-    ]
+    ] + PAGINATION_PARAMETERS
 )
 @api_view(["GET"])
 @authenticated_required
+@conditional(Registration)
 def registerGetView(request, *args, **kwargs):
     """
     Retrieves a list of registrations.
@@ -71,7 +79,7 @@ def registerGetView(request, *args, **kwargs):
     """
     user = request.user
     # Admin users can view all registrations; others can view their own
-    queryset = Registration.objects.filter(id=user.id) if user.user_type != "admin" else Registration.objects.all()
+    queryset = Registration.objects.filter(id=user.id) if get_access(request).user_type != "admin" else Registration.objects.all()
 
     # Apply search filter
     search = request.query_params.get("search")
@@ -115,8 +123,7 @@ def registerGetView(request, *args, **kwargs):
         queryset = queryset.order_by(ordering)
 
     # Paginate the results
-    paginated = PageNumberPagination()
-    paginated.page_size = 10
+    paginated = get_paginator(request)
     paginated_queryset = paginated.paginate_queryset(queryset, request)
     serializer = RegistrationSerializer(paginated_queryset, many=True)
     return paginated.get_paginated_response(serializer.data)
@@ -135,11 +142,32 @@ def registerPostView(request, *args, **kwargs):
     - Validates the provided data to ensure it meets the required criteria.
     - Associates the registration with the authenticated user.
     - Returns the created registration data on success.
+    - If the event is full, puts the user on its waitlist and returns their position (202).
     """
     req_user = request.user
     serializer = RegistrationSerializer(data=request.data)
     if serializer.is_valid():
-        serializer.save(user=req_user)
+        event = serializer.validated_data["event"]
+        try:
+            with transaction.atomic():
+                # The seat is taken in the transaction of the registration, so a failed insert gives it back.
+                if seats.reserve(event.id):
+                    serializer.save(user=req_user)
+                    # Registered directly, e.g. after seats were added; no longer waiting.
+                    waitlist.leave(req_user.id, event.id)
+                    position = None
+                else:
+                    position = waitlist.join(req_user.id, event.id)
+        except IntegrityError:
+            return Response(
+                {"detail": "You are already registered or waitlisted for this event"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if position is not None:
+            return Response(
+                {"detail": "Capacity for this event is full; you were added to its waitlist.", "data": {"event": event.id, "position": position}},
+                status=status.HTTP_202_ACCEPTED
+            )
         return Response(
             {"detail": "Registered successfully!", "data": serializer.data},
             status=status.HTTP_201_CREATED
@@ -181,7 +209,26 @@ def registerPutView(request, *args, **kwargs):
     # Update the registration
     serializer = RegistrationSerializer(registration, data=request.data, partial=True)
     if serializer.is_valid():
-        serializer.save(user=req_user)
+        previous_event_id = registration.event_id
+        event = serializer.validated_data.get("event")
+        try:
+            with transaction.atomic():
+                # Moving to another event takes a seat there and frees the old one.
+                if event is not None and event.id != previous_event_id:
+                    if not seats.reserve(event.id):
+                        return Response(
+                            {"detail": "Capacity for this event is full"},
+                            status=status.HTTP_403_FORBIDDEN
+                        )
+                    seats.release(previous_event_id)
+                serializer.save(user=req_user)
+                if event is not None and event.id != previous_event_id:
+                    waitlist.promote(previous_event_id)
+        except IntegrityError:
+            return Response(
+                {"detail": "This user is already registered for this event"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         return Response(
             {"detail": "Registration updated successfully!", "data": serializer.data},
             status=status.HTTP_200_OK
@@ -201,6 +248,7 @@ def registerDeleteView(request, *args, **kwargs):
     Deletes a registration.
     - Ensures the authenticated user is authorized to delete the registration.
     - Deletes the registration if it exists and the user is authorized.
+    - Registers the first waitlisted user of the event in the freed seat.
     - Returns a success message upon successful deletion.
     """
     req_user = request.user
@@ -213,8 +261,10 @@ def registerDeleteView(request, *args, **kwargs):
             status=status.HTTP_403_FORBIDDEN
         )
 
-    # Delete the registration
-    registration.delete()
+    # Delete the registration; the freed seat goes to the first waitlisted user
+    with transaction.atomic():
+        registration.delete()
+        waitlist.promote(registration.event_id)
     return Response(
         {"detail": "Registration deleted successfully!"},
         status=status.HTTP_204_NO_CONTENT
@@ -11,10 +11,20 @@ class EventSerializer(serializers.ModelSerializer):
             "date",
             "time",
             "status",
+            "max_seats",
+            "registered_count",
             "capacity",
             "created_at"
         ]
 
+    def validate_max_seats(self, value):
+        # Seats already taken are kept; the limit only stops new registrations.
+        if value is not None and self.instance is not None and value < self.instance.registered_count:
+            raise serializers.ValidationError(
+                f"{self.instance.registered_count} seats are already taken."
+            )
+        return value
+
 class RegistrationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Registration
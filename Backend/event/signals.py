@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from event.models import Registration, WaitlistEntry
+from event import seats, waitlist
+
+@receiver(post_delete, sender=Registration)
+def release_seat(sender, instance, **kwargs):
+    # Also runs for registrations deleted with their user.
+    seats.release(instance.event_id)
+
+@receiver(post_delete, sender=WaitlistEntry)
+def close_waitlist_gap(sender, instance, **kwargs):
+    # Promoted, left, or deleted with their user.
+    waitlist.close_gap(instance)
@@ -0,0 +1,44 @@
+import pytest
+from datetime import date, time
+from django.db.models.signals import pre_save
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from event.models import Event
+
+@pytest.mark.django_db
+class TestPutEventView:
+    def setup_method(self):
+        self.admin = User.objects.create_user(
+            username="test_admin1",
+            password="string1234",
+            phone_number="09309500001",
+            national_code="0960030001",
+            user_type="admin"
+        )
+        self.event = Event.objects.create(name="Science fair", description="Yearly fair", date=date(2030, 1, 1), time=time(9, 0))
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_if_slot_is_taken_concurrently_return_400(self):
+        # Arrange
+        def take_slot(sender, instance, **kwargs):
+            # Stands for another request saving an event in the slot after validate_event checked it.
+            if instance.pk == self.event.pk:
+                Event.objects.create(name="Concert", description="Spring concert", date=instance.date, time=instance.time)
+        pre_save.connect(take_slot, sender=Event)
+
+        # Act
+        try:
+            response = self.client.put(
+                f"/event/{self.event.id}/update/",
+                {"date": "2030-01-02", "time": "10:00"},
+                format="json"
+            )
+        finally:
+            pre_save.disconnect(take_slot, sender=Event)
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        self.event.refresh_from_db()
+        assert (self.event.date, self.event.time) == (date(2030, 1, 1), time(9, 0))
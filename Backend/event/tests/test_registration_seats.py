@@ -0,0 +1,118 @@
+import pytest
+from datetime import date, time
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from event.models import Event, Registration
+from event import seats
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestRegistrationSeats:
+    def setup_method(self):
+        self.students = [create_user(f"test_student{index}", "student", index) for index in range(1, 4)]
+        self.event = Event.objects.create(name="Science fair", description="Yearly fair", date=date(2030, 1, 1), time=time(9, 0), max_seats=2)
+        self.client = APIClient()
+
+    def register(self, student, event=None):
+        self.client.force_authenticate(user=student)
+        return self.client.post(
+            "/event/register/create/",
+            {"user": student.id, "event": (event or self.event).id},
+            format="json"
+        )
+
+    def test_if_seats_are_taken_user_is_waitlisted(self):
+        # Act
+        responses = [self.register(student) for student in self.students]
+
+        # Assert
+        assert [response.status_code for response in responses] == [
+            status.HTTP_201_CREATED, status.HTTP_201_CREATED, status.HTTP_202_ACCEPTED
+        ]
+        self.event.refresh_from_db()
+        assert self.event.registered_count == 2
+        assert self.event.capacity == "completed"
+        assert Registration.objects.count() == 2
+
+    def test_client_cannot_claim_event_has_seats_or_is_open(self):
+        # Arrange
+        Event.objects.filter(pk=self.event.pk).update(registered_count=2)
+        self.client.force_authenticate(user=self.students[0])
+
+        # Act
+        response = self.client.post(
+            "/event/register/create/",
+            {"user": self.students[0].id, "event": self.event.id, "event__capacity": "empty", "event__status": "not_held"},
+            format="json"
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert not Registration.objects.exists()
+
+    def test_deleting_registration_frees_seat(self):
+        # Arrange
+        self.register(self.students[0])
+        self.register(self.students[1])
+        registration = Registration.objects.get(user=self.students[0])
+
+        # Act
+        self.client.force_authenticate(user=self.students[0])
+        delete = self.client.delete(f"/event/register/{registration.id}/delete/")
+        response = self.register(self.students[2])
+
+        # Assert
+        assert delete.status_code == status.HTTP_204_NO_CONTENT
+        assert response.status_code == status.HTTP_201_CREATED
+        self.event.refresh_from_db()
+        assert self.event.registered_count == 2
+
+    def test_duplicate_registration_gives_seat_back(self):
+        # Arrange
+        self.register(self.students[0])
+
+        # Act
+        response = self.register(self.students[0])
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        self.event.refresh_from_db()
+        assert self.event.registered_count == 1
+
+    def test_saving_stale_event_keeps_registered_count(self):
+        # Arrange
+        stale = Event.objects.get(pk=self.event.pk)
+        self.register(self.students[0])
+
+        # Act
+        stale.name = "Science week"
+        stale.save()
+
+        # Assert
+        self.event.refresh_from_db()
+        assert (self.event.name, self.event.registered_count) == ("Science week", 1)
+
+    def test_capacity_filter_and_recount(self):
+        # Arrange
+        admin = create_user("test_admin1", "admin", 10)
+        Registration.objects.bulk_create([Registration(user=student, event=self.event) for student in self.students[:2]])
+
+        # Act
+        seats.recount()
+        self.client.force_authenticate(user=admin)
+        response = self.client.get("/event/", {"capacity": "completed"})
+
+        # Assert
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["registered_count"] == 2
+        assert response.data["results"][0]["capacity"] == "completed"
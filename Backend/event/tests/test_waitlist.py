@@ -0,0 +1,103 @@
+import pytest
+from datetime import date, time
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from event.models import Event, Registration, WaitlistEntry
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestWaitlist:
+    def setup_method(self):
+        self.students = [create_user(f"test_student{index}", "student", index) for index in range(1, 6)]
+        self.event = Event.objects.create(name="Science fair", description="Yearly fair", date=date(2030, 1, 1), time=time(9, 0), max_seats=1)
+        self.client = APIClient()
+        # One seated student, the others waitlisted in order.
+        self.responses = [self.register(student) for student in self.students]
+
+    def register(self, student):
+        self.client.force_authenticate(user=student)
+        return self.client.post(
+            "/event/register/create/",
+            {"user": student.id, "event": self.event.id},
+            format="json"
+        )
+
+    def position(self, student):
+        self.client.force_authenticate(user=student)
+        return self.client.get(f"/event/{self.event.id}/waitlist/")
+
+    def test_full_event_waitlists_in_request_order(self):
+        # Assert
+        assert self.responses[0].status_code == status.HTTP_201_CREATED
+        assert [response.data["data"]["position"] for response in self.responses[1:]] == [1, 2, 3, 4]
+        assert self.position(self.students[3]).data == {"event": self.event.id, "position": 3, "length": 4}
+        assert self.position(self.students[0]).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_position_is_read_with_one_query(self, django_assert_num_queries):
+        # Arrange
+        self.client.force_authenticate(user=self.students[4])
+
+        # Act / Assert
+        with django_assert_num_queries(1):
+            response = self.client.get(f"/event/{self.event.id}/waitlist/")
+        assert response.data["position"] == 4
+
+    def test_cancelling_registration_promotes_first_waitlisted_user(self):
+        # Arrange
+        registration = Registration.objects.get(user=self.students[0])
+        self.client.force_authenticate(user=self.students[0])
+
+        # Act
+        response = self.client.delete(f"/event/register/{registration.id}/delete/")
+
+        # Assert
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert list(Registration.objects.values_list("user", flat=True)) == [self.students[1].id]
+        assert [self.position(student).data["position"] for student in self.students[2:]] == [1, 2, 3]
+        self.event.refresh_from_db()
+        assert self.event.registered_count == 1
+
+    def test_leaving_from_the_middle_moves_later_users_up(self):
+        # Act
+        self.client.force_authenticate(user=self.students[2])
+        response = self.client.delete(f"/event/{self.event.id}/waitlist/delete/")
+
+        # Assert
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert [self.position(student).data["position"] for student in (self.students[1], self.students[3], self.students[4])] == [1, 2, 3]
+        assert self.position(self.students[4]).data["length"] == 3
+
+    def test_deleted_user_leaves_waitlist(self):
+        # Act
+        self.students[1].delete()
+
+        # Assert
+        assert self.position(self.students[2]).data["position"] == 1
+        assert WaitlistEntry.objects.count() == 3
+
+    def test_added_seats_go_to_waitlisted_users(self):
+        # Arrange
+        admin = create_user("test_admin1", "admin", 10)
+        self.client.force_authenticate(user=admin)
+
+        # Act
+        response = self.client.put(
+            f"/event/{self.event.id}/update/",
+            {"max_seats": 3, "date": "2030-01-02", "time": "09:00"},
+            format="json"
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert set(Registration.objects.values_list("user", flat=True)) == {student.id for student in self.students[:3]}
+        assert self.position(self.students[3]).data["position"] == 1
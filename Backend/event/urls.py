@@ -1,6 +1,7 @@
 from django.urls import path 
 from event.views import eventGetView, eventPostView, eventPutView, eventDeleteView
 from event.registration_views import registerGetView, registerPostView, registerPutView, registerDeleteView
+from event.waitlist_views import waitlistGetView, waitlistDeleteView
 
 urlpatterns = [
     path("event/", eventGetView, name="Get Events"),
@@ -11,5 +12,8 @@ urlpatterns = [
     path("event/register/", registerGetView, name="Get Registration"),
     path("event/register/create/", registerPostView, name="Post Registration"),
     path("event/register/<int:registration_id>/update/", registerPutView, name="Put Registration"),
-    path("event/register/<int:registration_id>/delete/", registerDeleteView, name="Delete Registration")
+    path("event/register/<int:registration_id>/delete/", registerDeleteView, name="Delete Registration"),
+
+    path("event/<int:event_id>/waitlist/", waitlistGetView, name="Get Waitlist Position"),
+    path("event/<int:event_id>/waitlist/delete/", waitlistDeleteView, name="Delete Waitlist Entry")
 ]
@@ -12,6 +12,7 @@ Key Features:
 - Staff users (admins) can manage all events.
 - Non-staff users can only view events.
 - Filtering options for date, time, status, capacity, and future events.
+- `capacity` is derived from `max_seats` and `registered_count`; it is not written by clients.
 - Pagination for efficient data retrieval.
 - Swagger documentation for API endpoints.
 """
@@ -21,13 +22,16 @@ from event.serializers import EventSerializer
 from rest_framework.decorators import api_view
 from common.is_authenticated import authenticated_required
 from common.is_admin import admin_required
-from rest_framework.pagination import PageNumberPagination
+from common.pagination import get_paginator, PAGINATION_PARAMETERS
+from common.conditional import conditional
 from rest_framework.response import Response
 from rest_framework import status
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from datetime import date
+from django.db import transaction, IntegrityError
 from event.event_permissions import validate_event, check_event_is_exist
+from event import seats, waitlist
 
 # API endpoint to retrieve a list of events
 @swagger_auto_schema(
@@ -69,10 +73,11 @@ from event.event_permissions import validate_event, check_event_is_exist
             type=openapi.TYPE_STRING,
             description="Search events by name"
         )
-    ]
+    ] + PAGINATION_PARAMETERS
 )
 @api_view(["GET"])
 @authenticated_required
+@conditional(Event)
 def eventGetView(request, *args, **kwargs):
     """
     Retrieves a list of events.
@@ -85,12 +90,18 @@ def eventGetView(request, *args, **kwargs):
     filters = {
         "date": request.query_params.get("date"),
         "time": request.query_params.get("time"),
-        "status": request.query_params.get("status"),
-        "capacity": request.query_params.get("capacity")
+        "status": request.query_params.get("status")
     }
     filters = {k: v for k, v in filters.items() if v}
     queryset = queryset.filter(**filters)
 
+    # Capacity is derived from the seat counter
+    capacity = request.query_params.get("capacity")
+    if capacity == "completed":
+        queryset = queryset.filter(seats.FULL)
+    elif capacity == "empty":
+        queryset = queryset.exclude(seats.FULL)
+
     # Apply search filter
     search_query = request.query_params.get("search")
     if search_query:
@@ -103,8 +114,7 @@ def eventGetView(request, *args, **kwargs):
         queryset = queryset.filter(date__gte=user_date)
 
     # Paginate the results
-    paginated = PageNumberPagination()
-    paginated.page_size = 10
+    paginated = get_paginator(request)
     paginated_queryset = paginated.paginate_queryset(queryset, request)
     serializer = EventSerializer(paginated_queryset, many=True)
     return paginated.get_paginated_response(serializer.data)
@@ -133,7 +143,15 @@ def eventPostView(request, *args, **kwargs):
     """
     serializer = EventSerializer(data=request.data)
     if serializer.is_valid():
-        serializer.save()
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except IntegrityError:
+            # Another event took this date and time since validate_event ran.
+            return Response(
+                {"detail": "This date and time already exist for event"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         return Response(
             {"detail": "Event created successfully", "data": serializer.data},
             status=status.HTTP_201_CREATED
@@ -172,7 +190,18 @@ def eventPutView(request, *args, **kwargs):
     event = kwargs.get("event")
     serializer = EventSerializer(event, data=request.data, partial=True)
     if serializer.is_valid():
-        serializer.save()
+        try:
+            with transaction.atomic():
+                serializer.save()
+                # Added seats go to the waitlisted users first.
+                if "max_seats" in serializer.validated_data:
+                    waitlist.fill(event.id)
+        except IntegrityError:
+            # Another event took this date and time since validate_event ran.
+            return Response(
+                {"detail": "This date and time already exist for event"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         return Response(
             {"detail": "Event updated successfully!", "data": serializer.data},
             status=status.HTTP_200_OK
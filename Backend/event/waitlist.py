@@ -0,0 +1,101 @@
+"""
+Event Waitlist
+==============
+This module queues users for full events and registers them when a seat frees up.
+
+Functions:
+1. `join` - Puts a user at the end of the waitlist of an event and returns their position.
+2. `leave` - Takes a user off the waitlist of an event.
+3. `promote` - Registers the first waitlisted user of an event if a seat is free.
+4. `fill` - Promotes waitlisted users until the event is full or nobody is waiting.
+5. `position` - Returns the position of a user on the waitlist of an event.
+
+Key Features:
+- Every entry holds a ticket; the event holds the tickets still waiting as the range
+  (`waitlist_start`, `waitlist_end`]. A position is `ticket - waitlist_start`, read with one lookup on the
+  unique (user, event) key, whatever the length of the waitlist.
+- Promoting the head only moves `waitlist_start`. An entry leaving from the middle renumbers the tickets
+  behind it, so positions stay exact.
+- Every change of a waitlist first locks the row of its event; `promote` additionally picks the first entry
+  with `select_for_update(skip_locked=True)`, so an entry locked by a concurrent leave is passed over
+  instead of waited for.
+- Removals close their gap from a `post_delete` receiver, so entries deleted with their user are handled too.
+"""
+
+from django.db import transaction
+from django.db.models import F
+from event.models import Event, Registration, WaitlistEntry
+from event import seats
+
+def _lock_event(event_id):
+    return Event.objects.select_for_update().only("waitlist_start", "waitlist_end").filter(pk=event_id).first()
+
+@transaction.atomic
+def join(user_id, event_id):
+    """
+    Adds the user to the end of the waitlist and returns their position.
+    Raises `IntegrityError` if the user is on the waitlist already.
+    """
+    Event.objects.filter(pk=event_id).update(waitlist_end=F("waitlist_end") + 1)
+    event = Event.objects.only("waitlist_start", "waitlist_end").get(pk=event_id)
+    WaitlistEntry.objects.create(user_id=user_id, event_id=event_id, ticket=event.waitlist_end)
+    return event.waitlist_end - event.waitlist_start
+
+@transaction.atomic
+def leave(user_id, event_id):
+    """
+    Takes the user off the waitlist; returns False if they were not on it.
+    """
+    if _lock_event(event_id) is None:
+        return False
+    deleted, _ = WaitlistEntry.objects.filter(user_id=user_id, event_id=event_id).delete()
+    return bool(deleted)
+
+def close_gap(entry):
+    """
+    Moves the tickets of the waitlist of `entry.event` after `entry` was removed.
+    """
+    with transaction.atomic():
+        event = _lock_event(entry.event_id)
+        if event is None:
+            return
+        if entry.ticket == event.waitlist_start + 1:
+            Event.objects.filter(pk=event.pk).update(waitlist_start=F("waitlist_start") + 1)
+        else:
+            WaitlistEntry.objects.filter(event_id=event.pk, ticket__gt=entry.ticket).update(ticket=F("ticket") - 1)
+            Event.objects.filter(pk=event.pk).update(waitlist_end=F("waitlist_end") - 1)
+
+@transaction.atomic
+def promote(event_id):
+    """
+    Registers the first waitlisted user if the event has a free seat; returns the `Registration` or None.
+    """
+    if _lock_event(event_id) is None:
+        return None
+    entry = WaitlistEntry.objects.select_for_update(skip_locked=True).filter(event_id=event_id).order_by("ticket").first()
+    if entry is None or not seats.reserve(event_id):
+        return None
+    registration = Registration.objects.create(user_id=entry.user_id, event_id=event_id)
+    entry.delete()
+    return registration
+
+def fill(event_id):
+    """
+    Promotes waitlisted users while seats are free; returns the new registrations.
+    """
+    registrations = []
+    while (registration := promote(event_id)) is not None:
+        registrations.append(registration)
+    return registrations
+
+def position(user_id, event_id):
+    """
+    Returns (position, waitlist length) of the user, or None if they are not waiting.
+    """
+    row = WaitlistEntry.objects.filter(user_id=user_id, event_id=event_id).values_list(
+        "ticket", "event__waitlist_start", "event__waitlist_end"
+    ).first()
+    if row is None:
+        return None
+    ticket, start, end = row
+    return ticket - start, end - start
@@ -0,0 +1,56 @@
+"""
+Waitlist API
+============
+This module lets users follow and leave the waitlists of full events.
+The API includes the following endpoints:
+1. GET `/event/<event_id>/waitlist/` - The position of the requesting user on the waitlist of the event.
+2. DELETE `/event/<event_id>/waitlist/delete/` - Leave the waitlist of the event.
+
+Key Features:
+- Users join a waitlist by registering for a full event (POST `/event/register/create/`).
+- A position is read with one lookup, whatever the length of the waitlist (see event/waitlist.py).
+"""
+
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from common.is_authenticated import authenticated_required
+from event import waitlist
+
+# API endpoint to retrieve the waitlist position of the requesting user
+@api_view(["GET"])
+@authenticated_required
+def waitlistGetView(request, *args, **kwargs):
+    """
+    Returns the position of the requesting user on the waitlist of an event, and the length of the waitlist.
+    """
+    event_id = kwargs.get("event_id")
+    found = waitlist.position(request.user.id, event_id)
+    if found is None:
+        return Response(
+            {"detail": "You are not on the waitlist of this event"},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    position, length = found
+    return Response(
+        {"event": event_id, "position": position, "length": length},
+        status=status.HTTP_200_OK
+    )
+
+# API endpoint to leave the waitlist of an event
+@api_view(["DELETE"])
+@authenticated_required
+def waitlistDeleteView(request, *args, **kwargs):
+    """
+    Takes the requesting user off the waitlist of an event.
+    """
+    if not waitlist.leave(request.user.id, kwargs.get("event_id")):
+        return Response(
+            {"detail": "You are not on the waitlist of this event"},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return Response(
+        {"detail": "Left the waitlist successfully!"},
+        status=status.HTTP_204_NO_CONTENT
+    )
@@ -36,6 +36,10 @@ class StudentEventAdmin(admin.ModelAdmin):
         "event_type",
     ]
     list_per_page = 10
+    list_select_related = [
+        "student_profile__students",
+        "event_type",
+    ]
     list_editable = [
         "note",
     ]
@@ -57,6 +61,9 @@ class StudentProfileAdmin(admin.ModelAdmin):
         "level",
     ]
     list_per_page = 10
+    list_select_related = [
+        "students",
+    ]
     list_editable = [
         "total_point",
         "level",
@@ -0,0 +1,268 @@
+"""
+Leaderboard
+===========
+This module keeps student rankings precomputed so that top-N lists and rank lookups never sort `StudentProfile`.
+
+Boards:
+- `("school", None)` ranks every student profile.
+- `("classroom", <classroom id>)` ranks the students of a classroom.
+- `("field", <field id>)` ranks the students of every classroom of a field.
+
+Functions:
+1. `get_backend` - Returns the backend configured by `settings.LEADERBOARD_BACKEND`.
+2. `top` - Returns the first `count` ranked entries of a board.
+3. `ranked` - Returns a lazy, sliceable sequence of the ranked entries of a board (for pagination).
+4. `rank_with_neighbours` - Returns the rank of a profile and the entries around it.
+5. `record` - Applies new (level, total points) values to the loaded boards, after the transaction commits.
+6. `remove` - Drops profiles from the loaded boards, after the transaction commits.
+7. `invalidate` - Drops loaded boards so that they are rebuilt on next use.
+
+Key Features:
+- Students are ordered by level, then total points (both descending), then profile id; ranks start at 1.
+- A board is loaded from the database on first use, then kept up to date incrementally by the ledger and signals.
+- Rank lookups are a binary search over the sorted board; a page is a slice of it.
+- Backends implement `BaseLeaderboardBackend`; `LocalLeaderboardBackend` keeps the boards in process memory and
+  reloads them after `settings.LEADERBOARD_TTL` seconds so that processes converge on writes made by others.
+"""
+
+import time
+from bisect import bisect_left, insort
+from collections import namedtuple
+from threading import RLock
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+from gamification.models import StudentProfile
+
+SCOPES = ("school", "classroom", "field")
+
+Entry = namedtuple("Entry", ["profile_id", "student_id", "level", "total_point"])
+
+def _key(entry):
+    return (-entry.level, -entry.total_point, entry.profile_id)
+
+class BaseLeaderboardBackend:
+    """
+    Storage interface of the leaderboard. A board is identified by a (scope, id) tuple.
+    """
+    def is_loaded(self, board):
+        raise NotImplementedError
+
+    def load(self, board, entries):
+        """Replaces the content of `board` with `entries`."""
+        raise NotImplementedError
+
+    def update(self, entries):
+        """
+        Applies `entries` to every loaded board: the school board gains unknown
+        profiles, the other boards only update the profiles they already hold.
+        """
+        raise NotImplementedError
+
+    def remove(self, profile_ids):
+        raise NotImplementedError
+
+    def invalidate(self, scopes=None):
+        """Drops the loaded boards of the given scopes (all boards if None)."""
+        raise NotImplementedError
+
+    def size(self, board):
+        raise NotImplementedError
+
+    def page(self, board, start, stop):
+        """Returns the entries ranked `start + 1` to `stop`."""
+        raise NotImplementedError
+
+    def rank(self, board, profile_id):
+        """Returns the 1-based rank of `profile_id`, or None if it is not on the board."""
+        raise NotImplementedError
+
+class _Board:
+    __slots__ = ("keys", "entries", "loaded_at")
+
+    def __init__(self, entries):
+        self.entries = {entry.profile_id: entry for entry in entries}
+        self.keys = sorted(_key(entry) for entry in self.entries.values())
+        self.loaded_at = time.monotonic()
+
+    def put(self, entry):
+        previous = self.entries.get(entry.profile_id)
+        if previous is not None:
+            self.discard(previous.profile_id)
+        self.entries[entry.profile_id] = entry
+        insort(self.keys, _key(entry))
+
+    def discard(self, profile_id):
+        entry = self.entries.pop(profile_id, None)
+        if entry is not None:
+            del self.keys[bisect_left(self.keys, _key(entry))]
+
+class LocalLeaderboardBackend(BaseLeaderboardBackend):
+    """
+    Keeps each board as a sorted list of ranking keys plus a dict of entries, in process memory.
+    A board dropped by another thread between `_ensure` and a read is reloaded by the read.
+    """
+    def __init__(self, ttl=None):
+        self.ttl = ttl if ttl is not None else getattr(settings, "LEADERBOARD_TTL", 300)
+        self._boards = {}
+        self._lock = RLock()
+
+    def _get(self, board):
+        loaded = self._boards.get(board)
+        if loaded is not None and self.ttl and time.monotonic() - loaded.loaded_at > self.ttl:
+            return None
+        return loaded
+
+    def is_loaded(self, board):
+        return self._get(board) is not None
+
+    def load(self, board, entries):
+        loaded = _Board(entries)
+        with self._lock:
+            self._boards[board] = loaded
+
+    def update(self, entries):
+        with self._lock:
+            for board, loaded in self._boards.items():
+                for entry in entries:
+                    if board[0] == "school" or entry.profile_id in loaded.entries:
+                        loaded.put(entry)
+
+    def remove(self, profile_ids):
+        with self._lock:
+            for loaded in self._boards.values():
+                for profile_id in profile_ids:
+                    loaded.discard(profile_id)
+
+    def invalidate(self, scopes=None):
+        with self._lock:
+            for board in list(self._boards):
+                if scopes is None or board[0] in scopes:
+                    del self._boards[board]
+
+    def _loaded(self, board):
+        """
+        Returns `board`, reloading it if an invalidation or the TTL dropped it since the caller's `_ensure`.
+        """
+        with self._lock:
+            loaded = self._get(board)
+        if loaded is None:
+            # Read outside the lock, like a first load.
+            loaded = _Board(_entries(board))
+            with self._lock:
+                self._boards[board] = loaded
+        return loaded
+
+    def size(self, board):
+        loaded = self._loaded(board)
+        with self._lock:
+            return len(loaded.keys)
+
+    def page(self, board, start, stop):
+        loaded = self._loaded(board)
+        with self._lock:
+            return [loaded.entries[key[2]] for key in loaded.keys[start:stop]]
+
+    def rank(self, board, profile_id):
+        loaded = self._loaded(board)
+        with self._lock:
+            entry = loaded.entries.get(profile_id)
+            if entry is None:
+                return None
+            return bisect_left(loaded.keys, _key(entry)) + 1
+
+_backend = None
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        path = getattr(settings, "LEADERBOARD_BACKEND", "gamification.leaderboard.LocalLeaderboardBackend")
+        _backend = import_string(path)()
+    return _backend
+
+def _entries(board):
+    """
+    Reads the entries of `board` from the database.
+    """
+    scope, board_id = board
+    profiles = StudentProfile.objects.all()
+    if scope == "classroom":
+        profiles = profiles.filter(students__classroom=board_id)
+    elif scope == "field":
+        profiles = profiles.filter(students__classroom__field=board_id).distinct()
+    return [
+        Entry(*row) for row in profiles.values_list("id", "students_id", "level", "total_point").iterator(chunk_size=5000)
+    ]
+
+def _ensure(board):
+    """
+    Loads `board` from the database if the backend does not hold it yet.
+    """
+    backend = get_backend()
+    if not backend.is_loaded(board):
+        backend.load(board, _entries(board))
+    return backend
+
+def top(board, count):
+    return _ensure(board).page(board, 0, count)
+
+class RankedEntries:
+    """
+    A sliceable view of a board, so that it can be handed to a paginator like a queryset.
+    """
+    def __init__(self, board):
+        self.board = board
+        self.backend = _ensure(board)
+
+    def __len__(self):
+        return self.backend.size(self.board)
+
+    def count(self):
+        return len(self)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start = index.start or 0
+            stop = len(self) if index.stop is None else index.stop
+            return [
+                (rank, entry)
+                for rank, entry in enumerate(self.backend.page(self.board, start, stop), start=start + 1)
+            ]
+        entries = self.backend.page(self.board, index, index + 1)
+        if not entries:
+            raise IndexError(index)
+        return (index + 1, entries[0])
+
+def ranked(board):
+    return RankedEntries(board)
+
+def rank_with_neighbours(board, profile_id, radius=2):
+    """
+    Returns the rank of `profile_id` on `board` and the ranked entries from
+    `radius` places above it to `radius` places below it, or (None, []) if
+    the profile is not on the board.
+    """
+    backend = _ensure(board)
+    rank = backend.rank(board, profile_id)
+    if rank is None:
+        return None, []
+    start = max(rank - 1 - radius, 0)
+    entries = backend.page(board, start, rank + radius)
+    return rank, list(enumerate(entries, start=start + 1))
+
+def record(entries):
+    """
+    Applies `entries` to the loaded boards once the current transaction commits,
+    so that a rolled back award never shows up in the rankings.
+    """
+    entries = list(entries)
+    if entries:
+        transaction.on_commit(lambda: get_backend().update(entries))
+
+def remove(profile_ids):
+    profile_ids = list(profile_ids)
+    if profile_ids:
+        transaction.on_commit(lambda: get_backend().remove(profile_ids))
+
+def invalidate(scopes=None):
+    get_backend().invalidate(scopes)
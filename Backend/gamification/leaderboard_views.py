@@ -0,0 +1,149 @@
+"""
+Leaderboard API
+===============
+This module serves the rankings kept by `gamification.leaderboard`.
+1. GET `/gamification/leaderboard/` - Paginated ranks of a board (school, classroom or field).
+2. GET `/gamification/leaderboard/me/` - The rank of the requesting student and their neighbours on a board.
+
+Key Features:
+- Ranks are read from the precomputed board; no request sorts the `StudentProfile` table.
+- `scope` selects the board and `id` the classroom or field. For `/me/` the student's own classroom (or its field) is used when `id` is omitted.
+- Page mode pagination only (`page`, `page_size`, `count`); ranks are positions, not rows.
+"""
+
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from common.is_authenticated import authenticated_required
+from common.access import get_access
+from common import refcache
+from common.pagination import PagePagination, PAGINATION_PARAMETERS
+from classroom.models import ClassRoom
+from field.models import Field
+from gamification.models import StudentProfile
+from gamification import leaderboard
+
+fields = refcache.register(Field)
+
+BOARD_PARAMETERS = [
+    openapi.Parameter("scope", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Board to read (school, classroom, field), defaults to school"),
+    openapi.Parameter("id", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description="Classroom or field id for the classroom and field scopes"),
+]
+
+def _entry(rank, entry):
+    return {
+        "rank":rank,
+        "students":entry.student_id,
+        "total_point":entry.total_point,
+        "level":entry.level,
+    }
+
+def _board(request, own=False):
+    """
+    Returns ((scope, id), None) for the requested board, or (None, error response).
+    With `own`, a missing classroom or field id defaults to the requesting user's first classroom.
+    """
+    scope = request.query_params.get("scope", "school")
+    if scope not in leaderboard.SCOPES:
+        return None, Response(
+            {"detail":f"`scope` must be one of: {', '.join(leaderboard.SCOPES)}."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if scope == "school":
+        return ("school", None), None
+
+    board_id = request.query_params.get("id")
+    if not board_id and own:
+        enrolled = get_access(request).enrolled_classrooms
+        if enrolled:
+            classroom_id = min(enrolled)
+            board_id = classroom_id if scope == "classroom" else enrolled[classroom_id]
+    try:
+        board_id = int(board_id)
+    except (TypeError, ValueError):
+        return None, Response(
+            {"detail":"`id` is required for the classroom and field scopes."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    model = ClassRoom if scope == "classroom" else Field
+    exists = fields.exists(board_id) if model is Field else ClassRoom.objects.filter(id=board_id).exists()
+    if not exists:
+        return None, Response(
+            {"detail":f"{model.__name__} not found."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return (scope, board_id), None
+
+@swagger_auto_schema(
+    method="get",
+    manual_parameters=BOARD_PARAMETERS + [
+        parameter for parameter in PAGINATION_PARAMETERS if parameter.name not in ("pagination", "cursor")
+    ]
+)
+@api_view(["GET"])
+@authenticated_required
+def getLeaderboardView(request, *args, **kwargs):
+    """
+    Returns a page of ranked students of the selected board.
+    """
+    board, error = _board(request)
+    if error:
+        return error
+
+    paginator = PagePagination()
+    page = paginator.paginate_queryset(leaderboard.ranked(board), request)
+    return paginator.get_paginated_response([_entry(rank, entry) for rank, entry in page])
+
+@swagger_auto_schema(
+    method="get",
+    manual_parameters=BOARD_PARAMETERS + [
+        openapi.Parameter("neighbours", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description="Number of students shown above and below, defaults to 2 (max 10)"),
+    ]
+)
+@api_view(["GET"])
+@authenticated_required
+def getMyRankView(request, *args, **kwargs):
+    """
+    Returns the rank of the requesting student on the selected board, with the students ranked around them.
+    - Only students have a rank.
+    """
+    req_user = request.user
+    if not get_access(request).is_student:
+        return Response(
+            {"detail":"Only students have a rank."},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    try:
+        radius = min(max(int(request.query_params.get("neighbours", 2)), 0), 10)
+    except ValueError:
+        return Response(
+            {"detail":"Invalid data"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    board, error = _board(request, own=True)
+    if error:
+        return error
+
+    profile_id = StudentProfile.objects.filter(students=req_user).values_list("id", flat=True).first()
+    rank, neighbours = leaderboard.rank_with_neighbours(board, profile_id, radius) if profile_id else (None, [])
+    if rank is None:
+        return Response(
+            {"detail":"You are not ranked on this leaderboard."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    return Response(
+        {
+            "scope":board[0],
+            "id":board[1],
+            "rank":rank,
+            "total":len(leaderboard.ranked(board)),
+            "neighbours":[_entry(rank, entry) for rank, entry in neighbours],
+        },
+        status=status.HTTP_200_OK
+    )
@@ -0,0 +1,132 @@
+"""
+Gamification Ledger
+===================
+This module is the single place where gamification points are awarded to students.
+
+Functions:
+1. `get_event_type` - Returns the `EventType` row for a code from the reference cache.
+2. `award_points` - Records a `StudentEvent` for each student and adds the event points to their profile.
+3. `refresh_levels` - Recomputes the level of many profiles in one pass.
+4. `clear_event_type_cache` - Drops the cached `EventType` rows (done automatically when an `EventType` changes).
+
+Key Features:
+- Totals are increased incrementally with an `F()` expression instead of re-summing every event of the student.
+- Many students are awarded in one transaction with a fixed number of queries.
+- Levels are resolved from the cached thresholds and written with one `UPDATE` per distinct level.
+- The new totals and levels are pushed to the leaderboard, so rankings never need a resort.
+"""
+
+from collections import Counter, defaultdict
+from django.db import transaction
+from django.db.models import F
+from common import refcache
+from gamification.models import EventType, StudentEvent, StudentProfile
+from gamification.levels import levels_for_points
+from gamification import leaderboard
+
+# Default rows for the event types awarded by the application itself.
+# They are created on first use so a fresh database needs no fixtures.
+EVENT_TYPES = {
+    "attend_on_time": {
+        "name":"To be present",
+        "description":"Student attended in school.",
+        "point":5,
+        "note":"Attenting in school",
+    },
+    "score_20": {
+        "name":"Excellent Score",
+        "description":"Student got a full score.",
+        "point":10,
+        "note":"Got full score in exam",
+    },
+}
+
+event_types = refcache.register(EventType)
+
+def get_event_type(code):
+    """
+    Returns the `EventType` for the given code, creating it from `EVENT_TYPES` if needed.
+    """
+    event_type = event_types.index("code").get(code)
+    if event_type is None:
+        defaults = {k: v for k, v in EVENT_TYPES.get(code, {}).items() if k != "note"}
+        event_type, _ = EventType.objects.get_or_create(code=code, defaults=defaults)
+        # Creating the row invalidated the table; reload it now rather than on the next award.
+        event_type = event_types.index("code").get(code, event_type)
+    return event_type
+
+def clear_event_type_cache():
+    event_types.invalidate()
+
+def award_points(student_ids, code, note=None):
+    """
+    Awards the event `code` to every student in `student_ids`.
+    - A student listed several times is awarded several times.
+    - Raises ValueError if any of the students has no `StudentProfile`.
+
+    Returns:
+        dict: The new total points of each awarded profile, keyed by profile id.
+    """
+    awards = Counter(student_ids)
+    if not awards:
+        return {}
+
+    event_type = get_event_type(code)
+    if note is None:
+        note = EVENT_TYPES.get(code, {}).get("note", event_type.name)
+
+    with transaction.atomic():
+        profile_ids = dict(
+            StudentProfile.objects.filter(
+                students_id__in=awards
+            ).values_list("students_id", "id")
+        )
+        if len(profile_ids) != len(awards):
+            raise ValueError("Student Profile not found.")
+
+        StudentEvent.objects.bulk_create([
+            StudentEvent(
+                student_profile_id=profile_ids[student_id],
+                event_type=event_type,
+                note=note
+            )
+            for student_id, count in awards.items()
+            for _ in range(count)
+        ])
+
+        # One UPDATE per distinct award count, which is a single statement
+        # for the usual case of every student being awarded once.
+        by_count = defaultdict(list)
+        for student_id, count in awards.items():
+            by_count[count].append(profile_ids[student_id])
+        for count, ids in by_count.items():
+            StudentProfile.objects.filter(id__in=ids).update(
+                total_point=F("total_point") + event_type.point * count
+            )
+
+        return refresh_levels(profile_ids.values())
+
+def refresh_levels(profile_ids):
+    """
+    Recomputes the level of the given profiles from their stored totals
+    and passes the results to the leaderboard.
+
+    Returns:
+        dict: The total points of each profile, keyed by profile id.
+    """
+    rows = list(StudentProfile.objects.filter(id__in=profile_ids).values_list("id", "students_id", "total_point", "level"))
+    new_levels = levels_for_points(total_point for _, _, total_point, _ in rows)
+
+    totals = {}
+    entries = []
+    changed = defaultdict(list)
+    for (profile_id, student_id, total_point, level), new_level in zip(rows, new_levels):
+        totals[profile_id] = total_point
+        entries.append(leaderboard.Entry(profile_id, student_id, new_level, total_point))
+        if new_level != level:
+            changed[new_level].append(profile_id)
+
+    for level, ids in changed.items():
+        StudentProfile.objects.filter(id__in=ids).update(level=level)
+    leaderboard.record(entries)
+    return totals
@@ -0,0 +1,56 @@
+"""
+Level Resolution
+================
+This module resolves a student's level from their total points without querying the database on every award.
+
+Functions:
+1. `level_for_points` - Returns the level reached with the given total points.
+2. `levels_for_points` - Returns the levels reached for many point totals at once.
+3. `invalidate` - Drops the cached thresholds (done automatically when a `LevelThreshold` changes).
+
+Key Features:
+- The `LevelThreshold` table is held by the reference cache (common/refcache.py) as two sorted arrays.
+- A level is found with a binary search over the minimum points instead of a linear walk.
+- The arrays are rebuilt lazily after a `LevelThreshold` is saved or deleted, in every process.
+"""
+
+from bisect import bisect_right
+from common import refcache
+from gamification.models import LevelThreshold
+
+# Level of a student whose points are below every threshold.
+BASE_LEVEL = 1
+
+def _build():
+    rows = LevelThreshold.objects.order_by("min_points").values_list("min_points", "level")
+    min_points, levels = [], []
+    for row_min_points, row_level in rows:
+        min_points.append(row_min_points)
+        levels.append(row_level)
+    return (min_points, levels)
+
+thresholds = refcache.register(LevelThreshold, loader=_build)
+
+def _load():
+    return thresholds.value()
+
+def _resolve(total_point, min_points, levels):
+    index = bisect_right(min_points, total_point)
+    return levels[index - 1] if index else BASE_LEVEL
+
+def level_for_points(total_point):
+    min_points, levels = _load()
+    return _resolve(total_point, min_points, levels)
+
+def levels_for_points(totals):
+    """
+    Resolves the level of every total in `totals`.
+
+    Returns:
+        list: The levels, in the same order as `totals`.
+    """
+    min_points, levels = _load()
+    return [_resolve(total_point, min_points, levels) for total_point in totals]
+
+def invalidate():
+    thresholds.invalidate()
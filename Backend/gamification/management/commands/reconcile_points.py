@@ -0,0 +1,57 @@
+"""
+Rebuilds `StudentProfile.total_point` and `level` from the `StudentEvent` history.
+
+The ledger keeps totals up to date incrementally; this command is the periodic
+audit that recomputes them from scratch and reports every profile that drifted.
+
+Usage:
+    python manage.py reconcile_points [--dry-run]
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import OuterRef, Subquery, Sum, Value, IntegerField
+from django.db.models.functions import Coalesce
+from gamification.models import StudentEvent, StudentProfile
+from gamification.ledger import refresh_levels
+
+class Command(BaseCommand):
+    help = "Rebuild student point totals and levels from their StudentEvent history."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the profiles whose totals drifted, do not fix them."
+        )
+
+    def handle(self, *args, **options):
+        event_totals = StudentEvent.objects.filter(
+            student_profile=OuterRef("pk")
+        ).values("student_profile").annotate(
+            total=Sum("event_type__point")
+        ).values("total")
+
+        profiles = StudentProfile.objects.annotate(
+            expected=Coalesce(Subquery(event_totals), Value(0), output_field=IntegerField())
+        ).values_list("id", "students__username", "total_point", "expected")
+
+        drifted = {}
+        for profile_id, username, total_point, expected in profiles.iterator(chunk_size=2000):
+            if total_point != expected:
+                drifted[profile_id] = expected
+                self.stdout.write(f"{username}: stored {total_point}, expected {expected}")
+
+        if options["dry_run"] or not drifted:
+            self.stdout.write(self.style.SUCCESS(f"{len(drifted)} profile(s) drifted."))
+            return
+
+        with transaction.atomic():
+            StudentProfile.objects.bulk_update(
+                [StudentProfile(id=profile_id, total_point=total) for profile_id, total in drifted.items()],
+                ["total_point"],
+                batch_size=1000
+            )
+            refresh_levels(drifted.keys())
+
+        self.stdout.write(self.style.SUCCESS(f"{len(drifted)} profile(s) reconciled."))
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventType',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=100, unique=True, verbose_name='Code of work')),
+                ('name', models.CharField(max_length=255, verbose_name='Name')),
+                ('description', models.TextField(verbose_name='Description')),
+                ('point', models.IntegerField(verbose_name='Point')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LevelThreshold',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('level', models.IntegerField(unique=True)),
+                ('min_points', models.IntegerField()),
+            ],
+            options={
+                'ordering': ['min_points'],
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_point', models.IntegerField(default=0, verbose_name='Total points')),
+                ('level', models.IntegerField(default=1, verbose_name='Level')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StudentEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('note', models.CharField(max_length=255)),
+                ('event_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='gamification.eventtype', verbose_name='Event Type')),
+            ],
+        ),
+    ]
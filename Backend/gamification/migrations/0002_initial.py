@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('gamification', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentprofile',
+            name='students',
+            field=models.OneToOneField(limit_choices_to={'user_type': 'student'}, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='Student'),
+        ),
+        migrations.AddField(
+            model_name='studentevent',
+            name='student_profile',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_event', to='gamification.studentprofile'),
+        ),
+    ]
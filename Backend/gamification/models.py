@@ -28,24 +28,20 @@ class StudentProfile(models.Model):
         verbose_name="Level"
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-level", "-total_point"], name="profile_ranking_idx"),
+        ]
+
     def recalculate_total_points(self):
         total = self.student_event.aggregate(total=Sum('event_type__point'))['total'] or 0
         self.total_point = total
         self.save()
         
     def calculate_level(self):
-        from gamification.models import LevelThreshold
-
-        thresholds = LevelThreshold.objects.order_by('min_points')
-        new_level = 1
-
-        for threshold in thresholds:
-            if self.total_point >= threshold.min_points:
-                new_level = threshold.level
-            else:
-                break
+        from gamification.levels import level_for_points
 
-        self.level = new_level
+        self.level = level_for_points(self.total_point)
         self.save()
 
     def __str__(self):
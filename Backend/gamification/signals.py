@@ -1,9 +1,33 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver 
 from user.models import User 
+from classroom.models import ClassRoom
 from gamification.models import StudentProfile
+from gamification import leaderboard
+from gamification.tasks import create_student_profile as create_student_profile_task
 
 @receiver(post_save, sender=User)
 def create_student_profile(sender, instance, created, **kwargs):
     if created and instance.user_type == "student":
-        StudentProfile.objects.get_or_create(students=instance)
\ No newline at end of file
+        create_student_profile_task.dispatch(instance.pk, idempotency_key=f"student_profile:{instance.pk}")
+
+@receiver(post_save, sender=StudentProfile)
+def update_leaderboard(sender, instance, **kwargs):
+    leaderboard.record([
+        leaderboard.Entry(instance.pk, instance.students_id, instance.level, instance.total_point)
+    ])
+
+@receiver(post_delete, sender=StudentProfile)
+def remove_from_leaderboard(sender, instance, **kwargs):
+    leaderboard.remove([instance.pk])
+
+@receiver(m2m_changed, sender=ClassRoom.students.through)
+def invalidate_classroom_leaderboards(sender, action, **kwargs):
+    # Memberships rarely change; the classroom and field boards are rebuilt on next use.
+    if action in ("post_add", "post_remove", "post_clear"):
+        leaderboard.invalidate(["classroom", "field"])
+
+@receiver(post_save, sender=ClassRoom)
+@receiver(post_delete, sender=ClassRoom)
+def invalidate_field_leaderboards(sender, **kwargs):
+    leaderboard.invalidate(["classroom", "field"])
@@ -0,0 +1,21 @@
+from common.tasks import task
+from gamification.ledger import award_points
+from gamification.models import StudentProfile
+
+@task(name="gamification.award_points")
+def award_points_task(student_ids, code):
+    # Retried while a new student's profile is still being created. In a batch,
+    # the students still without one get a task of their own, so the others are
+    # awarded now and not again on a retry.
+    if len(set(student_ids)) > 1:
+        with_profile = set(
+            StudentProfile.objects.filter(students_id__in=student_ids).values_list("students_id", flat=True)
+        )
+        for student_id in sorted(set(student_ids) - with_profile):
+            award_points_task.dispatch([student_id] * student_ids.count(student_id), code)
+        student_ids = [student_id for student_id in student_ids if student_id in with_profile]
+    award_points(student_ids, code)
+
+@task(name="gamification.create_student_profile")
+def create_student_profile(user_id):
+    StudentProfile.objects.get_or_create(students_id=user_id)
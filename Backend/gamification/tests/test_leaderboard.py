@@ -0,0 +1,111 @@
+import pytest
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from gamification.models import StudentProfile
+from gamification.ledger import award_points
+from gamification import leaderboard
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestLeaderboard:
+    def setup_method(self):
+        field = Field.objects.create(name="Math")
+        self.classroom = ClassRoom.objects.create(name="10-A", base=10, field=field)
+        self.other_classroom = ClassRoom.objects.create(name="10-B", base=10, field=field)
+        self.students = [create_user(f"test_student{index}", "student", index) for index in range(1, 7)]
+        self.classroom.students.add(*self.students[:3])
+        self.other_classroom.students.add(*self.students[3:])
+        for points, student in zip([50, 10, 40, 30, 60, 20], self.students):
+            StudentProfile.objects.filter(students=student).update(total_point=points)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.students[1])
+
+    def test_school_board_is_ranked_by_level_then_points(self):
+        # Act
+        response = self.client.get("/gamification/leaderboard/", {"page_size": 4})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 6
+        assert [row["students"] for row in response.data["results"]] == [
+            self.students[4].id, self.students[0].id, self.students[2].id, self.students[3].id
+        ]
+        assert [row["rank"] for row in response.data["results"]] == [1, 2, 3, 4]
+
+    def test_classroom_and_field_boards_hold_their_members(self):
+        # Act
+        classroom = self.client.get("/gamification/leaderboard/", {"scope": "classroom", "id": self.other_classroom.id})
+        field = self.client.get("/gamification/leaderboard/", {"scope": "field", "id": self.classroom.field_id})
+
+        # Assert
+        assert [row["students"] for row in classroom.data["results"]] == [
+            self.students[4].id, self.students[3].id, self.students[5].id
+        ]
+        assert field.data["count"] == 6
+
+    def test_board_invalidated_after_ensure_is_reloaded_by_reads(self):
+        # Arrange
+        board = ("classroom", self.classroom.id)
+        entries = leaderboard.ranked(board)
+        profile_id = StudentProfile.objects.get(students=self.students[0]).id
+
+        # Act / Assert
+        # As if a classroom save in another thread ran between the load and each read.
+        leaderboard.invalidate()
+        assert len(entries) == 3
+        leaderboard.invalidate()
+        assert [entry.student_id for _, entry in entries[0:2]] == [self.students[0].id, self.students[2].id]
+        leaderboard.invalidate()
+        assert leaderboard.get_backend().rank(board, profile_id) == 1
+
+    def test_my_rank_with_neighbours_in_my_classroom(self):
+        # Act
+        response = self.client.get("/gamification/leaderboard/me/", {"scope": "classroom", "neighbours": 1})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["rank"] == 3
+        assert response.data["total"] == 3
+        assert [row["rank"] for row in response.data["neighbours"]] == [2, 3]
+
+    def test_awards_move_students_without_reloading(self, django_assert_num_queries, django_capture_on_commit_callbacks):
+        # Arrange
+        self.client.get("/gamification/top-students/")
+
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            award_points([self.students[1].id] * 11, "attend_on_time")
+
+        # Assert
+        with django_assert_num_queries(0):
+            response = self.client.get("/gamification/top-students/")
+        assert response.data[0] == {"students": self.students[1].id, "total_point": 65, "level": 1}
+
+    def test_if_user_is_not_student_my_rank_return_403(self):
+        # Arrange
+        self.client.force_authenticate(user=create_user("test_teacher1", "teacher", 20))
+
+        # Act
+        response = self.client.get("/gamification/leaderboard/me/")
+
+        # Assert
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_scope_is_invalid_return_400(self):
+        # Act
+        response = self.client.get("/gamification/leaderboard/", {"scope": "galaxy"})
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,87 @@
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+from user.models import User
+from gamification.models import StudentProfile, StudentEvent, LevelThreshold, EventType
+from gamification.ledger import award_points, get_event_type, event_types
+
+def create_student(index):
+    return User.objects.create_user(
+        username=f"test_student{index}",
+        password="string1234",
+        email=f"student{index}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type="student"
+    )
+
+@pytest.mark.django_db
+class TestAwardPoints:
+    def test_points_are_added_incrementally_and_level_follows(self):
+        # Arrange
+        LevelThreshold.objects.create(level=2, min_points=10)
+        student1, student2 = create_student(1), create_student(2)
+
+        # Act
+        award_points([student1.id, student2.id, student1.id], "attend_on_time")
+
+        # Assert
+        profile1 = StudentProfile.objects.get(students=student1)
+        profile2 = StudentProfile.objects.get(students=student2)
+        assert (profile1.total_point, profile1.level) == (10, 2)
+        assert (profile2.total_point, profile2.level) == (5, 1)
+        assert StudentEvent.objects.count() == 3
+
+    def test_batch_runs_in_constant_queries(self, django_assert_num_queries):
+        # Arrange
+        students = [create_student(index) for index in range(1, 6)]
+        award_points([students[0].id], "score_20")
+
+        # Act / Assert
+        with django_assert_num_queries(6):
+            award_points([student.id for student in students], "score_20")
+
+    def test_event_type_created_in_rolled_back_transaction_is_not_cached(self):
+        # Arrange
+        student = create_student(1)
+
+        # Act
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                get_event_type("score_20")
+                raise RuntimeError("rolled back")
+        cached = "score_20" in event_types.index("code")
+        award_points([student.id], "score_20")
+
+        # Assert
+        assert not cached
+        assert StudentEvent.objects.get().event_type_id == EventType.objects.get(code="score_20").pk
+
+    def test_student_without_profile_raises(self):
+        # Arrange
+        teacher = User.objects.create_user(
+            username="test_teacher1",
+            password="string1234",
+            email="teacher@domain.com",
+            phone_number="09309509999",
+            national_code="0960039999",
+            user_type="teacher"
+        )
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            award_points([teacher.id], "score_20")
+
+@pytest.mark.django_db
+class TestReconcilePointsCommand:
+    def test_drifted_totals_are_rebuilt_from_events(self):
+        # Arrange
+        student = create_student(1)
+        award_points([student.id], "score_20")
+        StudentProfile.objects.filter(students=student).update(total_point=999)
+
+        # Act
+        call_command("reconcile_points")
+
+        # Assert
+        assert StudentProfile.objects.get(students=student).total_point == 10
@@ -0,0 +1,29 @@
+import pytest
+from gamification.models import LevelThreshold
+from gamification.levels import level_for_points, levels_for_points
+
+@pytest.mark.django_db
+class TestLevelResolution:
+    def test_levels_follow_thresholds(self):
+        # Arrange
+        LevelThreshold.objects.create(level=2, min_points=10)
+        LevelThreshold.objects.create(level=3, min_points=50)
+
+        # Act
+        levels = levels_for_points([0, 9, 10, 49, 50, 500])
+
+        # Assert
+        assert levels == [1, 1, 2, 2, 3, 3]
+
+    def test_thresholds_are_cached_until_changed(self, django_assert_num_queries):
+        # Arrange
+        threshold = LevelThreshold.objects.create(level=2, min_points=10)
+        level_for_points(0)
+
+        # Act / Assert
+        with django_assert_num_queries(0):
+            assert level_for_points(10) == 2
+
+        threshold.min_points = 20
+        threshold.save()
+        assert level_for_points(10) == 1
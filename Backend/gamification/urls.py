@@ -3,7 +3,13 @@ from gamification.views import (
     StudentProfileView,
     getBestStudentInSchool
 )
+from gamification.leaderboard_views import (
+    getLeaderboardView,
+    getMyRankView
+)
 urlpatterns = [
     path('gamification/student-profile/', StudentProfileView.as_view(), name='student_profile'),
     path('gamification/top-students/', getBestStudentInSchool),
+    path('gamification/leaderboard/', getLeaderboardView),
+    path('gamification/leaderboard/me/', getMyRankView),
 ]
@@ -9,11 +9,14 @@ from gamification.serializers import (
     EventTypeSerializer, 
     StudentEventSerializer
 )
-from rest_framework.pagination import PageNumberPagination
+from common.pagination import get_paginator, PAGINATION_PARAMETERS
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from rest_framework.permissions import IsAuthenticated
 from common.is_admin import admin_required
+from common.access import get_access
+from common.conditional import conditional
+from gamification import leaderboard
 
 class StudentProfileView(APIView):
     permission_classes = [IsAuthenticated]
@@ -43,17 +46,18 @@ class StudentProfileView(APIView):
                 type=openapi.TYPE_STRING,
                 description="Order by field"
             )
-        ]
+        ] + PAGINATION_PARAMETERS
     )
     def get(self, request, *args, **kwargs):
         user = request.user
-        if not user.user_type in ["admin", "student"]:
+        access = get_access(request)
+        if not access.user_type in ["admin", "student"]:
             return Response(
                 {"detail":"Only students can view their profile."},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        if (user.user_type != "admin") and (user.is_staff != True):
+        if (access.user_type != "admin") and (not access.is_staff):
             queryset = StudentProfile.objects.filter(students=user)
         else:
             queryset = StudentProfile.objects.all()
@@ -79,8 +83,7 @@ class StudentProfileView(APIView):
         else:
             queryset = queryset.order_by("-total_point")
         
-        paginator = PageNumberPagination()
-        paginator.page_size = 10
+        paginator = get_paginator(request)
         paginated_queryset = paginator.paginate_queryset(queryset, request)
         serializer = StudentProfileSerializer(paginated_queryset, many=True)
         return paginator.get_paginated_response(serializer.data)
@@ -111,7 +114,10 @@ class StudentProfileView(APIView):
         
 @api_view(["GET"])
 @authenticated_required
+@conditional(validator=lambda request: leaderboard.top(("school", None), 3))
 def getBestStudentInSchool(request, *args, **kwargs):
-    queryset = StudentProfile.objects.order_by("-level", "-total_point")[:3]
-    serializer = StudentProfileSerializer(queryset, many=True) 
-    return Response(serializer.data)
\ No newline at end of file
+    # Served from the precomputed school leaderboard instead of sorting StudentProfile.
+    return Response([
+        {"students":entry.student_id, "total_point":entry.total_point, "level":entry.level}
+        for entry in leaderboard.top(("school", None), 3)
+    ])
\ No newline at end of file
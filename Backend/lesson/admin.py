@@ -12,4 +12,5 @@ class LessonAdmin(admin.ModelAdmin):
     search_fields = ['name']
     ordering = ['name', 'teachers']
     list_per_page = 10
+    list_select_related = ['teachers']
     list_filter = ['teachers']
\ No newline at end of file
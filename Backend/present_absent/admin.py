@@ -13,6 +13,7 @@ class PresentAbsentAdmin(admin.ModelAdmin):
         "status",
         "date"
     ]
+    list_select_related = ["user", "classroom__field"]
     list_editable = ["status"]
     list_filter = [
         "status",
@@ -36,6 +37,7 @@ class AttendanceApprovalAdmin(admin.ModelAdmin):
         "status_requested",
         "date"
     ]
+    list_select_related = ["teacher", "student", "classroom__field"]
     list_editable = ["status_requested"]
     list_filter = [
         "status_requested",
@@ -59,6 +61,11 @@ class AttendanceReviewAdmin(admin.ModelAdmin):
         "reviewed_by",
         "reviewed_at"
     ]
+    list_select_related = [
+        "attending_approval__teacher",
+        "attending_approval__student",
+        "reviewed_by"
+    ]
     list_editable = ["review_status"]
     list_filter = [
         "review_status",
@@ -3,8 +3,9 @@ from present_absent.serializers import AttendanceApprovalSerializer
 from rest_framework.decorators import api_view 
 from rest_framework import status 
 from rest_framework.response import Response 
-from rest_framework.pagination import PageNumberPagination
+from common.pagination import get_paginator, PAGINATION_PARAMETERS
 from common.is_authenticated import authenticated_required
+from common.access import get_access
 from drf_yasg.utils import swagger_auto_schema 
 from drf_yasg import openapi 
 from django.db.models import Q 
@@ -17,13 +18,12 @@ from present_absent.permissions import attending_validations, check_attending_ex
         openapi.Parameter("date", openapi.IN_QUERY, type=openapi.TYPE_STRING),
         openapi.Parameter("order_by", openapi.IN_QUERY, type=openapi.TYPE_STRING),
         openapi.Parameter("search", openapi.IN_QUERY, type=openapi.TYPE_STRING),
-    ]
+    ] + PAGINATION_PARAMETERS
 )
 @api_view(["GET"])
 @authenticated_required
 def getAttendanceApprovalView(request, *args, **kwargs):
-    req_user = request.user
-    if (not req_user.user_type in ["admin", "teacher"]) and (req_user.is_staff != True):
+    if not get_access(request).can_manage:
         return Response(
             {"detail":"You are not allowed to perform this action."},
             status=status.HTTP_403_FORBIDDEN
@@ -52,8 +52,7 @@ def getAttendanceApprovalView(request, *args, **kwargs):
     else:
         queryset = queryset.order_by("-date")
 
-    paginated = PageNumberPagination()
-    paginated.page_size = 10 
+    paginated = get_paginator(request)
     paginated_queryset = paginated.paginate_queryset(queryset, request)
     serializer = AttendanceApprovalSerializer(paginated_queryset, many=True)
     return paginated.get_paginated_response(serializer.data)
@@ -0,0 +1,180 @@
+"""
+Bulk Attendance API
+===================
+This module provides a roll-call endpoint that records the attendance of a whole classroom in one request.
+1. POST `/attending/bulk/` - Create attendance records for many students of one classroom on one date.
+
+Key Features:
+- The whole roster is validated with a fixed number of set-based queries instead of one lookup per student.
+- All valid rows are written with a single `bulk_create`; the "attend_on_time" points are awarded by one
+  queued task once they commit, so a student whose profile is not created yet does not fail the roll-call.
+- Invalid rows are reported back one by one and do not reject the rest of the batch.
+"""
+
+import hashlib
+from datetime import date
+from django.db import transaction, IntegrityError
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from common.is_authenticated import authenticated_required
+from common.access import get_access
+from user.models import User
+from classroom.models import ClassRoom
+from present_absent.models import PresentAbsent
+from present_absent.serializers import (
+    PresentAbsentSerializer,
+    BulkAttendanceSerializer,
+    BulkAttendanceRowSerializer
+)
+from gamification.tasks import award_points_task
+from present_absent import rollup
+from dashboard import snapshots
+
+@swagger_auto_schema(
+    method="post",
+    request_body=BulkAttendanceSerializer,
+    responses={
+        201: "Created",
+        400: "Invalid data",
+        401: "Authenticated required",
+        403: "Forbidden",
+        404: "Not found"
+    }
+)
+@api_view(["POST"])
+@authenticated_required
+def postBulkAttendingView(request, *args, **kwargs):
+    """
+    Records the attendance of many students of one classroom on one date.
+    - Only teachers and administrators can register attendance.
+    - Each row must reference an active student of the classroom with no attendance for that date yet.
+    - Valid rows are created together; invalid rows are returned in `errors` with their index.
+    """
+    if not get_access(request).can_manage:
+        return Response(
+            {"detail":"Only teachers and administrators have the right to register student attendance."},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    serializer = BulkAttendanceSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(
+            {"detail":"Invalid data", "errors":serializer.errors},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    classroom_id = serializer.validated_data["classroom"]
+    attendance_date = serializer.validated_data["date"]
+    rows = serializer.validated_data["attendances"]
+
+    if attendance_date > date.today():
+        return Response(
+            {"detail":"You cannot record attendance for a future date."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    if not ClassRoom.objects.filter(id=classroom_id).exists():
+        return Response(
+            {"detail":"ClassRoom not found."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    errors = []
+    valid_rows = []
+    seen_students = set()
+    for index, row in enumerate(rows):
+        row_serializer = BulkAttendanceRowSerializer(data=row)
+        if not row_serializer.is_valid():
+            errors.append({"index":index, "errors":row_serializer.errors})
+            continue
+
+        student_id = row_serializer.validated_data["student"]
+        if student_id in seen_students:
+            errors.append({"index":index, "student":student_id, "detail":"Student is listed more than once."})
+            continue
+        seen_students.add(student_id)
+        valid_rows.append((index, row_serializer.validated_data))
+
+    # Three queries for the whole roster: the students, the classroom's
+    # roster and the attendance already recorded for the date.
+    students = {
+        user_id: (user_type, is_active)
+        for user_id, user_type, is_active in User.objects.filter(
+            id__in=seen_students
+        ).values_list("id", "user_type", "is_active")
+    }
+    members = get_access(request).classroom_student_ids(classroom_id)
+    already_recorded = set(
+        PresentAbsent.objects.filter(
+            classroom_id=classroom_id,
+            date=attendance_date,
+            user_id__in=seen_students
+        ).values_list("user_id", flat=True)
+    )
+
+    attendances = []
+    for index, row in valid_rows:
+        student_id = row["student"]
+        user_type, is_active = students.get(student_id, (None, None))
+        if user_type != "student":
+            detail = "Only students can take attendance."
+        elif not is_active:
+            detail = "This student is inactive."
+        elif student_id not in members:
+            detail = "Mismatch between selected classroom and user."
+        elif student_id in already_recorded:
+            detail = "Attendance is already recorded for this student on this date."
+        else:
+            attendances.append(
+                PresentAbsent(
+                    user_id=student_id,
+                    classroom_id=classroom_id,
+                    status=row["status"],
+                    date=attendance_date
+                )
+            )
+            continue
+        errors.append({"index":index, "student":student_id, "detail":detail})
+    errors.sort(key=lambda error: error["index"])
+
+    if not attendances:
+        return Response(
+            {"detail":"No attendance was recorded.", "errors":errors},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    # bulk_create does not send post_save, so the rollup counters, the
+    # gamification award and the dashboard invalidation that the signals
+    # maintain for single rows are applied here in batch.
+    present_ids = sorted(attendance.user_id for attendance in attendances if attendance.status == "present")
+    # A student has one attendance a day, so these students are only ever recorded present together once.
+    digest = hashlib.sha1(",".join(map(str, present_ids)).encode()).hexdigest()
+    try:
+        with transaction.atomic():
+            PresentAbsent.objects.bulk_create(attendances)
+            rollup.record(attendances)
+            if present_ids:
+                award_points_task.dispatch(
+                    present_ids,
+                    "attend_on_time",
+                    idempotency_key=f"attend_on_time:{classroom_id}:{attendance_date}:{digest}"
+                )
+            snapshots.invalidate(attendance.user_id for attendance in attendances)
+    except IntegrityError:
+        # Another request recorded some of these students in the meantime;
+        # the unique constraint rejected the whole batch.
+        return Response(
+            {"detail":"Attendance was recorded concurrently for some students, please retry."},
+            status=status.HTTP_409_CONFLICT
+        )
+
+    return Response(
+        {
+            "detail":f"{len(attendances)} attendance(s) created successfully!",
+            "data":PresentAbsentSerializer(attendances, many=True).data,
+            "errors":errors
+        },
+        status=status.HTTP_201_CREATED
+    )
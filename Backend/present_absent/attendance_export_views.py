@@ -0,0 +1,54 @@
+"""
+Attendance Export API
+=====================
+This module streams attendance records out as a file.
+1. GET `/attending/export/` - Download the attendance records as CSV (default) or NDJSON.
+
+Key Features:
+- Accepts the same filters as GET `/attending/` and shows the same rows to the same users.
+- Rows are streamed from a `values_list` iterator, so memory stays flat whatever the number of records.
+"""
+
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from common.is_authenticated import authenticated_required
+from common.exporting import stream_export, get_export_format, EXPORT_PARAMETERS
+from present_absent.views import get_attending_queryset
+
+ATTENDANCE_COLUMNS = [
+    ("id", "id"),
+    ("student", "user_id"),
+    ("username", "user__username"),
+    ("classroom", "classroom_id"),
+    ("classroom_name", "classroom__name"),
+    ("date", "date"),
+    ("status", "status"),
+]
+
+@swagger_auto_schema(
+    method="get",
+    manual_parameters=[
+        openapi.Parameter("user", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Filter by username"),
+        openapi.Parameter("status", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Filter by attendance status (present/absent)"),
+        openapi.Parameter("classroom", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Filter by classroom name"),
+        openapi.Parameter("date", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Filter by attendance date (YYYY-MM-DD)"),
+        openapi.Parameter("search", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Search by username"),
+    ] + EXPORT_PARAMETERS
+)
+@api_view(["GET"])
+@authenticated_required
+def getAttendingExportView(request, *args, **kwargs):
+    """
+    Streams the attendance records visible to the user as a file.
+    - Admins export all records, other users their own.
+    """
+    file_format = get_export_format(request)
+    if file_format is None:
+        return Response(
+            {"detail":"Invalid data"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return stream_export(get_attending_queryset(request), ATTENDANCE_COLUMNS, file_format, "attendance")
@@ -1,13 +1,15 @@
 from present_absent.models import AttendanceReview, AttendanceApproval
-from present_absent.serializers import AttendanceReviewSerializer 
+from present_absent.serializers import AttendanceReviewSerializer, BulkAttendanceReviewSerializer
+from present_absent import reviews
 from common.is_authenticated import authenticated_required
 from common.is_admin import admin_required
+from common.access import get_access
 from rest_framework.decorators import api_view 
 from rest_framework.response import Response 
 from rest_framework import status 
 from drf_yasg.utils import swagger_auto_schema 
 from drf_yasg import openapi 
-from rest_framework.pagination import PageNumberPagination 
+from common.pagination import get_paginator, PAGINATION_PARAMETERS
 from django.db.models import Q 
 from django.core.exceptions import FieldError
 
@@ -20,20 +22,21 @@ from django.core.exceptions import FieldError
         openapi.Parameter("attending-approval-date", openapi.IN_QUERY, type=openapi.TYPE_STRING),
         openapi.Parameter("search", openapi.IN_QUERY, type=openapi.TYPE_STRING),
         openapi.Parameter("order_by", openapi.IN_QUERY, type=openapi.TYPE_STRING)
-    ]
+    ] + PAGINATION_PARAMETERS
 )
 @api_view(["GET"])
 @authenticated_required
 # @admin_required
 def getAttendanceReview(request, *args, **kwargs):
     req_user = request.user 
-    if not req_user.user_type in ["teacher", "admin"]:
+    access = get_access(request)
+    if not access.user_type in ["teacher", "admin"]:
         return Response(
             {"detail":"You are not alllowed to perform this action."},
             status=status.HTTP_403_FORBIDDEN
         )
 
-    if req_user.user_type != "admin":
+    if access.user_type != "admin":
         queryset = AttendanceReview.objects.filter(attending_approval__teacher = req_user.id)
     else:
         queryset = AttendanceReview.objects.all()
@@ -68,8 +71,7 @@ def getAttendanceReview(request, *args, **kwargs):
             status=status.HTTP_400_BAD_REQUEST
         )
         
-    paginated = PageNumberPagination()
-    paginated.page_size = 10
+    paginated = get_paginator(request)
     paginated_queryset = paginated.paginate_queryset(queryset, request) 
     serializer = AttendanceReviewSerializer(paginated_queryset, many=True)
     return paginated.get_paginated_response(serializer.data)
@@ -101,4 +103,54 @@ def postAttendanceReview(request, *args, **kwargs):
         return Response(
             {"detail":"Invalid data.", "errors":serializer.errors},
             status=status.HTTP_400_BAD_REQUEST
-        )
\ No newline at end of file
+        )
+
+@swagger_auto_schema(
+    method="post",
+    request_body=BulkAttendanceReviewSerializer,
+    responses={
+        200: "Reviewed",
+        400: "Invalid data",
+        401: "Authenticated required",
+        403: "Forbidden"
+    }
+)
+@api_view(["POST"])
+@authenticated_required
+@admin_required
+def postBulkAttendanceReview(request, *args, **kwargs):
+    """
+    Approves or rejects many pending attendance requests at once.
+    - The requests are listed in `approvals`, or selected by `date` and/or `classroom`.
+    - Requests decided before are skipped; days that already have attendance keep it.
+    """
+    serializer = BulkAttendanceReviewSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(
+            {"detail":"Invalid data", "errors":serializer.errors},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    filters = {
+        "id__in": serializer.validated_data.get("approvals"),
+        "date": serializer.validated_data.get("date"),
+        "classroom_id": serializer.validated_data.get("classroom"),
+    }
+    filters = {k:v for k,v in filters.items() if v is not None}
+    decision = serializer.validated_data["decision"]
+    result = reviews.decide(AttendanceApproval.objects.filter(**filters), decision, request.user)
+
+    requested = serializer.validated_data.get("approvals") or []
+    decided = set(result.decided)
+    return Response(
+        {
+            "detail":f"{len(result.decided)} attendance request(s) {decision}.",
+            "data":{
+                "reviewed":result.decided,
+                "attendances_created":len(result.attendances),
+                "already_recorded":result.already_recorded,
+                "skipped":[approval_id for approval_id in dict.fromkeys(requested) if approval_id not in decided],
+            }
+        },
+        status=status.HTTP_200_OK
+    )
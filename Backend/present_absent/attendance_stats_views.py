@@ -0,0 +1,120 @@
+"""
+Attendance Statistics API
+=========================
+This module provides attendance rates computed from the rollup tables maintained by `present_absent.rollup`.
+1. GET `/attending/stats/` - Present/absent/excused counts and rates per classroom and per student over a date range.
+
+Key Features:
+- Classroom rates come from `AttendanceDailyStat`, so their cost depends on the number of classrooms and days, not on the number of attendance rows.
+- Student rates come from `AttendanceMonthlyStat` and are month-granular: the range is widened to whole months.
+- Student rates are only returned when a classroom or a student is selected.
+"""
+
+from calendar import monthrange
+from collections import defaultdict
+from datetime import date
+from django.db.models import Sum
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from common.is_authenticated import authenticated_required
+from common.access import get_access
+from present_absent.models import PresentAbsent, AttendanceDailyStat, AttendanceMonthlyStat
+
+STATUSES = [choice for choice, _ in PresentAbsent.STATUS_CHOICES]
+
+def _rates(counts):
+    total = sum(counts.get(choice, 0) for choice in STATUSES)
+    row = {choice: counts.get(choice, 0) for choice in STATUSES}
+    row["total"] = total
+    for choice in STATUSES:
+        row[f"{choice}_rate"] = round(row[choice] / total, 4) if total else None
+    return row
+
+def _group(rows, key_fields):
+    grouped = defaultdict(dict)
+    for row in rows:
+        grouped[tuple(row[field] for field in key_fields)][row["status"]] = row["count"]
+    return [
+        {**dict(zip(key_fields, key)), **_rates(counts)}
+        for key, counts in sorted(grouped.items())
+    ]
+
+@swagger_auto_schema(
+    method="get",
+    manual_parameters=[
+        openapi.Parameter("from", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="First day of the range (YYYY-MM-DD), defaults to the first day of this month"),
+        openapi.Parameter("to", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Last day of the range (YYYY-MM-DD), defaults to today"),
+        openapi.Parameter("classroom", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description="Restrict to a classroom id"),
+        openapi.Parameter("student", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description="Restrict the student rates to a student id"),
+    ]
+)
+@api_view(["GET"])
+@authenticated_required
+def getAttendanceStatsView(request, *args, **kwargs):
+    """
+    Returns attendance counts and rates over a date range.
+    - Only teachers and administrators can view attendance statistics.
+    - `classrooms` holds one row per classroom with its counts and rates.
+    - `students` holds one row per (student, classroom) when a classroom or student is selected.
+    """
+    if not get_access(request).can_manage:
+        return Response(
+            {"detail":"You are not allowed to perform this action."},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    today = date.today()
+    try:
+        date_from = date.fromisoformat(request.query_params.get("from") or str(today.replace(day=1)))
+        date_to = date.fromisoformat(request.query_params.get("to") or str(today))
+        classroom_id = request.query_params.get("classroom")
+        classroom_id = int(classroom_id) if classroom_id else None
+        student_id = request.query_params.get("student")
+        student_id = int(student_id) if student_id else None
+    except ValueError:
+        return Response(
+            {"detail":"Invalid data"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    if date_from > date_to:
+        return Response(
+            {"detail":"`from` must not be after `to`."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    daily = AttendanceDailyStat.objects.filter(date__range=(date_from, date_to))
+    if classroom_id:
+        daily = daily.filter(classroom_id=classroom_id)
+    classrooms = _group(
+        daily.values("classroom", "status").annotate(count=Sum("count")).order_by(),
+        ["classroom"]
+    )
+
+    data = {
+        "from": date_from,
+        "to": date_to,
+        "classrooms": classrooms,
+    }
+
+    if classroom_id or student_id:
+        month_from = date_from.replace(day=1)
+        month_to = date_to.replace(day=monthrange(date_to.year, date_to.month)[1])
+        monthly = AttendanceMonthlyStat.objects.filter(month__range=(month_from, date_to))
+        if classroom_id:
+            monthly = monthly.filter(classroom_id=classroom_id)
+        if student_id:
+            monthly = monthly.filter(user_id=student_id)
+        data["students_period"] = {"from": month_from, "to": month_to}
+        data["students"] = [
+            {"student": row.pop("user"), **row}
+            for row in _group(
+                monthly.values("user", "classroom", "status").annotate(count=Sum("count")).order_by(),
+                ["user", "classroom"]
+            )
+        ]
+
+    return Response(data, status=status.HTTP_200_OK)
@@ -0,0 +1,19 @@
+"""
+Rebuilds the attendance rollup tables from the `PresentAbsent` rows.
+
+The rollup is maintained incrementally by signals; run this after loading
+attendance with raw SQL or `QuerySet.update()`, which bypass them.
+
+Usage:
+    python manage.py rebuild_attendance_stats
+"""
+
+from django.core.management.base import BaseCommand
+from present_absent import rollup
+
+class Command(BaseCommand):
+    help = "Rebuild the daily and monthly attendance statistics."
+
+    def handle(self, *args, **options):
+        daily, monthly = rollup.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"{daily} daily and {monthly} monthly counter(s) rebuilt."))
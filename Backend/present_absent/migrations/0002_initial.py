@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('classroom', '0002_initial'),
+        ('present_absent', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendanceapproval',
+            name='student',
+            field=models.ForeignKey(limit_choices_to={'user_type': 'student'}, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='Student User'),
+        ),
+        migrations.AddField(
+            model_name='attendanceapproval',
+            name='teacher',
+            field=models.ForeignKey(limit_choices_to={'user_type': 'teacher'}, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='attendance_approval_teacher', to=settings.AUTH_USER_MODEL, verbose_name='Teacher User'),
+        ),
+        migrations.AddField(
+            model_name='attendancereview',
+            name='attending_approval',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='review', to='present_absent.attendanceapproval', verbose_name='Attending Request'),
+        ),
+        migrations.AddField(
+            model_name='attendancereview',
+            name='reviewed_by',
+            field=models.ForeignKey(blank=True, limit_choices_to={'user_type': 'admin'}, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Reviewed by (Admin)'),
+        ),
+        migrations.AddField(
+            model_name='presentabsent',
+            name='classroom',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='classroom.classroom', verbose_name='Class room'),
+        ),
+        migrations.AddField(
+            model_name='presentabsent',
+            name='user',
+            field=models.ForeignKey(limit_choices_to={'user_type': 'student'}, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='Student Users'),
+        ),
+    ]
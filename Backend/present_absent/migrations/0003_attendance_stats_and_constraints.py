@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classroom', '0003_alter_classroom_updated_at'),
+        ('present_absent', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('status', models.CharField(choices=[('absent', 'Absent'), ('present', 'Present'), ('excused', 'Excused')], max_length=255, verbose_name='Status')),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AttendanceMonthlyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('status', models.CharField(choices=[('absent', 'Absent'), ('present', 'Present'), ('excused', 'Excused')], max_length=255, verbose_name='Status')),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='attendanceapproval',
+            index=models.Index(fields=['date', 'status_requested'], name='approval_date_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='presentabsent',
+            index=models.Index(fields=['classroom', 'date'], name='attendance_classroom_date_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='presentabsent',
+            constraint=models.UniqueConstraint(fields=('user', 'classroom', 'date'), name='unique_attendance_per_day'),
+        ),
+        migrations.AddField(
+            model_name='attendancedailystat',
+            name='classroom',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_daily_stats', to='classroom.classroom', verbose_name='Class room'),
+        ),
+        migrations.AddField(
+            model_name='attendancemonthlystat',
+            name='classroom',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_monthly_stats', to='classroom.classroom', verbose_name='Class room'),
+        ),
+        migrations.AddField(
+            model_name='attendancemonthlystat',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_monthly_stats', to=settings.AUTH_USER_MODEL, verbose_name='Student Users'),
+        ),
+        migrations.AddConstraint(
+            model_name='attendancedailystat',
+            constraint=models.UniqueConstraint(fields=('classroom', 'date', 'status'), name='unique_attendance_daily_stat'),
+        ),
+        migrations.AddConstraint(
+            model_name='attendancemonthlystat',
+            constraint=models.UniqueConstraint(fields=('user', 'classroom', 'month', 'status'), name='unique_attendance_monthly_stat'),
+        ),
+    ]
@@ -28,6 +28,19 @@ class PresentAbsent(models.Model):
     )
     date = models.DateField()
 
+    class Meta:
+        constraints = [
+            # One record per student, classroom and day; also serves the
+            # duplicate checks on (user, classroom, date).
+            models.UniqueConstraint(
+                fields=["user", "classroom", "date"],
+                name="unique_attendance_per_day"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["classroom", "date"], name="attendance_classroom_date_idx"),
+        ]
+
     def __str__(self):
         return f"student: {self.user.username}({self.status})"
     
@@ -69,6 +82,11 @@ class AttendanceApproval(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["date", "status_requested"], name="approval_date_status_idx"),
+        ]
+
     def __str__(self):
         return f"Request by {self.teacher.username} → {self.student.username} ({self.status_requested})"
     
@@ -104,4 +122,70 @@ class AttendanceReview(models.Model):
     reviewed_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
-        return f"{self.attending_approval} → {self.review_status}"
\ No newline at end of file
+        return f"{self.attending_approval} → {self.review_status}"
+
+class AttendanceDailyStat(models.Model):
+    """
+    Number of attendance records per classroom, date and status.
+    Maintained by present_absent.rollup; rebuilt by `rebuild_attendance_stats`.
+    """
+    classroom = models.ForeignKey(
+        ClassRoom,
+        on_delete=models.CASCADE,
+        related_name="attendance_daily_stats",
+        verbose_name="Class room"
+    )
+    date = models.DateField()
+    status = models.CharField(
+        max_length=255,
+        choices=PresentAbsent.STATUS_CHOICES,
+        verbose_name="Status"
+    )
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["classroom", "date", "status"],
+                name="unique_attendance_daily_stat"
+            )
+        ]
+
+    def __str__(self):
+        return f"classroom {self.classroom_id} on {self.date}: {self.count} {self.status}"
+
+class AttendanceMonthlyStat(models.Model):
+    """
+    Number of attendance records per student, classroom, month and status.
+    `month` is the first day of the month.
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="attendance_monthly_stats",
+        verbose_name="Student Users"
+    )
+    classroom = models.ForeignKey(
+        ClassRoom,
+        on_delete=models.CASCADE,
+        related_name="attendance_monthly_stats",
+        verbose_name="Class room"
+    )
+    month = models.DateField()
+    status = models.CharField(
+        max_length=255,
+        choices=PresentAbsent.STATUS_CHOICES,
+        verbose_name="Status"
+    )
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "classroom", "month", "status"],
+                name="unique_attendance_monthly_stat"
+            )
+        ]
+
+    def __str__(self):
+        return f"student {self.user_id} in {self.month:%Y-%m}: {self.count} {self.status}"
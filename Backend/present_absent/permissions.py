@@ -25,7 +25,7 @@ from functools import wraps
 from rest_framework.response import Response 
 from rest_framework import status 
 from user.models import User
-from classroom.models import ClassRoom
+from common.access import get_access
 from datetime import datetime
 from present_absent.models import PresentAbsent, AttendanceApproval
 
@@ -41,8 +41,8 @@ def attending_validations(view_func):
     """
     @wraps(view_func)
     def _wrap_view(request, *args, **kwargs):
-        req_user = request.user 
-        if (not req_user.user_type in ["admin", "teacher"]) and (req_user.is_staff != True):
+        access = get_access(request)
+        if not access.can_manage:
             return Response(
                 {"detail":"Only teachers and administrators have the right to register student attendance."},
                 status=status.HTTP_403_FORBIDDEN
@@ -62,8 +62,11 @@ def attending_validations(view_func):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        classroom_id = request.data.get("classroom")
-        if not ClassRoom.objects.filter(id=classroom_id, students__id=student_id).exists():
+        try:
+            is_member = user.id in access.classroom_student_ids(request.data.get("classroom"))
+        except (TypeError, ValueError):
+            is_member = False
+        if not is_member:
             return Response(
                 {"detail": "Mismatch between selected classroom and user."},
                 status=status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,116 @@
+"""
+Attendance Review Decisions
+===========================
+This module turns the decision on an attendance correction request into the attendance it records.
+
+Functions:
+1. `final_status` - The attendance status recorded for a decided request.
+2. `decide` - Decides many pending requests at once.
+
+Key Features:
+- An approved request records the requested status; a rejected one records the opposite
+  (`present` for rejected `absent` or `excused`, `absent` for rejected `present`).
+- `decide` costs a fixed number of queries whatever the number of requests: the pending reviews are
+  locked and read, decided with one `UPDATE`, the attendance already recorded is read with one
+  set-based lookup and the missing rows are written with one `bulk_create`.
+- The "attend_on_time" points are awarded by one queued task once the decisions commit, so a student
+  whose profile is not created yet does not fail the batch.
+- A day that already has attendance keeps it, like `handle_review_decision` does for single reviews.
+"""
+
+import hashlib
+from collections import namedtuple
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from present_absent.models import PresentAbsent, AttendanceReview
+from present_absent import rollup
+from gamification.tasks import award_points_task
+from dashboard import snapshots
+
+REJECTED_STATUS = {
+    "absent": "present",
+    "present": "absent",
+    "excused": "present",
+}
+
+Decision = namedtuple("Decision", ["decided", "attendances", "already_recorded"])
+
+def final_status(review_status, status_requested):
+    if review_status == "approved":
+        return status_requested
+    return REJECTED_STATUS.get(status_requested, "present")
+
+@transaction.atomic
+def decide(approvals, review_status, reviewed_by):
+    """
+    Decides the pending requests among `approvals`.
+
+    Args:
+        approvals (QuerySet): `AttendanceApproval`s to decide; requests decided before are left as they are.
+        review_status (str): "approved" or "rejected".
+        reviewed_by (User): The administrator deciding.
+
+    Returns:
+        Decision: The decided approval ids, the created `PresentAbsent` rows and the approval ids whose day
+        already had attendance.
+    """
+    # Locked so that two concurrent decisions cannot both record the same requests.
+    pending = list(
+        approvals.filter(Q(review__isnull=True) | Q(review__review_status="pending"))
+        .select_for_update()
+        .order_by("id")
+        .values_list("id", "review", "student_id", "classroom_id", "date", "status_requested")
+    )
+    if not pending:
+        return Decision([], [], [])
+
+    approval_ids = [row[0] for row in pending]
+    # Requests whose review the queued task has not created yet get theirs now,
+    # so that one UPDATE decides them all.
+    AttendanceReview.objects.bulk_create(
+        [AttendanceReview(attending_approval_id=row[0]) for row in pending if row[1] is None],
+        ignore_conflicts=True
+    )
+    AttendanceReview.objects.filter(attending_approval_id__in=approval_ids).update(
+        review_status=review_status,
+        reviewed_by=reviewed_by,
+        reviewed_at=timezone.now()
+    )
+
+    existing = set(
+        PresentAbsent.objects.filter(
+            user_id__in={row[2] for row in pending},
+            classroom_id__in={row[3] for row in pending},
+            date__in={row[4] for row in pending}
+        ).values_list("user_id", "classroom_id", "date")
+    )
+    attendances = []
+    already_recorded = []
+    for approval_id, _, student_id, classroom_id, day, status_requested in pending:
+        key = (student_id, classroom_id, day)
+        if key in existing:
+            already_recorded.append(approval_id)
+            continue
+        # The first request of a day wins, as with one review after another.
+        existing.add(key)
+        attendances.append(
+            PresentAbsent(
+                user_id=student_id,
+                classroom_id=classroom_id,
+                date=day,
+                status=final_status(review_status, status_requested)
+            )
+        )
+
+    # bulk_create sends no post_save: the rollup, the award and the dashboard
+    # invalidation of the PresentAbsent signals are applied here in batch.
+    PresentAbsent.objects.bulk_create(attendances)
+    rollup.record(attendances)
+    present_ids = [attendance.user_id for attendance in attendances if attendance.status == "present"]
+    if present_ids:
+        # The requests are locked and decided only once, so their ids identify the award.
+        digest = hashlib.sha1(",".join(map(str, approval_ids)).encode()).hexdigest()
+        award_points_task.dispatch(present_ids, "attend_on_time", idempotency_key=f"attend_on_time:reviews:{digest}")
+    snapshots.invalidate(attendance.user_id for attendance in attendances)
+    return Decision(approval_ids, attendances, already_recorded)
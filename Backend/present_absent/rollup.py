@@ -0,0 +1,134 @@
+"""
+Attendance Rollup
+=================
+This module maintains the attendance count tables used by the statistics endpoint.
+
+Functions:
+1. `record` - Adds attendance records to the rollup (or removes them with `sign=-1`).
+2. `rebuild` - Recomputes both rollup tables from the `PresentAbsent` rows.
+
+Key Features:
+- `AttendanceDailyStat` counts records per (classroom, date, status).
+- `AttendanceMonthlyStat` counts records per (student, classroom, month, status).
+- A batch of records costs a fixed number of queries per table: missing counters are created
+  with `ignore_conflicts`, then every counter is bumped with an `F()` expression in one `UPDATE`,
+  so concurrent writers never lose an increment.
+"""
+
+from collections import Counter
+from datetime import date
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest, TruncMonth
+from present_absent.models import PresentAbsent, AttendanceDailyStat, AttendanceMonthlyStat
+
+def _day(value):
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+def _month(day):
+    return day.replace(day=1)
+
+def _bump(model, key_fields, deltas, base_filter):
+    """
+    Adds `deltas` ({key tuple: delta}) to the `count` of the matching `model` rows.
+    `base_filter` narrows the rows read back to a superset of the keys.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    model.objects.bulk_create(
+        [model(**dict(zip(key_fields, key)), count=0) for key in deltas],
+        ignore_conflicts=True
+    )
+
+    rows = []
+    for row in model.objects.filter(**base_filter).only("id", *key_fields):
+        key = tuple(getattr(row, field) for field in key_fields)
+        if key in deltas:
+            # Clamped so that uncounting a record older than the rollup
+            # (before the first rebuild) cannot make a counter negative.
+            row.count = Greatest(F("count") + deltas[key], 0)
+            rows.append(row)
+    model.objects.bulk_update(rows, ["count"])
+
+def record(attendances, sign=1):
+    """
+    Adds (or with `sign=-1`, removes) `attendances` to the rollup tables.
+
+    Args:
+        attendances: `PresentAbsent` instances, or tuples of (user_id, classroom_id, date, status).
+        sign (int): 1 to count the records, -1 to uncount them.
+    """
+    rows = [
+        attendance if isinstance(attendance, tuple)
+        else (attendance.user_id, attendance.classroom_id, attendance.date, attendance.status)
+        for attendance in attendances
+    ]
+    if not rows:
+        return
+
+    daily = Counter()
+    monthly = Counter()
+    for user_id, classroom_id, day, status in rows:
+        day = _day(day)
+        daily[(classroom_id, day, status)] += sign
+        monthly[(user_id, classroom_id, _month(day), status)] += sign
+
+    with transaction.atomic():
+        _bump(
+            AttendanceDailyStat,
+            ["classroom_id", "date", "status"],
+            daily,
+            {
+                "classroom_id__in": {key[0] for key in daily},
+                "date__in": {key[1] for key in daily},
+            }
+        )
+        _bump(
+            AttendanceMonthlyStat,
+            ["user_id", "classroom_id", "month", "status"],
+            monthly,
+            {
+                "user_id__in": {key[0] for key in monthly},
+                "classroom_id__in": {key[1] for key in monthly},
+                "month__in": {key[2] for key in monthly},
+            }
+        )
+
+def rebuild():
+    """
+    Recomputes both rollup tables from scratch.
+
+    Returns:
+        tuple: The number of daily and monthly counters written.
+    """
+    with transaction.atomic():
+        AttendanceDailyStat.objects.all().delete()
+        AttendanceMonthlyStat.objects.all().delete()
+
+        daily = AttendanceDailyStat.objects.bulk_create(
+            (
+                AttendanceDailyStat(classroom_id=row["classroom"], date=row["date"], status=row["status"], count=row["count"])
+                for row in PresentAbsent.objects.order_by().values(
+                    "classroom", "date", "status"
+                ).annotate(count=Count("id")).iterator(chunk_size=2000)
+            ),
+            batch_size=1000
+        )
+        monthly = AttendanceMonthlyStat.objects.bulk_create(
+            (
+                AttendanceMonthlyStat(
+                    user_id=row["user"],
+                    classroom_id=row["classroom"],
+                    month=row["month"],
+                    status=row["status"],
+                    count=row["count"]
+                )
+                for row in PresentAbsent.objects.order_by().annotate(
+                    month=TruncMonth("date")
+                ).values("user", "classroom", "month", "status").annotate(count=Count("id")).iterator(chunk_size=2000)
+            ),
+            batch_size=1000
+        )
+    return len(daily), len(monthly)
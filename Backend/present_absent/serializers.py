@@ -35,4 +35,34 @@ class AttendanceReviewSerializer(serializers.ModelSerializer):
             "review_status",
             "reviewed_by",
             "reviewed_at"
-        ]
\ No newline at end of file
+        ]
+
+class BulkAttendanceRowSerializer(serializers.Serializer):
+    student = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=PresentAbsent.STATUS_CHOICES)
+
+class BulkAttendanceSerializer(serializers.Serializer):
+    classroom = serializers.IntegerField()
+    date = serializers.DateField()
+    # Rows are validated one by one in the view so that a single bad row
+    # is reported back instead of rejecting the whole roll-call.
+    attendances = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False
+    )
+
+class BulkAttendanceReviewSerializer(serializers.Serializer):
+    decision = serializers.ChoiceField(choices=["approved", "rejected"])
+    # The requests to decide: listed by id, or every pending one of a date and/or classroom.
+    approvals = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False
+    )
+    date = serializers.DateField(required=False)
+    classroom = serializers.IntegerField(required=False)
+
+    def validate(self, data):
+        if not data.get("approvals") and "date" not in data and "classroom" not in data:
+            raise serializers.ValidationError("Give `approvals`, or a `date` and/or `classroom` to select the requests.")
+        return data
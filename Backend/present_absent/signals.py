@@ -1,40 +1,40 @@
-from django.db.models.signals import post_save 
+from django.db.models.signals import post_save, pre_save, post_delete
 from django.dispatch import receiver 
 from present_absent.models import PresentAbsent, AttendanceReview, AttendanceApproval
-from gamification.models import (
-    EventType,
-    StudentEvent,
-    StudentProfile
-)
+from gamification.tasks import award_points_task
+from present_absent.tasks import create_attendance_review as create_attendance_review_task
+from present_absent import rollup, reviews
 from datetime import date
 
 @receiver(post_save, sender=PresentAbsent)
 def handle_attending_event(instance, created, **kwargs):
     if created and instance.status == "present":
-        try:
-            profile = StudentProfile.objects.get(students=instance.user)
+        award_points_task.dispatch(
+            [instance.user_id], "attend_on_time", idempotency_key=f"attend_on_time:{instance.pk}"
+        )
 
-            event_type, _ = EventType.objects.get_or_create(
-                code="attend_on_time",
-                defaults={
-                    "name":"To be present",
-                    "description":"Student attended in school.",
-                    "point":5
-                }
-            )
 
-            StudentEvent.objects.create(
-                student_profile=profile,
-                event_type=event_type,
-                note="Attenting in school"
-            )
+@receiver(pre_save, sender=PresentAbsent)
+def capture_previous_attendance(sender, instance, **kwargs):
+    instance._rollup_previous = None
+    if instance.pk:
+        instance._rollup_previous = PresentAbsent.objects.filter(pk=instance.pk).values_list(
+            "user_id", "classroom_id", "date", "status"
+        ).first()
 
-            profile.recalculate_total_points()
-            profile.calculate_level()
-
-        except StudentProfile.DoesNotExist:
-            raise ValueError("Student Profile not found.")
+@receiver(post_save, sender=PresentAbsent)
+def update_attendance_rollup(sender, instance, created, **kwargs):
+    current = (instance.user_id, instance.classroom_id, instance.date, instance.status)
+    previous = getattr(instance, "_rollup_previous", None)
+    if previous == current:
+        return
+    if previous:
+        rollup.record([previous], sign=-1)
+    rollup.record([current])
 
+@receiver(post_delete, sender=PresentAbsent)
+def remove_attendance_from_rollup(sender, instance, **kwargs):
+    rollup.record([instance], sign=-1)
 
 @receiver(post_save, sender=AttendanceReview)
 def handle_review_decision(sender, instance, created, **kwargs):
@@ -47,27 +47,18 @@ def handle_review_decision(sender, instance, created, **kwargs):
     status = request.status_requested
     attendance_date = request.date
 
-    if PresentAbsent.objects.filter(user=student, classroom=classroom, date=attendance_date).exists():
-        return 
-
-    if instance.review_status == "approved":
-        final_status = status
-    elif instance.review_status == "rejected":
-        if status == "absent":
-            final_status = "present"
-        elif status == "present":
-            final_status = "absent"
-        else:
-            final_status = "present" 
+    final_status = reviews.final_status(instance.review_status, status)
 
-    PresentAbsent.objects.create(
+    # get_or_create relies on the (user, classroom, date) unique constraint,
+    # so two concurrent reviews cannot both record the day.
+    PresentAbsent.objects.get_or_create(
         user=student,
         classroom=classroom,
-        status=final_status,
-        date=attendance_date
+        date=attendance_date,
+        defaults={"status":final_status}
     )
 
 @receiver(post_save, sender=AttendanceApproval)
 def create_attendance_review(sender, instance, created, **kwargs):
     if created:
-        AttendanceReview.objects.create(attending_approval=instance)
\ No newline at end of file
+        create_attendance_review_task.dispatch(instance.pk, idempotency_key=f"attendance_review:{instance.pk}")
\ No newline at end of file
@@ -0,0 +1,6 @@
+from common.tasks import task
+from present_absent.models import AttendanceReview
+
+@task(name="present_absent.create_attendance_review")
+def create_attendance_review(approval_id):
+    AttendanceReview.objects.get_or_create(attending_approval_id=approval_id)
@@ -0,0 +1,130 @@
+import pytest
+from datetime import date
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from present_absent.models import PresentAbsent
+from gamification.models import StudentProfile
+from common.models import QueuedTask
+from common.tasks import run_pending
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestPostBulkAttendingView:
+    def setup_method(self):
+        self.teacher = create_user("test_teacher1", "teacher", 1)
+        self.student1 = create_user("test_student1", "student", 2)
+        self.student2 = create_user("test_student2", "student", 3)
+        self.outsider = create_user("test_student3", "student", 4)
+        field = Field.objects.create(name="Math")
+        self.classroom = ClassRoom.objects.create(name="10-A", base=10, field=field)
+        self.classroom.students.add(self.student1, self.student2)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.teacher)
+
+    def test_if_usertype_is_student_return_403(self):
+        # Arrange
+        self.client.force_authenticate(user=self.student1)
+
+        # Act
+        response = self.client.post(
+            "/attending/bulk/",
+            {
+                "classroom": self.classroom.id,
+                "date": str(date.today()),
+                "attendances": [{"student": self.student1.id, "status": "present"}]
+            },
+            format="json"
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_valid_roster_creates_rows_and_reports_bad_ones_return_201(self):
+        # Act
+        response = self.client.post(
+            "/attending/bulk/",
+            {
+                "classroom": self.classroom.id,
+                "date": str(date.today()),
+                "attendances": [
+                    {"student": self.student1.id, "status": "present"},
+                    {"student": self.student2.id, "status": "absent"},
+                    {"student": self.outsider.id, "status": "present"},
+                    {"student": self.student1.id, "status": "absent"},
+                    {"student": self.student2.id, "status": "late"},
+                ]
+            },
+            format="json"
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert PresentAbsent.objects.filter(classroom=self.classroom).count() == 2
+        assert [error["index"] for error in response.data["errors"]] == [2, 3, 4]
+        assert StudentProfile.objects.get(students=self.student1).total_point == 5
+
+    def test_if_attendance_already_recorded_return_400(self):
+        # Arrange
+        PresentAbsent.objects.create(
+            user=self.student1,
+            classroom=self.classroom,
+            status="absent",
+            date=date.today()
+        )
+
+        # Act
+        response = self.client.post(
+            "/attending/bulk/",
+            {
+                "classroom": self.classroom.id,
+                "date": str(date.today()),
+                "attendances": [{"student": self.student1.id, "status": "present"}]
+            },
+            format="json"
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert PresentAbsent.objects.filter(user=self.student1).count() == 1
+
+    def test_if_student_has_no_profile_yet_others_are_awarded_and_their_award_waits(self, settings):
+        # Arrange
+        settings.TASKS_BACKEND = "database"
+        StudentProfile.objects.filter(students=self.student2).delete()
+
+        # Act
+        response = self.client.post(
+            "/attending/bulk/",
+            {
+                "classroom": self.classroom.id,
+                "date": str(date.today()),
+                "attendances": [
+                    {"student": self.student1.id, "status": "present"},
+                    {"student": self.student2.id, "status": "present"},
+                ]
+            },
+            format="json"
+        )
+        run_pending()
+        StudentProfile.objects.create(students=self.student2)
+        QueuedTask.objects.filter(status="pending").update(run_after=timezone.now())
+        run_pending()
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert PresentAbsent.objects.filter(classroom=self.classroom).count() == 2
+        assert StudentProfile.objects.get(students=self.student1).total_point == 5
+        assert StudentProfile.objects.get(students=self.student2).total_point == 5
@@ -0,0 +1,56 @@
+import csv
+import pytest
+from datetime import date
+from io import StringIO
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from present_absent.models import PresentAbsent
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+def read_csv(response):
+    return list(csv.DictReader(StringIO(b"".join(response.streaming_content).decode())))
+
+@pytest.mark.django_db
+class TestAttendanceExportView:
+    def setup_method(self):
+        self.admin = create_user("test_admin1", "admin", 1)
+        self.student = create_user("test_student1", "student", 2)
+        self.classroom = ClassRoom.objects.create(name="10-A", base=10, field=Field.objects.create(name="Math"))
+        self.classroom.students.add(self.student)
+        for day, attendance_status in [(1, "present"), (2, "absent"), (3, "present")]:
+            PresentAbsent.objects.create(
+                user=self.student, classroom=self.classroom, date=date(2025, 5, day), status=attendance_status
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_export_honours_list_filters(self):
+        # Act
+        response = self.client.get("/attending/export/", {"status": "present", "classroom": "10-A"})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Disposition"].startswith('attachment; filename="attendance-')
+        assert [(row["date"], row["status"]) for row in read_csv(response)] == [
+            ("2025-05-01", "present"),
+            ("2025-05-03", "present"),
+        ]
+
+    def test_if_unauthenticated_return_401(self):
+        # Act
+        response = APIClient().get("/attending/export/")
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,134 @@
+import pytest
+from datetime import date, timedelta
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from present_absent.models import PresentAbsent, AttendanceApproval, AttendanceReview, AttendanceDailyStat
+from gamification.models import StudentProfile
+from common.models import QueuedTask
+from common.tasks import run_pending
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestPostBulkAttendanceReview:
+    def setup_method(self):
+        self.admin = create_user("test_admin1", "admin", 1)
+        self.teacher = create_user("test_teacher1", "teacher", 2)
+        self.students = [create_user(f"test_student{index}", "student", 10 + index) for index in range(3)]
+        field = Field.objects.create(name="Math")
+        self.classroom = ClassRoom.objects.create(name="10-A", base=10, field=field)
+        self.other_classroom = ClassRoom.objects.create(name="10-B", base=10, field=field)
+        self.today = date.today()
+        self.approvals = [
+            AttendanceApproval.objects.create(
+                teacher=self.teacher, student=student, classroom=self.classroom, status_requested="present", date=self.today
+            )
+            for student in self.students
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_if_user_is_not_admin_return_403(self):
+        # Arrange
+        self.client.force_authenticate(user=self.teacher)
+
+        # Act
+        response = self.client.post("/attending/review/bulk/", {"decision": "approved", "date": str(self.today)}, format="json")
+
+        # Assert
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_no_selection_is_given_return_400(self):
+        # Act
+        response = self.client.post("/attending/review/bulk/", {"decision": "approved"}, format="json")
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_listed_requests_are_decided_with_fixed_queries(self, django_assert_max_num_queries):
+        # Arrange
+        PresentAbsent.objects.create(user=self.students[0], classroom=self.classroom, date=self.today, status="absent")
+        approval_ids = [approval.id for approval in self.approvals]
+
+        # Act
+        # Includes loading the event type and level tables into the cold reference cache
+        # and recording the keyed award task.
+        with django_assert_max_num_queries(31):
+            response = self.client.post(
+                "/attending/review/bulk/",
+                {"decision": "approved", "approvals": approval_ids + [999]},
+                format="json"
+            )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == {
+            "reviewed": approval_ids,
+            "attendances_created": 2,
+            "already_recorded": [approval_ids[0]],
+            "skipped": [999],
+        }
+        assert set(AttendanceReview.objects.values_list("review_status", "reviewed_by")) == {("approved", self.admin.id)}
+        assert PresentAbsent.objects.get(user=self.students[0]).status == "absent"
+        assert PresentAbsent.objects.filter(status="present").count() == 2
+        assert AttendanceDailyStat.objects.get(classroom=self.classroom, date=self.today, status="present").count == 2
+        assert StudentProfile.objects.get(students=self.students[1]).total_point > 0
+
+    def test_filter_selects_pending_requests_of_date_and_classroom(self):
+        # Arrange
+        AttendanceApproval.objects.create(
+            teacher=self.teacher, student=self.students[0], classroom=self.other_classroom,
+            status_requested="absent", date=self.today
+        )
+        AttendanceApproval.objects.create(
+            teacher=self.teacher, student=self.students[0], classroom=self.classroom,
+            status_requested="absent", date=self.today - timedelta(days=1)
+        )
+        AttendanceReview.objects.filter(attending_approval=self.approvals[2]).update(review_status="approved")
+
+        # Act
+        response = self.client.post(
+            "/attending/review/bulk/",
+            {"decision": "rejected", "date": str(self.today), "classroom": self.classroom.id},
+            format="json"
+        )
+
+        # Assert
+        assert response.data["data"]["reviewed"] == [self.approvals[0].id, self.approvals[1].id]
+        assert set(PresentAbsent.objects.values_list("user", "status")) == {
+            (self.students[0].id, "absent"), (self.students[1].id, "absent")
+        }
+        assert AttendanceReview.objects.filter(review_status="pending").count() == 2
+
+    def test_if_student_has_no_profile_yet_decisions_are_kept_and_award_waits(self, settings):
+        # Arrange
+        settings.TASKS_BACKEND = "database"
+        StudentProfile.objects.filter(students=self.students[2]).delete()
+
+        # Act
+        response = self.client.post(
+            "/attending/review/bulk/",
+            {"decision": "approved", "approvals": [approval.id for approval in self.approvals]},
+            format="json"
+        )
+        run_pending()
+        StudentProfile.objects.create(students=self.students[2])
+        QueuedTask.objects.filter(status="pending").update(run_after=timezone.now())
+        run_pending()
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert PresentAbsent.objects.filter(status="present").count() == 3
+        assert [StudentProfile.objects.get(students=student).total_point for student in self.students] == [5, 5, 5]
@@ -0,0 +1,95 @@
+import pytest
+from datetime import date
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from present_absent.models import PresentAbsent, AttendanceDailyStat
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestGetAttendanceStatsView:
+    def setup_method(self):
+        self.teacher = create_user("test_teacher1", "teacher", 1)
+        self.student1 = create_user("test_student1", "student", 2)
+        self.student2 = create_user("test_student2", "student", 3)
+        field = Field.objects.create(name="Math")
+        self.classroom = ClassRoom.objects.create(name="10-A", base=10, field=field)
+        self.day = date(2025, 5, 10)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.teacher)
+
+    def create_attendance(self, student, status_value, day=None):
+        return PresentAbsent.objects.create(
+            user=student,
+            classroom=self.classroom,
+            status=status_value,
+            date=day or self.day
+        )
+
+    def test_rollup_follows_saves_and_deletes(self):
+        # Arrange
+        attendance = self.create_attendance(self.student1, "absent")
+        self.create_attendance(self.student2, "present")
+
+        # Act
+        attendance.status = "excused"
+        attendance.save()
+        self.create_attendance(self.student1, "present", date(2025, 5, 11)).delete()
+
+        # Assert
+        counts = dict(AttendanceDailyStat.objects.filter(count__gt=0).values_list("status", "count"))
+        assert counts == {"excused": 1, "present": 1}
+
+    def test_stats_return_classroom_and_student_rates(self):
+        # Arrange
+        self.create_attendance(self.student1, "present")
+        self.create_attendance(self.student2, "absent")
+        self.create_attendance(self.student1, "present", date(2025, 5, 11))
+
+        # Act
+        response = self.client.get(
+            "/attending/stats/",
+            {"from": "2025-05-01", "to": "2025-05-31", "classroom": self.classroom.id}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        classroom = response.data["classrooms"][0]
+        assert (classroom["present"], classroom["absent"], classroom["total"]) == (2, 1, 3)
+        students = {row["student"]: row for row in response.data["students"]}
+        assert students[self.student1.id]["present_rate"] == 1.0
+        assert students[self.student2.id]["absent_rate"] == 1.0
+
+    def test_rebuild_command_matches_incremental_rollup(self):
+        # Arrange
+        self.create_attendance(self.student1, "present")
+        self.create_attendance(self.student2, "absent")
+        expected = sorted(AttendanceDailyStat.objects.values_list("status", "count"))
+
+        # Act
+        call_command("rebuild_attendance_stats")
+
+        # Assert
+        assert sorted(AttendanceDailyStat.objects.values_list("status", "count")) == expected
+
+    def test_if_usertype_is_student_return_403(self):
+        # Arrange
+        self.client.force_authenticate(user=self.student1)
+
+        # Act
+        response = self.client.get("/attending/stats/")
+
+        # Assert
+        assert response.status_code == status.HTTP_403_FORBIDDEN
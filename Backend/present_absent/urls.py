@@ -11,14 +11,21 @@ from present_absent.attendance_approvald_views import (
     putAttendanceApprovaldView,
     deleteAttendanceApprovalView
 )
+from present_absent.attendance_bulk_views import postBulkAttendingView
+from present_absent.attendance_stats_views import getAttendanceStatsView
+from present_absent.attendance_export_views import getAttendingExportView
 from present_absent.attendance_review_views import (
     getAttendanceReview,
-    postAttendanceReview
+    postAttendanceReview,
+    postBulkAttendanceReview
 )
 
 urlpatterns = [
     path("attending/", getAttendingView),
     path("attending/create/", postAttendingView),
+    path("attending/bulk/", postBulkAttendingView),
+    path("attending/stats/", getAttendanceStatsView),
+    path("attending/export/", getAttendingExportView),
     path("attending/<int:attending_id>/update/", putAttendingView),
     path("attending/<int:attending_id>/delete/", deleteAttendingView),
 
@@ -29,4 +36,5 @@ urlpatterns = [
 
     path("attending/review/", getAttendanceReview),
     path("attending/review/create/", postAttendanceReview),
+    path("attending/review/bulk/", postBulkAttendanceReview),
 ]
@@ -20,14 +20,37 @@ from present_absent.models import PresentAbsent
 from present_absent.serializers import PresentAbsentSerializer
 from common.is_authenticated import authenticated_required
 from common.is_admin import admin_required
+from common.access import get_access
 from rest_framework.decorators import api_view
 from present_absent.permissions import attending_validations, check_attending_exist
 from rest_framework.response import Response 
-from rest_framework.pagination import PageNumberPagination
+from common.pagination import get_paginator, PAGINATION_PARAMETERS
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from rest_framework import status 
 
+# Helper returning the attendance records visible to the user, filtered like the list
+def get_attending_queryset(request):
+    """
+    Returns the attendance records visible to the requesting user, filtered by
+    the query parameters of the attendance list (also used by the export).
+    """
+    req_user = request.user 
+    queryset = PresentAbsent.objects.filter(user=req_user) if get_access(request).user_type != "admin" else PresentAbsent.objects.all() 
+    filters = {
+        "user__username": request.query_params.get("user"),
+        "status": request.query_params.get("status"),
+        "classroom__name": request.query_params.get("classroom"),
+        "date": request.query_params.get("date")
+    }
+    filters = {k:v for k,v in filters.items() if v}
+    queryset = queryset.filter(**filters)
+
+    search_query = request.query_params.get("search")
+    if search_query:
+        queryset = queryset.filter(user__username=search_query)
+    return queryset
+
 # API endpoint to retrieve a list of attendance records
 @swagger_auto_schema(
     method="get",
@@ -62,7 +85,7 @@ from rest_framework import status
             type=openapi.TYPE_STRING,
             description="Search by username"
         )
-    ]
+    ] + PAGINATION_PARAMETERS
 )
 @api_view(["GET"])
 @authenticated_required
@@ -75,23 +98,9 @@ def getAttendingView(request, *args, **kwargs):
     - Search functionality is available for usernames.
     - Pagination is applied with a default page size of 10.
     """
-    req_user = request.user 
-    queryset = PresentAbsent.objects.filter(user=req_user) if req_user.user_type != "admin" else PresentAbsent.objects.all() 
-    filters = {
-        "user__username": request.query_params.get("user"),
-        "status": request.query_params.get("status"),
-        "classroom__name": request.query_params.get("classroom"),
-        "date": request.query_params.get("date")
-    }
-    filters = {k:v for k,v in filters.items() if v}
-    queryset = queryset.filter(**filters)
-
-    search_query = request.query_params.get("search")
-    if search_query:
-        queryset = queryset.filter(user__username=search_query)
+    queryset = get_attending_queryset(request)
 
-    paginated = PageNumberPagination()
-    paginated.page_size = 10
+    paginated = get_paginator(request)
     paginated_queryset = paginated.paginate_queryset(queryset, request)
     serializer = PresentAbsentSerializer(paginated_queryset, many=True)
     return paginated.get_paginated_response(serializer.data)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from reportcard.models import ReportCard
+from reportcard.models import ReportCard, ReportCardRenderJob
 from django.contrib import messages
 
 @admin.register(ReportCard)
@@ -14,4 +14,21 @@ class ReportCardAdmin(admin.ModelAdmin):
     search_fields = ['user__username']
     ordering = ['grade', 'class_room']
     list_per_page = 10
-    list_filter = ['class_room']
\ No newline at end of file
+    list_select_related = ['user', 'class_room__field']
+    list_filter = ['class_room']
+
+@admin.register(ReportCardRenderJob)
+class ReportCardRenderJobAdmin(admin.ModelAdmin):
+    list_display = [
+        'id',
+        'status',
+        'total',
+        'rendered',
+        'skipped',
+        'requested_by',
+        'created_at',
+        'finished_at'
+    ]
+    list_filter = ['status']
+    list_select_related = ['requested_by']
+    readonly_fields = ['files', 'error']
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ReportcardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'reportcard'
+
+    def ready(self):
+        import reportcard.signals
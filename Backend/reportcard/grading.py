@@ -0,0 +1,63 @@
+"""
+Report Card Grading
+===================
+This module computes and stores `ReportCard.grade` so that reading a report card never recomputes it.
+
+Functions:
+1. `update_grade` - Recomputes and stores the grade of one report card instance.
+2. `recompute_grades` - Recomputes and stores the grades of many report cards in one pass.
+
+Key Features:
+- The grade is the sum of the report card scores divided by the number of distinct lessons, rounded to 2 decimals.
+- Grades are computed with a single aggregate query, however many report cards are involved.
+- The signals in `reportcard.signals` keep the stored value in sync when scores change.
+- `recompute_grades` writes with `bulk_update`, which sends no signal, so it drops the dashboards
+  (dashboard/snapshots.py) of the students whose grade changed itself.
+"""
+
+from decimal import Decimal
+from django.db.models import Sum, Count
+from reportcard.models import ReportCard
+from dashboard import snapshots
+
+def _grade(total_score, lesson_count):
+    if not lesson_count:
+        return Decimal("0.00")
+    return Decimal(str(round(total_score / lesson_count, 2))).quantize(Decimal("0.01"))
+
+def _with_grade_inputs(queryset):
+    return queryset.annotate(
+        total_score=Sum("scores__score_value"),
+        lesson_count=Count("scores__lesson", distinct=True)
+    )
+
+def update_grade(report_card):
+    """
+    Recomputes the grade of `report_card`, stores it and sets it on the instance.
+    """
+    rows = _with_grade_inputs(ReportCard.objects.filter(pk=report_card.pk)).values_list("total_score", "lesson_count")
+    for total_score, lesson_count in rows:
+        report_card.grade = _grade(total_score, lesson_count)
+        ReportCard.objects.filter(pk=report_card.pk).update(grade=report_card.grade)
+
+def recompute_grades(report_card_ids=None, batch_size=1000):
+    """
+    Recomputes and stores the grades of the given report cards (all of them if None).
+
+    Returns:
+        int: The number of report cards whose stored grade changed.
+    """
+    queryset = ReportCard.objects.all()
+    if report_card_ids is not None:
+        queryset = queryset.filter(id__in=list(report_card_ids))
+
+    rows = _with_grade_inputs(queryset).values_list("id", "user_id", "grade", "total_score", "lesson_count")
+
+    changed = [
+        ReportCard(id=report_card_id, user_id=user_id, grade=_grade(total_score, lesson_count))
+        for report_card_id, user_id, grade, total_score, lesson_count in rows.iterator(chunk_size=batch_size)
+        if grade != _grade(total_score, lesson_count)
+    ]
+    ReportCard.objects.bulk_update(changed, ["grade"], batch_size=batch_size)
+    snapshots.invalidate(report_card.user_id for report_card in changed)
+    return len(changed)
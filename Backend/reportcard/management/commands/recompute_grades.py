@@ -0,0 +1,19 @@
+"""
+Recomputes the stored `ReportCard.grade` of every report card.
+
+Grades are kept in sync by signals; this command backfills report cards
+created before grades were stored, or after scores were changed in bulk.
+
+Usage:
+    python manage.py recompute_grades
+"""
+
+from django.core.management.base import BaseCommand
+from reportcard.grading import recompute_grades
+
+class Command(BaseCommand):
+    help = "Recompute and store the grade of every report card."
+
+    def handle(self, *args, **options):
+        changed = recompute_grades()
+        self.stdout.write(self.style.SUCCESS(f"{changed} report card grade(s) updated."))
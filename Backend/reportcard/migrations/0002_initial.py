@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('reportcard', '0001_initial'),
+        ('score', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reportcard',
+            name='scores',
+            field=models.ManyToManyField(related_name='report_cards', to='score.score'),
+        ),
+    ]
@@ -40,3 +40,37 @@ class ReportCard(models.Model):
 
     def __str__(self):
         return f"ReportCard for {self.user} - Grade: {self.grade}"
+
+
+class ReportCardRenderJob(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed")
+    ]
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default="pending",
+        verbose_name="Status"
+    )
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='report_card_render_jobs'
+    )
+    # The report cards to render; empty means every report card.
+    report_card_ids = models.JSONField(default=list, blank=True)
+    total = models.PositiveIntegerField(default=0)
+    rendered = models.PositiveIntegerField(default=0)
+    skipped = models.PositiveIntegerField(default=0)
+    # Stored file name of every report card, keyed by report card id.
+    files = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Render job {self.pk} ({self.status})"
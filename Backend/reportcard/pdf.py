@@ -0,0 +1,85 @@
+"""
+Report Card PDF Writer
+======================
+This module writes simple text documents as PDF with reportlab.
+
+Functions:
+1. `write_pdf` - Returns the bytes of an A4 PDF with the given lines of text.
+
+Key Features:
+- Text is drawn with the DejaVu Sans fonts in reportcard/fonts, embedded by reportlab with the glyphs a
+  document uses, so Persian names print as they are written.
+- Right-to-left text is joined by arabic-reshaper and put in display order by python-bidi first.
+- Lines are laid out top to bottom and continue on a new page when a page is full.
+- Documents are written in reportlab's invariant mode, so the same lines always give the same bytes.
+- reportlab, arabic-reshaper and python-bidi are only needed to render; without them `write_pdf`
+  raises ImproperlyConfigured, which fails the render job with that message.
+"""
+
+import io
+import os
+from django.core.exceptions import ImproperlyConfigured
+
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+MARGIN = 56
+LINE_HEIGHT = 18
+
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+# Registered font name: font file; the first is the regular font, the second the bold one.
+FONT_FILES = {
+    "DejaVuSans": os.path.join(FONTS_DIR, "DejaVuSans.ttf"),
+    "DejaVuSans-Bold": os.path.join(FONTS_DIR, "DejaVuSans-Bold.ttf"),
+}
+REGULAR, BOLD = FONT_FILES
+
+def _libraries():
+    try:
+        import arabic_reshaper
+        from bidi.algorithm import get_display
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        from reportlab.pdfgen import canvas
+    except ImportError:
+        raise ImproperlyConfigured(
+            "Rendering report cards requires the reportlab, arabic-reshaper and python-bidi packages."
+        )
+    registered = set(pdfmetrics.getRegisteredFontNames())
+    for name, path in FONT_FILES.items():
+        if name not in registered:
+            pdfmetrics.registerFont(TTFont(name, path))
+    return canvas, lambda text: get_display(arabic_reshaper.reshape(text))
+
+def _paginate(lines):
+    per_page = (PAGE_HEIGHT - 2 * MARGIN) // LINE_HEIGHT - 2
+    return [lines[start:start + per_page] for start in range(0, len(lines), per_page)] or [[]]
+
+def write_pdf(lines):
+    """
+    Returns the PDF bytes of `lines`.
+
+    Args:
+        lines (list): Strings, (text, font size, bold) tuples, or lists of (x offset, text) cells.
+    """
+    canvas, display = _libraries()
+    output = io.BytesIO()
+    document = canvas.Canvas(output, pagesize=(PAGE_WIDTH, PAGE_HEIGHT), invariant=1)
+    for page_lines in _paginate(lines):
+        y = PAGE_HEIGHT - MARGIN
+        for line in page_lines:
+            # A line is a string, or a (text, size, bold) tuple, or a list of
+            # (x offset, text) cells for table rows.
+            if isinstance(line, tuple):
+                text, size, bold = line
+                cells = [(0, text)]
+            elif isinstance(line, list):
+                size, bold, cells = 11, False, line
+            else:
+                size, bold, cells = 11, False, [(0, line)]
+            document.setFont(BOLD if bold else REGULAR, size)
+            for x, text in cells:
+                document.drawString(MARGIN + x, y, display(str(text)))
+            y -= LINE_HEIGHT if size <= 12 else LINE_HEIGHT + size - 10
+        document.showPage()
+    document.save()
+    return output.getvalue()
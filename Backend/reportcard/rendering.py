@@ -0,0 +1,156 @@
+"""
+Report Card Rendering
+=====================
+This module renders report cards to PDF files for printing.
+
+Functions:
+1. `collect` - Reads what is printed on the given report cards, with a fixed number of queries.
+2. `file_name` - Returns the content-hash file name of a collected report card.
+3. `current_file_name` - Returns the file name of one report card with its current content.
+4. `render` - Returns the PDF bytes of a collected report card (runs in the worker processes).
+5. `render_report_cards` - Renders the given report cards and returns their file names.
+6. `run_job` - Runs a `ReportCardRenderJob` and records its progress and result (queued as the `reportcard.render_job` task).
+
+Key Features:
+- File names contain a hash of the printed content and of `LAYOUT_VERSION`, so a report card whose content did not change is not rendered again.
+- PDFs are rendered in a process pool of `settings.REPORTCARD_RENDER_WORKERS` processes (0 renders in this process).
+- Files are written to a local `FileSystemStorage` rooted at `settings.REPORTCARD_PDF_ROOT`.
+"""
+
+import hashlib
+import json
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.utils import timezone
+from reportcard.models import ReportCard, ReportCardRenderJob
+from reportcard.pdf import write_pdf
+
+def get_storage():
+    return FileSystemStorage(location=settings.REPORTCARD_PDF_ROOT)
+
+def collect(report_card_ids=None):
+    """
+    Returns {report card id: printed content} for the given report cards (all if None).
+    """
+    cards = ReportCard.objects.select_related("user", "class_room__field").order_by("id")
+    if report_card_ids is not None:
+        cards = cards.filter(id__in=list(report_card_ids))
+    cards = list(cards)
+
+    scores = defaultdict(list)
+    for report_card_id, lesson, score_value in ReportCard.scores.through.objects.filter(
+        reportcard_id__in=[card.id for card in cards]
+    ).order_by("score__lesson__name", "score_id").values_list("reportcard_id", "score__lesson__name", "score__score_value"):
+        scores[report_card_id].append([lesson, score_value])
+
+    return {
+        card.id: {
+            "id": card.id,
+            "student": card.user.get_full_name() or card.user.username,
+            "username": card.user.username,
+            "national_code": card.user.national_code,
+            "classroom": card.class_room.name,
+            "base": card.class_room.base,
+            "field": card.class_room.field.name,
+            "disciplinary_status": card.get_disciplinary_status_display(),
+            "grade": str(card.grade) if card.grade is not None else "-",
+            "scores": scores[card.id],
+        }
+        for card in cards
+    }
+
+# Part of the file name hash: changing the layout or the fonts renders every report card again.
+LAYOUT_VERSION = 3
+
+def file_name(content):
+    digest = hashlib.sha256(json.dumps([LAYOUT_VERSION, content], sort_keys=True).encode()).hexdigest()
+    return f"reportcard-{content['id']}-{digest[:20]}.pdf"
+
+def current_file_name(report_card_id):
+    """
+    Returns the file name the PDF of the report card has with its current content.
+    """
+    return file_name(collect([report_card_id])[report_card_id])
+
+def render(content):
+    """
+    Returns the PDF bytes of a report card collected by `collect`.
+    Only uses its argument, so it can run in a worker process.
+    """
+    lines = [
+        ("Report Card", 20, True),
+        "",
+        [(0, "Student"), (140, f"{content['student']} ({content['username']})")],
+        [(0, "National code"), (140, content["national_code"])],
+        [(0, "Classroom"), (140, f"{content['classroom']} - base {content['base']} - {content['field']}")],
+        [(0, "Discipline"), (140, content["disciplinary_status"])],
+        "",
+        ("Scores", 13, True),
+    ]
+    lines += [[(0, lesson), (300, f"{score_value:g}")] for lesson, score_value in content["scores"]]
+    if not content["scores"]:
+        lines.append("No scores recorded.")
+    lines += ["", [(0, "Grade"), (300, content["grade"])]]
+    return write_pdf(lines)
+
+def render_report_cards(report_card_ids=None, workers=None, progress=None):
+    """
+    Renders the given report cards (all if None) whose file does not exist yet.
+
+    Args:
+        report_card_ids: Ids of the report cards to render.
+        workers (int): Size of the process pool, defaults to `settings.REPORTCARD_RENDER_WORKERS`.
+        progress (callable): Called with (rendered, skipped) after every written file.
+
+    Returns:
+        tuple: ({report card id: file name}, number rendered, number skipped)
+    """
+    workers = getattr(settings, "REPORTCARD_RENDER_WORKERS", 0) if workers is None else workers
+    storage = get_storage()
+    names = {}
+    pending = []
+    for report_card_id, content in collect(report_card_ids).items():
+        names[report_card_id] = file_name(content)
+        if not storage.exists(names[report_card_id]):
+            pending.append(content)
+    skipped = len(names) - len(pending)
+
+    rendered = 0
+    if pending:
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            documents = pool.map(render, pending, chunksize=8) if pool else map(render, pending)
+            for content, document in zip(pending, documents):
+                storage.save(names[content["id"]], ContentFile(document))
+                rendered += 1
+                if progress:
+                    progress(rendered, skipped)
+        finally:
+            if pool:
+                pool.shutdown()
+    return names, rendered, skipped
+
+def run_job(job_id):
+    """
+    Runs the render job `job_id`, storing its progress, file names and outcome on the job row.
+    """
+    job = ReportCardRenderJob.objects.get(pk=job_id)
+    ids = job.report_card_ids or None
+    job.status = "running"
+    job.total = ReportCard.objects.filter(id__in=ids).count() if ids else ReportCard.objects.count()
+    job.save(update_fields=["status", "total"])
+
+    def progress(rendered, skipped):
+        ReportCardRenderJob.objects.filter(pk=job_id).update(rendered=rendered, skipped=skipped)
+
+    try:
+        job.files, job.rendered, job.skipped = render_report_cards(ids, progress=progress)
+        job.status = "done"
+    except Exception as error:
+        job.status = "failed"
+        job.error = str(error)
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "files", "rendered", "skipped", "error", "finished_at"])
@@ -0,0 +1,57 @@
+"""
+Report Card Export API
+======================
+This module streams report cards out as a file.
+1. GET `/reportcard/export/` - Download the report cards as CSV (default) or NDJSON.
+
+Key Features:
+- Accepts the same filters as GET `/reportcard/` and shows the same rows to the same users.
+- The stored grade is exported, so no score is read.
+- Rows are streamed from a `values_list` iterator, so memory stays flat whatever the number of report cards.
+"""
+
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from common.is_authenticated import authenticated_required
+from common.exporting import stream_export, get_export_format, EXPORT_PARAMETERS
+from reportcard.views import get_reportcard_queryset
+
+REPORTCARD_COLUMNS = [
+    ("id", "id"),
+    ("student", "user_id"),
+    ("username", "user__username"),
+    ("classroom", "class_room_id"),
+    ("classroom_name", "class_room__name"),
+    ("disciplinary_status", "disciplinary_status"),
+    ("grade", "grade"),
+    ("created_at", "created_at"),
+]
+
+@swagger_auto_schema(
+    method="get",
+    manual_parameters=[
+        openapi.Parameter("classroom", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Enter classroom of student"),
+        openapi.Parameter("disciplinary_status", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Enter a disciplinary status of student (very good, good, normal, bad, very bad)"),
+    ] + EXPORT_PARAMETERS
+)
+@api_view(["GET"])
+@authenticated_required
+def reportcardExportView(request, *args, **kwargs):
+    """
+    Streams the report cards visible to the user as a file.
+    - Admins export all report cards, other users their own.
+    """
+    file_format = get_export_format(request)
+    try:
+        queryset = get_reportcard_queryset(request)
+    except ValueError:
+        file_format = None
+    if file_format is None:
+        return Response(
+            {"detail":"Invalid data"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return stream_export(queryset, REPORTCARD_COLUMNS, file_format, "reportcards")
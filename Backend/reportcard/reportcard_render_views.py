@@ -0,0 +1,147 @@
+"""
+Report Card Rendering API
+=========================
+This module exposes the PDF rendering of report cards.
+1. POST `/reportcard/render/` - Start a background job rendering report cards to PDF (admin-only).
+2. GET `/reportcard/render/<job_id>/` - Get the status, progress and file names of a render job (admin-only).
+3. GET `/reportcard/<reportcard_id>/pdf/` - Download the PDF of one report card, or queue its rendering.
+
+Key Features:
+- Jobs run as `reportcard.render_job` tasks across a process pool; the request returns as soon as the job is queued.
+- Files are named after a hash of their content, so unchanged report cards are not rendered again.
+- Students can download their own report cards; admins can download all of them.
+- Downloads never render in the request: a PDF that is missing or out of date is queued and answered
+  with 202 and a Retry-After header.
+"""
+
+from django.http import FileResponse
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from common.is_authenticated import authenticated_required
+from common.is_admin import admin_required
+from common.access import get_access
+from reportcard.models import ReportCard, ReportCardRenderJob
+from reportcard.serializers import ReportCardRenderSerializer, ReportCardRenderJobSerializer
+from reportcard.permissions import check_reportcard_exists
+from reportcard.rendering import current_file_name, get_storage
+from reportcard.tasks import render_job, render_report_card
+
+@swagger_auto_schema(
+    method="post",
+    request_body=ReportCardRenderSerializer,
+    responses={
+        202: ReportCardRenderJobSerializer,
+        400: "Invalid data",
+        401: "Authenticated required",
+        403: "Forbidden"
+    }
+)
+@api_view(["POST"])
+@authenticated_required
+@admin_required
+def reportcardRenderView(request, *args, **kwargs):
+    """
+    Queues a job rendering report cards to PDF (admin-only).
+    - `report_cards` selects report cards by id, `classroom` every report card of a classroom.
+    - Without either, every report card is rendered.
+    """
+    serializer = ReportCardRenderSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(
+            {"detail":"Invalid data", "errors":serializer.errors},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    report_card_ids = serializer.validated_data.get("report_cards", [])
+    classroom_id = serializer.validated_data.get("classroom")
+    if classroom_id:
+        report_card_ids = list(
+            ReportCard.objects.filter(class_room_id=classroom_id).values_list("id", flat=True)
+        )
+        if not report_card_ids:
+            return Response(
+                {"detail":"This classroom has no report cards."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+    job = ReportCardRenderJob.objects.create(requested_by=request.user, report_card_ids=report_card_ids)
+    render_job.dispatch(job.pk, idempotency_key=f"reportcard_render:{job.pk}")
+    return Response(
+        {"detail":"Render job queued.", "data":ReportCardRenderJobSerializer(job).data},
+        status=status.HTTP_202_ACCEPTED
+    )
+
+@swagger_auto_schema(
+    method="get",
+    responses={
+        200: ReportCardRenderJobSerializer,
+        401: "Authenticated required",
+        403: "Forbidden",
+        404: "Not found"
+    }
+)
+@api_view(["GET"])
+@authenticated_required
+@admin_required
+def reportcardRenderStatusView(request, *args, **kwargs):
+    """
+    Returns the status of a render job (admin-only).
+    """
+    job = ReportCardRenderJob.objects.filter(id=kwargs.get("job_id")).first()
+    if job is None:
+        return Response(
+            {"detail":"Render job not found"},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return Response(
+        {"data":ReportCardRenderJobSerializer(job).data},
+        status=status.HTTP_200_OK
+    )
+
+@swagger_auto_schema(
+    method="get",
+    responses={
+        200: "PDF file",
+        202: "Rendering queued",
+        401: "Authenticated required",
+        403: "Forbidden",
+        404: "Not found"
+    }
+)
+@api_view(["GET"])
+@authenticated_required
+@check_reportcard_exists
+def reportcardPdfView(request, *args, **kwargs):
+    """
+    Returns the PDF of a report card.
+    - Students can only download their own report cards.
+    - A PDF that was not rendered with the current content is queued for rendering: the answer is 202
+      until it is ready.
+    """
+    user = request.user
+    reportcard = kwargs.get("reportcard")
+    if reportcard.user_id != user.id and not get_access(request).is_admin:
+        return Response(
+            {"detail":"You are not allowed to perform this action"},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    name = current_file_name(reportcard.id)
+    storage = get_storage()
+    if not storage.exists(name):
+        # Keyed by the content-hash name, so repeated downloads queue one rendering.
+        render_report_card.dispatch(reportcard.id, idempotency_key=f"reportcard_pdf:{name}")
+        return Response(
+            {"detail":"The PDF is being rendered, please retry shortly."},
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Retry-After":"5"}
+        )
+
+    return FileResponse(
+        storage.open(name, "rb"),
+        as_attachment=True,
+        filename=name,
+        content_type="application/pdf"
+    )
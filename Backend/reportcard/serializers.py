@@ -1,9 +1,11 @@
 from rest_framework import serializers 
-from reportcard.models import ReportCard 
-from score.models import Score 
+from reportcard.models import ReportCard, ReportCardRenderJob
+from common.querysets import OptimizedQuerysetMixin
 
-class ReportCardSerializer(serializers.ModelSerializer):
+class ReportCardSerializer(OptimizedQuerysetMixin, serializers.ModelSerializer):
+    prefetch_related_fields = ["scores"]
     grade = serializers.SerializerMethodField()
+
     class Meta:
         model = ReportCard 
         fields = [
@@ -16,12 +18,27 @@ class ReportCardSerializer(serializers.ModelSerializer):
         ]
 
     def get_grade(self, obj):
-        scores = obj.scores.all()
-        total_score = sum(score.score_value for score in scores)
-        lesson_count = scores.values("lesson").distinct().count()
+        # Stored by reportcard.grading whenever the scores change; served as a
+        # number, 0 for a report card without scores.
+        return float(obj.grade or 0)
+
+class ReportCardRenderSerializer(serializers.Serializer):
+    # Either explicit report cards, or every report card of a classroom;
+    # neither renders every report card.
+    report_cards = serializers.ListField(child=serializers.IntegerField(), required=False, allow_empty=False)
+    classroom = serializers.IntegerField(required=False)
 
-        if lesson_count == 0:
-            return 0
-        
-        average = total_score / lesson_count
-        return round(average, 2)
\ No newline at end of file
+class ReportCardRenderJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ReportCardRenderJob
+        fields = [
+            "id",
+            "status",
+            "total",
+            "rendered",
+            "skipped",
+            "files",
+            "error",
+            "created_at",
+            "finished_at"
+        ]
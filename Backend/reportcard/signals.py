@@ -0,0 +1,34 @@
+from django.db.models.signals import m2m_changed, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+from reportcard.models import ReportCard
+from reportcard.grading import update_grade, recompute_grades
+from score.models import Score
+
+@receiver(m2m_changed, sender=ReportCard.scores.through)
+def handle_report_card_scores_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ["post_add", "post_remove", "post_clear"]:
+            update_grade(instance)
+        return
+
+    # Reverse side: `instance` is a Score and the report cards are in pk_set,
+    # except for clear() where they have to be captured beforehand.
+    if action == "pre_clear":
+        instance._cleared_report_card_ids = list(instance.report_cards.values_list("id", flat=True))
+    elif action in ["post_add", "post_remove"]:
+        recompute_grades(pk_set)
+    elif action == "post_clear":
+        recompute_grades(getattr(instance, "_cleared_report_card_ids", []))
+
+@receiver(post_save, sender=Score)
+def handle_score_updated(sender, instance, created, **kwargs):
+    if not created:
+        recompute_grades(instance.report_cards.values_list("id", flat=True))
+
+@receiver(pre_delete, sender=Score)
+def capture_score_report_cards(sender, instance, **kwargs):
+    instance._report_card_ids = list(instance.report_cards.values_list("id", flat=True))
+
+@receiver(post_delete, sender=Score)
+def handle_score_deleted(sender, instance, **kwargs):
+    recompute_grades(getattr(instance, "_report_card_ids", []))
@@ -0,0 +1,13 @@
+from common.tasks import task
+from reportcard.rendering import run_job, render_report_cards
+
+# run_job records failures on the job row, so the task is not retried. Its progress
+# must be visible while it runs, so it is not run in one transaction.
+@task(name="reportcard.render_job", max_attempts=1, atomic=False)
+def render_job(job_id):
+    run_job(job_id)
+
+@task(name="reportcard.render_report_card")
+def render_report_card(report_card_id):
+    # Queued by a download of a PDF that is not rendered yet; existing files are skipped.
+    render_report_cards([report_card_id], workers=0)
@@ -0,0 +1,110 @@
+import pytest
+from decimal import Decimal
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+from score.models import Score
+from reportcard.models import ReportCard
+from reportcard.serializers import ReportCardSerializer
+
+@pytest.mark.django_db
+class TestReportCardGrade:
+    def setup_method(self):
+        self.student = User.objects.create_user(
+            username="test_student1",
+            password="string1234",
+            email="student@domain.com",
+            phone_number="09309500001",
+            national_code="0960030001",
+            user_type="student"
+        )
+        teacher = User.objects.create_user(
+            username="test_teacher1",
+            password="string1234",
+            email="teacher@domain.com",
+            phone_number="09309500002",
+            national_code="0960030002",
+            user_type="teacher"
+        )
+        field = Field.objects.create(name="Math")
+        self.classroom = ClassRoom.objects.create(name="10-A", base=10, field=field)
+        self.math = Lesson.objects.create(name="Math", teachers=teacher)
+        self.physics = Lesson.objects.create(name="Physics", teachers=teacher)
+        self.report_card = ReportCard.objects.create(
+            user=self.student,
+            class_room=self.classroom,
+            disciplinary_status="good"
+        )
+
+    def create_score(self, lesson, value):
+        return Score.objects.create(
+            students=self.student,
+            lesson=lesson,
+            classroom=self.classroom,
+            score_value=value
+        )
+
+    def test_grade_is_stored_when_scores_are_added(self):
+        # Act
+        self.report_card.scores.add(self.create_score(self.math, 18), self.create_score(self.physics, 15))
+
+        # Assert
+        self.report_card.refresh_from_db()
+        assert self.report_card.grade == Decimal("16.50")
+
+    def test_grade_follows_score_updates_and_deletes(self):
+        # Arrange
+        math_score = self.create_score(self.math, 18)
+        physics_score = self.create_score(self.physics, 15)
+        self.report_card.scores.add(math_score, physics_score)
+
+        # Act
+        math_score.score_value = 20
+        math_score.save()
+        after_update = ReportCard.objects.get(id=self.report_card.id).grade
+        physics_score.delete()
+        after_delete = ReportCard.objects.get(id=self.report_card.id).grade
+
+        # Assert
+        assert after_update == Decimal("17.50")
+        assert after_delete == Decimal("20.00")
+
+    def test_grade_is_serialized_as_a_number(self):
+        # Arrange
+        self.report_card.scores.add(self.create_score(self.math, 18), self.create_score(self.physics, 15))
+        empty_report_card = ReportCard.objects.create(user=self.student, class_room=self.classroom, disciplinary_status="good")
+
+        # Act
+        self.report_card.refresh_from_db()
+        grades = [ReportCardSerializer(report_card).data["grade"] for report_card in (self.report_card, empty_report_card)]
+
+        # Assert
+        assert grades == [16.5, 0]
+
+    def test_created_report_card_returns_its_grade(self):
+        # Arrange
+        admin = User.objects.create_user(
+            username="test_admin1",
+            password="string1234",
+            email="admin@domain.com",
+            phone_number="09309500003",
+            national_code="0960030003",
+            user_type="admin"
+        )
+        scores = [self.create_score(self.math, 18).id, self.create_score(self.physics, 15).id]
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        # Act
+        response = client.post(
+            "/reportcard/create/",
+            {"user": self.student.id, "class_room": self.classroom.id, "scores": scores, "disciplinary_status": "good"},
+            format="json"
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["data"]["grade"] == 16.5
@@ -0,0 +1,127 @@
+import pytest
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+from score.models import Score
+from reportcard.models import ReportCard, ReportCardRenderJob
+from common.models import QueuedTask
+from reportcard.rendering import render_report_cards, get_storage, collect, render
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestReportCardRendering:
+    @pytest.fixture(autouse=True)
+    def pdf_settings(self, settings, tmp_path):
+        settings.REPORTCARD_PDF_ROOT = tmp_path
+        settings.REPORTCARD_RENDER_WORKERS = 0
+
+    def setup_method(self):
+        self.admin = create_user("test_admin1", "admin", 1)
+        teacher = create_user("test_teacher1", "teacher", 2)
+        self.student = create_user("test_student1", "student", 3)
+        self.other_student = create_user("test_student2", "student", 4)
+        self.classroom = ClassRoom.objects.create(name="10-A", base=10, field=Field.objects.create(name="Math"))
+        lesson = Lesson.objects.create(name="Algebra", teachers=teacher)
+        self.score = Score.objects.create(students=self.student, lesson=lesson, classroom=self.classroom, score_value=18)
+        self.reportcard = ReportCard.objects.create(user=self.student, class_room=self.classroom, disciplinary_status="good")
+        self.reportcard.scores.add(self.score)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_unchanged_report_cards_are_not_rendered_again(self):
+        # Arrange
+        first_names, rendered, _ = render_report_cards([self.reportcard.id])
+
+        # Act
+        same_names, _, skipped = render_report_cards([self.reportcard.id])
+        self.score.score_value = 19
+        self.score.save()
+        new_names, rendered_again, _ = render_report_cards([self.reportcard.id])
+
+        # Assert
+        assert (rendered, skipped, rendered_again) == (1, 1, 1)
+        assert same_names == first_names
+        assert new_names != first_names
+        assert get_storage().open(first_names[self.reportcard.id]).read().startswith(b"%PDF")
+
+    def test_persian_names_are_drawn_with_embedded_font(self):
+        # Arrange
+        self.student.first_name, self.student.last_name = "علی", "رضایی"
+        self.student.save()
+        self.classroom.name = "دهم ریاضی"
+        self.classroom.save()
+        content = collect([self.reportcard.id])[self.reportcard.id]
+
+        # Act
+        document = render(content)
+
+        # Assert
+        assert render(content) == document
+        assert b"/FontFile2" in document and b"DejaVuSans" in document
+
+    def test_render_job_reports_its_files(self, django_capture_on_commit_callbacks):
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            response = self.client.post("/reportcard/render/", {"classroom": self.classroom.id}, format="json")
+        job_id = response.data["data"]["id"]
+        job_response = self.client.get(f"/reportcard/render/{job_id}/")
+
+        # Assert
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert job_response.data["data"]["status"] == "done"
+        assert job_response.data["data"]["total"] == 1
+        assert list(job_response.data["data"]["files"]) == [str(self.reportcard.id)]
+
+    def test_student_downloads_own_pdf_only(self):
+        # Arrange
+        self.client.force_authenticate(user=self.other_student)
+
+        # Act
+        forbidden = self.client.get(f"/reportcard/{self.reportcard.id}/pdf/")
+        self.client.force_authenticate(user=self.student)
+        queued = self.client.get(f"/reportcard/{self.reportcard.id}/pdf/")
+        response = self.client.get(f"/reportcard/{self.reportcard.id}/pdf/")
+
+        # Assert
+        assert forbidden.status_code == status.HTTP_403_FORBIDDEN
+        assert queued.status_code == status.HTTP_202_ACCEPTED
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/pdf"
+        assert b"".join(response.streaming_content).startswith(b"%PDF")
+
+    def test_if_user_is_not_admin_render_return_403(self):
+        # Arrange
+        self.client.force_authenticate(user=self.student)
+
+        # Act
+        response = self.client.post("/reportcard/render/", {}, format="json")
+
+        # Assert
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert ReportCardRenderJob.objects.count() == 0
+
+    def test_pdf_download_does_not_render_in_the_request(self, settings):
+        # Arrange
+        settings.TASKS_BACKEND = "database"
+        self.client.force_authenticate(user=self.student)
+
+        # Act
+        responses = [self.client.get(f"/reportcard/{self.reportcard.id}/pdf/") for _ in range(2)]
+
+        # Assert
+        assert [response.status_code for response in responses] == [status.HTTP_202_ACCEPTED] * 2
+        assert responses[0]["Retry-After"] == "5"
+        assert QueuedTask.objects.filter(name="reportcard.render_report_card").count() == 1
+        assert get_storage().listdir("")[1] == []
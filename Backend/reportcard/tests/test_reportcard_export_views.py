@@ -0,0 +1,50 @@
+import csv
+import pytest
+from io import StringIO
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from reportcard.models import ReportCard
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+def read_csv(response):
+    return list(csv.DictReader(StringIO(b"".join(response.streaming_content).decode())))
+
+@pytest.mark.django_db
+class TestReportcardExportView:
+    def setup_method(self):
+        self.admin = create_user("test_admin1", "admin", 1)
+        self.student = create_user("test_student1", "student", 2)
+        self.classroom = ClassRoom.objects.create(name="10-A", base=10, field=Field.objects.create(name="Math"))
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_export_includes_stored_grade(self):
+        # Arrange
+        ReportCard.objects.create(user=self.student, class_room=self.classroom, disciplinary_status="good")
+
+        # Act
+        response = self.client.get("/reportcard/export/", {"classroom": self.classroom.id})
+
+        # Assert
+        rows = read_csv(response)
+        assert [(row["username"], row["disciplinary_status"]) for row in rows] == [("test_student1", "good")]
+        assert "grade" in rows[0]
+
+    def test_if_classroom_filter_is_invalid_return_400(self):
+        # Act
+        response = self.client.get("/reportcard/export/", {"classroom": "abc"})
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
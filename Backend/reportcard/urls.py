@@ -1,9 +1,19 @@
 from django.urls import path 
 from reportcard.views import reportcardGetView, reportcardPostView, reportcardPutView, reportcardDeleteView
+from reportcard.reportcard_export_views import reportcardExportView
+from reportcard.reportcard_render_views import (
+    reportcardRenderView,
+    reportcardRenderStatusView,
+    reportcardPdfView
+)
 
 urlpatterns = [
     path("reportcard/", reportcardGetView, name="Get ReportCards"),
+    path("reportcard/export/", reportcardExportView, name="Export ReportCards"),
     path("reportcard/create/", reportcardPostView, name="Post ReportCards"),
     path("reportcard/<int:reportcard_id>/update/", reportcardPutView, name="Put ReportCards"),
     path("reportcard/<int:reportcard_id>/delete/", reportcardDeleteView, name="Delete ReportCards"),
+    path("reportcard/<int:reportcard_id>/pdf/", reportcardPdfView, name="Download ReportCard PDF"),
+    path("reportcard/render/", reportcardRenderView, name="Render ReportCards"),
+    path("reportcard/render/<int:job_id>/", reportcardRenderStatusView, name="ReportCard render job"),
 ]
@@ -20,14 +20,35 @@ from reportcard.models import ReportCard
 from reportcard.serializers import ReportCardSerializer
 from rest_framework.decorators import api_view 
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from common.pagination import get_paginator, PAGINATION_PARAMETERS
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from rest_framework import status
 from common.is_authenticated import authenticated_required
 from common.is_admin import admin_required
+from common.access import get_access
 from reportcard.permissions import validate_user_and_scores, check_reportcard_exists
 
+# Helper returning the report cards visible to the user, filtered like the list
+def get_reportcard_queryset(request):
+    """
+    Returns the report cards visible to the requesting user, filtered by the
+    query parameters of the report card list (also used by the export).
+    Raises ValueError if a filter value is invalid.
+    """
+    user = request.user 
+    if not get_access(request).is_admin:
+        queryset = ReportCard.objects.filter(user=user)
+    else:
+        queryset = ReportCard.objects.all()
+
+    filters = {
+        "class_room_id": request.query_params.get("classroom"),
+        "disciplinary_status__exact": request.query_params.get("disciplinary_status")
+    }
+    filters = {k: v for k, v in filters.items() if v} 
+    return queryset.filter(**filters)
+
 # API endpoint to retrieve a list of report cards
 @swagger_auto_schema(
     method="get",
@@ -44,7 +65,7 @@ from reportcard.permissions import validate_user_and_scores, check_reportcard_ex
             type=openapi.TYPE_STRING,
             description="Enter a disciplinary status of student (very good, good, normal, bad, very bad)"
         )
-    ]
+    ] + PAGINATION_PARAMETERS
 )
 @api_view(["GET"])
 @authenticated_required
@@ -56,27 +77,16 @@ def reportcardGetView(request, *args, **kwargs):
     - Filters can be applied using query parameters (e.g., classroom, disciplinary status).
     - Pagination is applied with a default page size of 10.
     """
-    user = request.user 
-    if (not user.is_staff) or (user.user_type != "admin"):
-        queryset = ReportCard.objects.filter(user=user)
-    else:
-        queryset = ReportCard.objects.all()
-
     try:    
-        filters = {
-            "class_room_id": request.query_params.get("classroom"),
-            "disciplinary_status__exact": request.query_params.get("disciplinary_status")
-        }
-        filters = {k: v for k, v in filters.items() if v} 
-        queryset = queryset.filter(**filters)
+        queryset = get_reportcard_queryset(request)
     except ValueError:
         return Response(
             {"detail":"Invalid data"},
             status=status.HTTP_400_BAD_REQUEST
         )   
     
-    paginated = PageNumberPagination()
-    paginated.page_size = 10
+    queryset = ReportCardSerializer.optimize_queryset(queryset)
+    paginated = get_paginator(request)
     paginated_queryset = paginated.paginate_queryset(queryset, request)
     serializer = ReportCardSerializer(paginated_queryset, many=True)
     return paginated.get_paginated_response(serializer.data)
@@ -106,6 +116,8 @@ def reportcardPostView(request):
     serializer = ReportCardSerializer(data=request.data)
     if serializer.is_valid():
         serializer.save()
+        # The grade was stored by the scores signal after the instance was saved.
+        serializer.instance.refresh_from_db(fields=["grade"])
         return Response(
             {"detail":"Report Card created successfully!", "data":serializer.data},
             status=status.HTTP_201_CREATED
@@ -139,6 +151,8 @@ def reportcardPutView(request, *args, **kwargs):
     serializer = ReportCardSerializer(reportcard, data=request.data, partial=True)
     if serializer.is_valid():
         serializer.save()
+        # The grade was stored by the scores signal after the instance was saved.
+        serializer.instance.refresh_from_db(fields=["grade"])
         return Response(
             {"detail":"ReportCard updated successfully!", "data":serializer.data},
             status=status.HTTP_200_OK
@@ -14,4 +14,5 @@ class ScoreAdmin(admin.ModelAdmin):
     search_fields = ['students__username']
     ordering = ['score_value', 'lesson', 'classroom']
     list_per_page = 10
+    list_select_related = ['students', 'lesson__teachers', 'classroom__field']
     list_filter = ['lesson', 'classroom']
\ No newline at end of file
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classroom', '0003_alter_classroom_updated_at'),
+        ('lesson', '0002_initial'),
+        ('score', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='score',
+            index=models.Index(fields=['students', 'lesson'], name='score_student_lesson_idx'),
+        ),
+    ]
@@ -32,5 +32,10 @@ class Score(models.Model):
         auto_now_add=True 
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["students", "lesson"], name="score_student_lesson_idx"),
+        ]
+
     def __str__(self):
         return f"{self.students}({self.score_value})"
\ No newline at end of file
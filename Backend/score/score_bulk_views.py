@@ -0,0 +1,159 @@
+"""
+Bulk Score API
+==============
+This module provides an endpoint that records the scores of a whole exam sheet in one request.
+1. POST `/score/bulk/` - Create the scores of many students of one classroom for one lesson.
+
+Key Features:
+- The whole sheet is validated with a fixed number of set-based queries instead of one lookup per student.
+- All scores are written with a single `bulk_create`; the "score_20" gamification events are awarded by one
+  queued task once they commit, so a student whose profile is not created yet does not fail the sheet.
+- All-or-nothing by default: one invalid row rejects the sheet. With `partial` the valid rows are saved and the invalid ones reported.
+"""
+
+from django.db import transaction
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from common.is_authenticated import authenticated_required
+from common.access import get_access
+from common import refcache
+from user.models import User
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+from score.models import Score
+from score.serializers import (
+    ScoreSerializer,
+    BulkScoreSerializer,
+    BulkScoreRowSerializer
+)
+from gamification.tasks import award_points_task
+from dashboard import snapshots
+
+lessons = refcache.register(Lesson)
+
+# Score value that earns the "score_20" gamification event (see score.signals).
+FULL_SCORE = 20
+
+@swagger_auto_schema(
+    method="post",
+    request_body=BulkScoreSerializer,
+    responses={
+        201: "Created",
+        400: "Invalid data",
+        401: "Authenticated required",
+        403: "Forbidden",
+        404: "Not found"
+    }
+)
+@api_view(["POST"])
+@authenticated_required
+def scoreBulkPostView(request, *args, **kwargs):
+    """
+    Records the scores of many students of one classroom for one lesson.
+    - Only teachers and administrators can create scores.
+    - Each row must reference a student of the classroom, with a score between 0 and 20.
+    - Invalid rows are returned in `errors` with their index.
+    """
+    if not get_access(request).can_manage:
+        return Response(
+            {"detail":"You are not allowed to create score"},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    serializer = BulkScoreSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(
+            {"detail":"Invalid data", "errors":serializer.errors},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    lesson_id = serializer.validated_data["lesson"]
+    classroom_id = serializer.validated_data["classroom"]
+    partial = serializer.validated_data["partial"]
+    rows = serializer.validated_data["scores"]
+
+    if not lessons.exists(lesson_id):
+        return Response(
+            {"detail":"Lesson not found."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    if not ClassRoom.objects.filter(id=classroom_id).exists():
+        return Response(
+            {"detail":"ClassRoom not found."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    errors = []
+    valid_rows = []
+    seen_students = set()
+    for index, row in enumerate(rows):
+        row_serializer = BulkScoreRowSerializer(data=row)
+        if not row_serializer.is_valid():
+            errors.append({"index":index, "errors":row_serializer.errors})
+            continue
+
+        student_id = row_serializer.validated_data["student"]
+        if student_id in seen_students:
+            errors.append({"index":index, "student":student_id, "detail":"Student is listed more than once."})
+            continue
+        seen_students.add(student_id)
+        valid_rows.append((index, row_serializer.validated_data))
+
+    # Two queries for the whole sheet: the students and the classroom's roster.
+    students = set(
+        User.objects.filter(
+            id__in=seen_students,
+            user_type="student"
+        ).values_list("id", flat=True)
+    )
+    members = get_access(request).classroom_student_ids(classroom_id)
+
+    scores = []
+    for index, row in valid_rows:
+        student_id = row["student"]
+        if student_id not in students:
+            detail = "Only students can get a score."
+        elif student_id not in members:
+            detail = "Mismatch between selected classroom and user."
+        else:
+            scores.append(
+                Score(
+                    students_id=student_id,
+                    lesson_id=lesson_id,
+                    classroom_id=classroom_id,
+                    score_value=row["score_value"]
+                )
+            )
+            continue
+        errors.append({"index":index, "student":student_id, "detail":detail})
+    errors.sort(key=lambda error: error["index"])
+
+    if (errors and not partial) or not scores:
+        return Response(
+            {"detail":"No score was recorded.", "errors":errors},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    # bulk_create does not send post_save, so the "score_20" award that
+    # handle_score_event makes for a single score, and the dashboard
+    # invalidation, are made here in batch.
+    full_score_ids = [score.students_id for score in scores if score.score_value == FULL_SCORE]
+    with transaction.atomic():
+        Score.objects.bulk_create(scores)
+        if full_score_ids:
+            # No idempotency key: the ids of the new scores are not known on every database,
+            # and the award is queued only once, with the sheet.
+            award_points_task.dispatch(full_score_ids, "score_20")
+        snapshots.invalidate(score.students_id for score in scores)
+
+    return Response(
+        {
+            "detail":f"{len(scores)} score(s) created successfully!",
+            "data":ScoreSerializer(scores, many=True).data,
+            "errors":errors
+        },
+        status=status.HTTP_201_CREATED
+    )
@@ -0,0 +1,53 @@
+"""
+Score Export API
+================
+This module streams scores out as a file.
+1. GET `/score/export/` - Download the scores as CSV (default) or NDJSON.
+
+Key Features:
+- Accepts the same filters as GET `/score/` and shows the same rows to the same users.
+- Rows are streamed from a `values_list` iterator, so memory stays flat whatever the number of scores.
+"""
+
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from common.is_authenticated import authenticated_required
+from common.exporting import stream_export, get_export_format, EXPORT_PARAMETERS
+from score.views import get_score_queryset
+
+SCORE_COLUMNS = [
+    ("id", "id"),
+    ("student", "students_id"),
+    ("username", "students__username"),
+    ("lesson", "lesson_id"),
+    ("lesson_name", "lesson__name"),
+    ("classroom", "classroom_id"),
+    ("classroom_name", "classroom__name"),
+    ("score_value", "score_value"),
+    ("created_at", "created_at"),
+]
+
+@swagger_auto_schema(
+    method="get",
+    manual_parameters=[
+        openapi.Parameter("lesson", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Enter a lesson id"),
+        openapi.Parameter("score_value", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Enter a score value"),
+    ] + EXPORT_PARAMETERS
+)
+@api_view(["GET"])
+@authenticated_required
+def scoreExportView(request, *args, **kwargs):
+    """
+    Streams the scores visible to the user as a file.
+    - Admin users export all scores, other users their own.
+    """
+    file_format = get_export_format(request)
+    if file_format is None:
+        return Response(
+            {"detail":"Invalid data"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return stream_export(get_score_queryset(request), SCORE_COLUMNS, file_format, "scores")
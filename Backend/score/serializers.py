@@ -10,4 +10,19 @@ class ScoreSerializer(serializers.ModelSerializer):
             "classroom",
             "score_value",
             "created_at"
-        ]
\ No newline at end of file
+        ]
+
+class BulkScoreRowSerializer(serializers.Serializer):
+    student = serializers.IntegerField()
+    score_value = serializers.FloatField(min_value=0, max_value=20)
+
+class BulkScoreSerializer(serializers.Serializer):
+    lesson = serializers.IntegerField()
+    classroom = serializers.IntegerField()
+    # All rows are rejected when one of them is invalid, unless `partial` is set.
+    partial = serializers.BooleanField(default=False)
+    # Rows are validated one by one in the view so that every bad row is reported back.
+    scores = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False
+    )
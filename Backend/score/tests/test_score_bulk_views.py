@@ -0,0 +1,134 @@
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+from score.models import Score
+from gamification.models import StudentProfile, StudentEvent
+from common.models import QueuedTask
+from common.tasks import run_pending
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+@pytest.mark.django_db
+class TestPostBulkScoreView:
+    def setup_method(self):
+        self.teacher = create_user("test_teacher1", "teacher", 1)
+        self.student1 = create_user("test_student1", "student", 2)
+        self.student2 = create_user("test_student2", "student", 3)
+        self.outsider = create_user("test_student3", "student", 4)
+        field = Field.objects.create(name="Math")
+        self.classroom = ClassRoom.objects.create(name="10-A", base=10, field=field)
+        self.classroom.students.add(self.student1, self.student2)
+        self.lesson = Lesson.objects.create(name="Algebra", teachers=self.teacher)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.teacher)
+
+    def sheet(self, scores, **extra):
+        return {"lesson": self.lesson.id, "classroom": self.classroom.id, "scores": scores, **extra}
+
+    def test_if_usertype_is_student_return_403(self):
+        # Arrange
+        self.client.force_authenticate(user=self.student1)
+
+        # Act
+        response = self.client.post("/score/bulk/", self.sheet([{"student": self.student1.id, "score_value": 20}]), format="json")
+
+        # Assert
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_sheet_is_valid_create_scores_and_award_full_scores(self, django_assert_max_num_queries):
+        # Arrange
+        sheet = self.sheet([
+            {"student": self.student1.id, "score_value": 20},
+            {"student": self.student2.id, "score_value": 17.5},
+        ])
+
+        # Act
+        # Fixed cost, cold reference caches (loaded, then reloaded once the
+        # EventType row is created) and savepoints included.
+        with django_assert_max_num_queries(20):
+            response = self.client.post("/score/bulk/", sheet, format="json")
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Score.objects.filter(lesson=self.lesson, classroom=self.classroom).count() == 2
+        assert StudentEvent.objects.filter(event_type__code="score_20").count() == 1
+        assert StudentProfile.objects.get(students=self.student1).total_point == 10
+        assert StudentProfile.objects.get(students=self.student2).total_point == 0
+
+    def test_if_one_row_is_invalid_nothing_is_created(self):
+        # Arrange
+        sheet = self.sheet([
+            {"student": self.student1.id, "score_value": 20},
+            {"student": self.outsider.id, "score_value": 15},
+            {"student": self.student2.id, "score_value": 25},
+        ])
+
+        # Act
+        response = self.client.post("/score/bulk/", sheet, format="json")
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert [error["index"] for error in response.data["errors"]] == [1, 2]
+        assert Score.objects.count() == 0
+        assert StudentEvent.objects.count() == 0
+
+    def test_if_partial_create_valid_rows_and_report_the_rest(self):
+        # Arrange
+        sheet = self.sheet([
+            {"student": self.student1.id, "score_value": 20},
+            {"student": self.outsider.id, "score_value": 15},
+        ], partial=True)
+
+        # Act
+        response = self.client.post("/score/bulk/", sheet, format="json")
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Score.objects.filter(students=self.student1).count() == 1
+        assert response.data["errors"][0]["detail"] == "Mismatch between selected classroom and user."
+
+    def test_if_lesson_does_not_exist_return_404(self):
+        # Act
+        response = self.client.post(
+            "/score/bulk/",
+            {"lesson": 999, "classroom": self.classroom.id, "scores": [{"student": self.student1.id, "score_value": 10}]},
+            format="json"
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_if_student_has_no_profile_yet_sheet_is_saved_and_award_waits(self, settings):
+        # Arrange
+        settings.TASKS_BACKEND = "database"
+        StudentProfile.objects.filter(students=self.student2).delete()
+        sheet = self.sheet([
+            {"student": self.student1.id, "score_value": 20},
+            {"student": self.student2.id, "score_value": 20},
+        ])
+
+        # Act
+        response = self.client.post("/score/bulk/", sheet, format="json")
+        run_pending()
+        StudentProfile.objects.create(students=self.student2)
+        QueuedTask.objects.filter(status="pending").update(run_after=timezone.now())
+        run_pending()
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Score.objects.filter(lesson=self.lesson).count() == 2
+        assert StudentProfile.objects.get(students=self.student1).total_point == 10
+        assert StudentProfile.objects.get(students=self.student2).total_point == 10
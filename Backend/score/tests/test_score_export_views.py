@@ -0,0 +1,80 @@
+import csv
+import json
+import pytest
+from io import StringIO
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+from score.models import Score
+
+def create_user(username, user_type, index):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type
+    )
+
+def read_csv(response):
+    return list(csv.DictReader(StringIO(b"".join(response.streaming_content).decode())))
+
+@pytest.mark.django_db
+class TestScoreExportView:
+    def setup_method(self):
+        self.admin = create_user("test_admin1", "admin", 1)
+        teacher = create_user("test_teacher1", "teacher", 2)
+        self.student1 = create_user("test_student1", "student", 3)
+        self.student2 = create_user("test_student2", "student", 4)
+        classroom = ClassRoom.objects.create(name="10-A", base=10, field=Field.objects.create(name="Math"))
+        self.algebra = Lesson.objects.create(name="Algebra", teachers=teacher)
+        geometry = Lesson.objects.create(name="Geometry", teachers=teacher)
+        for student, lesson, value in [
+            (self.student1, self.algebra, 18),
+            (self.student1, geometry, 12),
+            (self.student2, self.algebra, 15),
+        ]:
+            Score.objects.create(students=student, lesson=lesson, classroom=classroom, score_value=value)
+        self.client = APIClient()
+
+    def test_admin_exports_filtered_scores_as_csv(self, django_assert_num_queries):
+        # Arrange
+        self.client.force_authenticate(user=self.admin)
+
+        # Act
+        response = self.client.get("/score/export/", {"lesson": self.algebra.id})
+        with django_assert_num_queries(1):
+            rows = read_csv(response)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+        assert [(row["username"], row["lesson_name"], row["score_value"]) for row in rows] == [
+            ("test_student1", "Algebra", "18.0"),
+            ("test_student2", "Algebra", "15.0"),
+        ]
+
+    def test_student_exports_own_scores_as_ndjson(self):
+        # Arrange
+        self.client.force_authenticate(user=self.student2)
+
+        # Act
+        response = self.client.get("/score/export/", {"file_format": "ndjson"})
+
+        # Assert
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        assert [(row["student"], row["score_value"]) for row in rows] == [(self.student2.id, 15.0)]
+
+    def test_if_format_is_not_supported_return_400(self):
+        # Arrange
+        self.client.force_authenticate(user=self.admin)
+
+        # Act
+        response = self.client.get("/score/export/", {"file_format": "xml"})
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
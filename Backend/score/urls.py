@@ -1,9 +1,13 @@
 from django.urls import path 
 from score.views import scoreGetView, scorePostView, scorePutView, scoreDeleteView
+from score.score_bulk_views import scoreBulkPostView
+from score.score_export_views import scoreExportView
 
 urlpatterns = [
     path("score/", scoreGetView, name="Get scores"),
     path("score/created/", scorePostView, name="Post scores"),
+    path("score/bulk/", scoreBulkPostView, name="Post bulk scores"),
+    path("score/export/", scoreExportView, name="Export scores"),
     path("score/<int:score_value_id>/update/", scorePutView, name="Put scores"),
     path("score/<int:score_value_id>/delete/", scoreDeleteView, name="Delete scores")
 ]
@@ -3,13 +3,34 @@ from score.models import Score
 from score.serializers import ScoreSerializer 
 
 from common.is_authenticated import authenticated_required
+from common.access import get_access
 from rest_framework.decorators import api_view 
 from rest_framework.response import Response 
 from rest_framework import status 
-from rest_framework.pagination import PageNumberPagination
+from common.pagination import get_paginator, PAGINATION_PARAMETERS
 from drf_yasg.utils import swagger_auto_schema 
 from drf_yasg import openapi
 
+# ---------------------------------
+# Helper: Scores visible to the user, filtered like the list
+# ---------------------------------
+def get_score_queryset(request):
+    """
+    Returns the scores visible to the requesting user, filtered by the query
+    parameters of the score list (also used by the score export).
+    """
+    user = request.user 
+    # Determine the queryset based on user type
+    queryset = Score.objects.filter(students=user) if not get_access(request).is_admin else Score.objects.all()
+
+    # Apply filters based on query parameters
+    filters = {
+        "lesson": request.query_params.get("lesson"),
+        "score_value": request.query_params.get("score_value")
+    }
+    filters = {k: v for k, v in filters.items() if v}  # Remove empty filters
+    return queryset.filter(**filters)
+
 # ---------------------------------
 # GET View: Retrieve a list of scores
 # ---------------------------------
@@ -30,7 +51,7 @@ from drf_yasg import openapi
                 type=openapi.TYPE_STRING,
                 description="Enter a score value"
             )
-        ]
+        ] + PAGINATION_PARAMETERS
 )
 @api_view(["GET"])
 @authenticated_required
@@ -41,21 +62,10 @@ def scoreGetView(request, *args, **kwargs):
     - Non-admin users can only see their own scores.
     - Supports filtering by lesson and score value.
     """
-    user = request.user 
-    # Determine the queryset based on user type
-    queryset = Score.objects.filter(students=user) if (not user.is_staff) or (user.user_type != "admin") else Score.objects.all()
-
-    # Apply filters based on query parameters
-    filters = {
-        "lesson": request.query_params.get("lesson"),
-        "score_value": request.query_params.get("score_value")
-    }
-    filters = {k: v for k, v in filters.items() if v}  # Remove empty filters
-    queryset = queryset.filter(**filters)
+    queryset = get_score_queryset(request)
 
     # Paginate the results for better performance and usability
-    paginator = PageNumberPagination()
-    paginator.page_size = 10 
+    paginator = get_paginator(request)
     paginated_queryset = paginator.paginate_queryset(queryset, request)
     serializer = ScoreSerializer(paginated_queryset, many=True)
     return paginator.get_paginated_response(serializer.data)
@@ -83,11 +93,11 @@ def scorePostView(request):
     - Returns the created score on success.
     - Restricted to authenticated users with teacher or admin roles.
     """
-    user = request.user 
+    access = get_access(request)
 
     # Check if the user has the required permissions
-    if not user.is_staff:
-        if (user.user_type != "teacher"):
+    if not access.is_staff:
+        if not access.is_teacher:
             return Response(
                 {"detail":"You are not allowed to create score"},
                 status=status.HTTP_403_FORBIDDEN
@@ -133,10 +143,10 @@ def scorePutView(request, *args, **kwargs):
     - Validates the input data and updates the score.
     - Returns the updated score on success or appropriate error messages.
     """
-    user = request.user 
+    access = get_access(request)
     # Check if the user has the required permissions
-    if not user.is_staff:
-        if (user.user_type != "teacher"):
+    if not access.is_staff:
+        if not access.is_teacher:
             return Response(
                 {"detail":"You are not allowed to updated score"},
                 status=status.HTTP_403_FORBIDDEN
@@ -191,10 +201,10 @@ def scoreDeleteView(request, *args, **kwargs):
     - Deletes the score by its ID.
     - Returns a success message or appropriate error responses.
     """
-    user = request.user 
+    access = get_access(request)
     # Check if the user has the required permissions
-    if not user.is_staff:
-        if user.user_type != "teacher":
+    if not access.is_staff:
+        if not access.is_teacher:
             return Response(
                 {"detail":"You are not allowed to deleted score"},
                 status=status.HTTP_403_FORBIDDEN
@@ -0,0 +1,197 @@
+"""
+Search Index
+============
+This module keeps the search index (`SearchDocument`, `SearchTerm`) of users, classrooms, lessons and events
+and ranks documents for a query.
+
+Functions:
+1. `words` - Splits a text into normalized words.
+2. `trigrams` - Returns the trigrams of a word.
+3. `index` - (Re)writes the documents of the given rows of a kind; rows that no longer exist are dropped.
+4. `rebuild` - Rewrites the whole index, or the index of some kinds.
+5. `search` - Returns the documents matching a query, best first.
+
+Key Features:
+- Words are lowercased and stripped of accents; `_` and punctuation split words, so `test_student1`
+  is found by `student`.
+- Every word is stored once per trigram of `"  word "`; the rows of a word serve both its prefix lookups
+  (`word LIKE 'q%'`, which uses the index on MySQL) and trigram lookups.
+- A query word matches a word of a document exactly (score 1), by prefix (0.5 to 1, longer matched part
+  scores higher) or by trigram similarity of at least `settings.SEARCH_SIMILARITY_THRESHOLD` (half the
+  similarity). A document must match every query word; its score is the sum of its best matches.
+- Ranking is done in Python over plain indexed lookups, so SQLite and MySQL return the same results.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict, namedtuple
+from django.conf import settings
+from django.db import transaction
+from user.models import User
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+from event.models import Event
+from search.models import SearchDocument, SearchTerm
+
+MAX_QUERY_WORDS = 8
+
+_WORD = re.compile(r"[^\W_]+")
+
+# fields: the columns a document is built from; saves that touch none of them are not reindexed.
+# document: row -> (title, subtitle, indexed texts).
+Source = namedtuple("Source", ["model", "fields", "document"])
+
+SOURCES = {
+    "user": Source(
+        User,
+        ("username", "first_name", "last_name", "phone_number", "national_code", "user_type"),
+        lambda user: (
+            user.get_full_name() or user.username,
+            f"{user.username} ({user.user_type})",
+            [user.username, user.first_name, user.last_name, user.phone_number, user.national_code]
+        )
+    ),
+    "classroom": Source(
+        ClassRoom,
+        ("name", "base"),
+        lambda classroom: (classroom.name, f"Base {classroom.base}", [classroom.name])
+    ),
+    "lesson": Source(
+        Lesson,
+        ("name",),
+        lambda lesson: (lesson.name, "", [lesson.name])
+    ),
+    "event": Source(
+        Event,
+        ("name", "date", "time"),
+        lambda event: (event.name, f"{event.date} {event.time:%H:%M}", [event.name])
+    ),
+}
+
+def kind_of(model):
+    for kind, source in SOURCES.items():
+        if source.model is model:
+            return kind
+    return None
+
+def _normalize(text):
+    text = unicodedata.normalize("NFKD", str(text or ""))
+    return "".join(char for char in text if not unicodedata.combining(char)).casefold()
+
+def words(text):
+    return [word[:64] for word in _WORD.findall(_normalize(text))]
+
+def trigrams(word):
+    padded = f"  {word} "
+    return {padded[start:start + 3] for start in range(len(padded) - 2)}
+
+def _chunks(ids, size):
+    ids = list(ids)
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+def index(kind, ids, batch_size=1000):
+    """
+    Rewrites the documents of the rows of `kind` with primary keys `ids` and returns how many were written.
+    """
+    source = SOURCES[kind]
+    written = 0
+    for chunk in _chunks(ids, batch_size):
+        documents = {}
+        for row in source.model.objects.filter(pk__in=chunk).only(*source.fields):
+            title, subtitle, texts = source.document(row)
+            documents[row.pk] = (title, subtitle, {word for text in texts for word in words(text)})
+
+        with transaction.atomic():
+            SearchDocument.objects.filter(kind=kind, object_id__in=chunk).delete()
+            SearchDocument.objects.bulk_create(
+                [
+                    SearchDocument(kind=kind, object_id=object_id, title=title[:255], subtitle=subtitle[:255])
+                    for object_id, (title, subtitle, _) in documents.items()
+                ],
+                batch_size=batch_size
+            )
+            # MySQL does not return primary keys from bulk_create, so they are read back.
+            document_ids = dict(
+                SearchDocument.objects.filter(kind=kind, object_id__in=documents).values_list("object_id", "id")
+            )
+            SearchTerm.objects.bulk_create(
+                (
+                    SearchTerm(document_id=document_ids[object_id], word=word, trigram=trigram)
+                    for object_id, (_, _, document_words) in documents.items()
+                    for word in sorted(document_words)
+                    for trigram in sorted(trigrams(word))
+                ),
+                batch_size=batch_size
+            )
+        written += len(documents)
+    return written
+
+def rebuild(kinds=None, batch_size=1000):
+    """
+    Drops and rewrites the index of `kinds` (all kinds by default); returns the documents written per kind.
+    """
+    counts = {}
+    for kind in kinds or SOURCES:
+        SearchDocument.objects.filter(kind=kind).delete()
+        ids = list(SOURCES[kind].model.objects.order_by("pk").values_list("pk", flat=True))
+        counts[kind] = index(kind, ids, batch_size=batch_size)
+    return counts
+
+def _matches(terms, query_word):
+    """
+    Returns {document id: best score of `query_word` among the words of the document}.
+    """
+    best = {}
+    for document_id, word in terms.filter(word__startswith=query_word).values_list("document_id", "word").distinct():
+        score = 0.5 + 0.5 * len(query_word) / len(word)
+        best[document_id] = max(best.get(document_id, 0), score)
+
+    # Trigrams of words shorter than three letters match almost everything.
+    if len(query_word) < 3:
+        return best
+
+    query_trigrams = trigrams(query_word)
+    shared = defaultdict(int)
+    for word, _ in terms.filter(trigram__in=query_trigrams).values_list("word", "trigram").distinct():
+        shared[word] += 1
+    threshold = getattr(settings, "SEARCH_SIMILARITY_THRESHOLD", 0.3)
+    similar = {}
+    for word, count in shared.items():
+        similarity = count / (len(query_trigrams) + len(trigrams(word)) - count)
+        if similarity >= threshold and not word.startswith(query_word):
+            similar[word] = 0.5 * similarity
+    if similar:
+        for document_id, word in terms.filter(word__in=similar).values_list("document_id", "word").distinct():
+            best[document_id] = max(best.get(document_id, 0), similar[word])
+    return best
+
+def search(query, documents=None, limit=20):
+    """
+    Returns up to `limit` (document, score) pairs matching `query`, best first.
+
+    Args:
+        query (str): The text searched for.
+        documents (QuerySet): The `SearchDocument`s that may be returned, e.g. the ones visible to a user.
+        limit (int): The maximum number of results.
+    """
+    query_words = list(dict.fromkeys(words(query)))[:MAX_QUERY_WORDS]
+    if not query_words:
+        return []
+
+    terms = SearchTerm.objects.all()
+    if documents is not None:
+        terms = terms.filter(document__in=documents)
+
+    scores = None
+    for query_word in query_words:
+        matches = _matches(terms, query_word)
+        if scores is not None:
+            matches = {document_id: scores[document_id] + score for document_id, score in matches.items() if document_id in scores}
+        scores = matches
+        if not scores:
+            return []
+
+    ranked = sorted(scores.items(), key=lambda item: (-round(item[1], 6), item[0]))[:limit]
+    found = SearchDocument.objects.in_bulk([document_id for document_id, _ in ranked])
+    return [(found[document_id], round(score, 4)) for document_id, score in ranked if document_id in found]
@@ -0,0 +1,28 @@
+"""
+Rebuilds the search index (see `search.indexing`).
+
+Signals keep the index up to date for rows saved through the ORM. Run this after
+loading rows with raw SQL, restoring a backup, or changing what is indexed.
+
+Usage:
+    python manage.py rebuild_search_index [--kind user --kind event] [--batch-size 1000]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from search.indexing import SOURCES, rebuild
+
+class Command(BaseCommand):
+    help = "Drop and rewrite the search index."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--kind", action="append", choices=list(SOURCES), help="Kind to rebuild; may be repeated. Defaults to all.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows indexed per transaction.")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        counts = rebuild(options["kind"], batch_size=options["batch_size"])
+        for kind, count in counts.items():
+            self.stdout.write(f"{kind}: {count}")
+        self.stderr.write(self.style.SUCCESS(f"Indexed {sum(counts.values())} documents."))
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('user', 'User'), ('classroom', 'Classroom'), ('lesson', 'Lesson'), ('event', 'Event')], max_length=20, verbose_name='Kind')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=255, verbose_name='Title')),
+                ('subtitle', models.CharField(blank=True, default='', max_length=255, verbose_name='Subtitle')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_document')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word', models.CharField(max_length=64)),
+                ('trigram', models.CharField(max_length=3)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='search.searchdocument')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['word'], name='search_term_word_idx'), models.Index(fields=['trigram', 'word'], name='search_term_trigram_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+from django.db import models
+
+class SearchDocument(models.Model):
+    KIND_CHOICES = [
+        ("user", "User"),
+        ("classroom", "Classroom"),
+        ("lesson", "Lesson"),
+        ("event", "Event")
+    ]
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, verbose_name="Kind")
+    # Primary key of the indexed row; see search/indexing.py for the model of each kind.
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=255, verbose_name="Title")
+    subtitle = models.CharField(max_length=255, blank=True, default="", verbose_name="Subtitle")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="unique_search_document"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}: {self.title}"
+
+class SearchTerm(models.Model):
+    """
+    One trigram of one word of a document. The rows of a word also serve its
+    prefix lookups, so `word` and `trigram` are both indexed.
+    """
+    document = models.ForeignKey(
+        SearchDocument,
+        on_delete=models.CASCADE,
+        related_name="terms"
+    )
+    word = models.CharField(max_length=64)
+    trigram = models.CharField(max_length=3)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["word"], name="search_term_word_idx"),
+            models.Index(fields=["trigram", "word"], name="search_term_trigram_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.word} ({self.trigram})"
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_save, post_delete
+from search import indexing
+from search.tasks import index_task
+
+def reindex(sender, instance, update_fields=None, **kwargs):
+    # Saves of other columns only (e.g. `last_login` on every login) leave the document as it is.
+    kind = indexing.kind_of(sender)
+    if update_fields is not None and not set(update_fields) & set(indexing.SOURCES[kind].fields):
+        return
+    index_task.dispatch(kind, [instance.pk])
+
+for kind, source in indexing.SOURCES.items():
+    post_save.connect(reindex, sender=source.model, dispatch_uid=f"search-save-{kind}")
+    post_delete.connect(reindex, sender=source.model, dispatch_uid=f"search-delete-{kind}")
@@ -0,0 +1,7 @@
+from common.tasks import task
+from search import indexing
+
+@task(name="search.index")
+def index_task(kind, ids):
+    # Rows deleted in the meantime are dropped from the index.
+    indexing.index(kind, ids)
@@ -0,0 +1,113 @@
+import pytest
+from datetime import date, time
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from field.models import Field
+from classroom.models import ClassRoom
+from lesson.models import Lesson
+from event.models import Event
+from search.models import SearchDocument
+from search import indexing
+
+def create_user(username, user_type, index, **extra):
+    return User.objects.create_user(
+        username=username,
+        password="string1234",
+        email=f"{username}@domain.com",
+        phone_number=f"0930950{index:04d}",
+        national_code=f"096003{index:04d}",
+        user_type=user_type,
+        **extra
+    )
+
+@pytest.mark.django_db
+class TestSearch:
+    def setup_method(self):
+        self.admin = create_user("test_admin1", "admin", 1)
+        self.student = create_user("test_student1", "student", 2, first_name="Sara", last_name="Ahmadi")
+        self.teacher = create_user("test_teacher1", "teacher", 3, first_name="Reza", last_name="Karimi")
+        field = Field.objects.create(name="Math")
+        self.enrolled = ClassRoom.objects.create(name="Mathematics 10", base=10, field=field)
+        self.enrolled.students.add(self.student)
+        self.other = ClassRoom.objects.create(name="Mathematics 11", base=11, field=field)
+        self.lesson = Lesson.objects.create(name="Algebra", teachers=self.teacher)
+        self.event = Event.objects.create(name="Science fair", description="Yearly fair", date=date(2030, 1, 1), time=time(9, 0))
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def results(self, response):
+        return [(result["kind"], result["id"]) for result in response.data["results"]]
+
+    def test_prefix_matches_rank_closer_words_first(self):
+        # Act
+        response = self.client.get("/search/", {"q": "math"})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert self.results(response) == [("classroom", self.enrolled.id), ("classroom", self.other.id)]
+
+        exact = self.client.get("/search/", {"q": "mathematics 11"})
+        assert self.results(exact)[0] == ("classroom", self.other.id)
+        assert exact.data["results"][0]["score"] == 2
+
+    def test_fuzzy_match_finds_misspelled_words(self):
+        # Act
+        response = self.client.get("/search/", {"q": "Karimy"})
+
+        # Assert
+        assert self.results(response) == [("user", self.teacher.id)]
+        assert response.data["results"][0]["title"] == "Reza Karimi"
+        assert 0 < response.data["results"][0]["score"] < 0.5
+
+    def test_words_are_normalized(self):
+        # Act
+        response = self.client.get("/search/", {"q": "SCIENCE Fäir", "kinds": "event,lesson"})
+
+        # Assert
+        assert self.results(response) == [("event", self.event.id)]
+
+    def test_index_follows_saves_and_deletes(self):
+        # Act
+        self.lesson.name = "Geometry"
+        self.lesson.save()
+        self.event.delete()
+
+        # Assert
+        assert self.results(self.client.get("/search/", {"q": "geometry"})) == [("lesson", self.lesson.id)]
+        assert self.results(self.client.get("/search/", {"q": "algebra"})) == []
+        assert not SearchDocument.objects.filter(kind="event").exists()
+
+    def test_students_only_find_themselves_and_their_classrooms(self):
+        # Arrange
+        self.client.force_authenticate(user=self.student)
+
+        # Act
+        users = self.client.get("/search/", {"q": "test", "kinds": "user"})
+        classrooms = self.client.get("/search/", {"q": "mathematics", "kinds": "classroom"})
+
+        # Assert
+        assert self.results(users) == [("user", self.student.id)]
+        assert self.results(classrooms) == [("classroom", self.enrolled.id)]
+
+    def test_rebuild_restores_rows_written_without_signals(self):
+        # Arrange
+        SearchDocument.objects.all().delete()
+        Event.objects.bulk_create([Event(name="Book day", description="Books", date=date(2030, 2, 1), time=time(9, 0))])
+
+        # Act
+        call_command("rebuild_search_index", "--kind", "event", stderr=None)
+
+        # Assert
+        assert SearchDocument.objects.filter(kind="event").count() == 2
+        assert indexing.search("book")[0][0].title == "Book day"
+
+    def test_if_query_or_kind_is_invalid_return_400(self):
+        # Act
+        missing = self.client.get("/search/")
+        unknown = self.client.get("/search/", {"q": "math", "kinds": "score"})
+
+        # Assert
+        assert missing.status_code == status.HTTP_400_BAD_REQUEST
+        assert unknown.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,6 @@
+from django.urls import path
+from search.views import searchView
+
+urlpatterns = [
+    path('search/', searchView, name='search'),
+]
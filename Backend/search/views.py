@@ -0,0 +1,90 @@
+"""
+Search API
+==========
+This module provides one search endpoint over users, classrooms, lessons and events.
+1. GET `/search/` - Ranked prefix and fuzzy matches of `q`.
+
+Key Features:
+- Reads the search index (search/indexing.py) instead of `icontains` scans of each table.
+- Results only include what the user may list elsewhere: staff see every user and classroom, other users
+  see themselves and the classrooms they are enrolled in. Lessons and events are visible to everyone.
+- `kinds` narrows the search to some of `user`, `classroom`, `lesson` and `event`.
+"""
+
+from django.db.models import Q
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from common.is_authenticated import authenticated_required
+from common.access import get_access
+from search import indexing
+from search.models import SearchDocument
+
+MAX_LIMIT = 50
+
+def _visible_documents(access, kinds):
+    documents = SearchDocument.objects.filter(kind__in=kinds)
+    if access.is_staff:
+        return documents
+    return documents.filter(
+        Q(kind__in=["lesson", "event"]) |
+        Q(kind="user", object_id=access.user_id) |
+        Q(kind="classroom", object_id__in=access.enrolled_classroom_ids)
+    )
+
+@swagger_auto_schema(
+    method="get",
+    manual_parameters=[
+        openapi.Parameter("q", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Text searched for", required=True),
+        openapi.Parameter("kinds", openapi.IN_QUERY, type=openapi.TYPE_STRING, description="Comma separated kinds (user, classroom, lesson, event), defaults to all"),
+        openapi.Parameter("limit", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description=f"Number of results, defaults to 20 (max {MAX_LIMIT})"),
+    ]
+)
+@api_view(["GET"])
+@authenticated_required
+def searchView(request, *args, **kwargs):
+    """
+    Returns the users, classrooms, lessons and events matching `q`, best match first.
+    """
+    query = request.query_params.get("q", "").strip()
+    if not query:
+        return Response(
+            {"detail":"`q` is required."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    kinds = [kind.strip() for kind in request.query_params.get("kinds", "").split(",") if kind.strip()] or list(indexing.SOURCES)
+    unknown = [kind for kind in kinds if kind not in indexing.SOURCES]
+    if unknown:
+        return Response(
+            {"detail":f"`kinds` must be among: {', '.join(indexing.SOURCES)}."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        limit = min(max(int(request.query_params.get("limit", 20)), 1), MAX_LIMIT)
+    except ValueError:
+        return Response(
+            {"detail":"Invalid data"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    results = indexing.search(query, documents=_visible_documents(get_access(request), kinds), limit=limit)
+    return Response(
+        {
+            "count":len(results),
+            "results":[
+                {
+                    "kind":document.kind,
+                    "id":document.object_id,
+                    "title":document.title,
+                    "subtitle":document.subtitle,
+                    "score":score,
+                }
+                for document, score in results
+            ],
+        },
+        status=status.HTTP_200_OK
+    )
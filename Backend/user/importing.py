@@ -0,0 +1,255 @@
+"""
+User Import
+===========
+This module imports users in bulk from a CSV or XLSX file.
+
+Classes:
+1. `ImportReport` - The rows read and created, the rejected rows, and the line the file stopped being readable at.
+2. `UnreadableLine` - Raised by `read_rows` for a line that cannot be decoded or parsed.
+
+Functions:
+1. `read_rows` - Streams the rows of an uploaded CSV or XLSX file as dictionaries.
+2. `import_users` - Validates, hashes and inserts the rows in batches and returns an `ImportReport`.
+
+Columns:
+- `username`, `phone_number` and `national_code` are required.
+- `password`, `first_name`, `last_name` and `email` are optional; a user without a password cannot sign in until one is set.
+- `user_type` is "student" (default) or "teacher". Admins are not imported.
+
+Key Features:
+- Rows are read lazily and processed `batch_size` at a time, so memory does not grow with the file.
+- `phone_number` and `national_code` follow the `validate_user_input` rules of the user API; text columns are
+  checked against the length of their `User` field.
+- Duplicates, in the file or against existing users, are found with one query per column per batch.
+- Passwords can be hashed in a process pool, since hashing dominates the cost of creating a user.
+- A file that stops being readable part way through keeps the batches imported before the bad line;
+  the report names the line, as an error and in `file_error`.
+- Users and their `StudentProfile` rows are written with `bulk_create`, one transaction per batch.
+"""
+
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from user.models import User
+from user.views import validate_user_input
+from gamification.models import StudentProfile
+from gamification import leaderboard
+from common import conditional
+from search.tasks import index_task
+
+COLUMNS = ["username", "password", "first_name", "last_name", "email", "phone_number", "national_code", "user_type"]
+IMPORTABLE_USER_TYPES = ["student", "teacher"]
+# Longer values would make the database reject the whole batch of `bulk_create`.
+MAX_LENGTHS = {
+    column: User._meta.get_field(column).max_length
+    for column in ("username", "first_name", "last_name", "email")
+}
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    created: int = 0
+    errors: list = field(default_factory=list)
+    # Set when the file could not be read to its end.
+    file_error: str = None
+
+class UnreadableLine(ValueError):
+    def __init__(self, line, detail):
+        super().__init__(f"Line {line}: {detail}")
+        self.line = line
+
+def _clean(value):
+    if value is None:
+        return ""
+    # Spreadsheets store digit-only cells as numbers.
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+def _decoded_lines(file):
+    """
+    Yields the lines of a binary file as text, decoded one by one so that an error names its line.
+    """
+    for number, line in enumerate(file, start=1):
+        try:
+            yield line.decode("utf-8-sig" if number == 1 else "utf-8")
+        except UnicodeDecodeError:
+            raise UnreadableLine(number, "the file is not UTF-8 encoded text.")
+
+def read_rows(file, filename):
+    """
+    Yields one dict per data row of `file`, keyed by the lower-cased header.
+    `filename` selects the format by its extension (.csv or .xlsx).
+    Raises `UnreadableLine` when a CSV line cannot be decoded or parsed, and ValueError for other formats.
+    """
+    if filename.lower().endswith(".xlsx"):
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ValueError("Importing XLSX files requires the openpyxl package.")
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [_clean(cell).lower() for cell in next(rows, [])]
+            for row in rows:
+                if any(cell not in (None, "") for cell in row):
+                    yield {key: _clean(value) for key, value in zip(header, row) if key}
+        finally:
+            workbook.close()
+    elif filename.lower().endswith(".csv"):
+        reader = csv.reader(_decoded_lines(file))
+        try:
+            header = [_clean(cell).lower() for cell in next(reader, [])]
+            for row in reader:
+                if any(cell.strip() for cell in row):
+                    yield {key: _clean(value) for key, value in zip(header, row) if key}
+        except csv.Error as error:
+            raise UnreadableLine(reader.line_num, f"the file is not valid CSV ({error}).")
+    else:
+        raise ValueError("Only .csv and .xlsx files can be imported.")
+
+def _init_worker():
+    import django
+    django.setup()
+
+def _hash(password):
+    return make_password(password or None)
+
+def _validate(batch, seen):
+    """
+    Returns (valid rows, errors) for a batch of (row number, row) pairs.
+    `seen` collects the unique values of the rows accepted so far in the file.
+    """
+    errors = []
+    candidates = []
+    for number, row in batch:
+        error = validate_user_input(row, {"phone_number": 11, "national_code": 10})
+        user_type = row.get("user_type") or "student"
+        if not error and not row.get("username"):
+            error = "Username is required."
+        if not error:
+            error = next(
+                (
+                    f"{column.replace('_', ' ').capitalize()} must be at most {MAX_LENGTHS[column]} characters."
+                    for column in MAX_LENGTHS if len(row.get(column, "")) > MAX_LENGTHS[column]
+                ),
+                None
+            )
+        if not error and user_type not in IMPORTABLE_USER_TYPES:
+            error = f"User type must be one of: {', '.join(IMPORTABLE_USER_TYPES)}."
+        if error:
+            errors.append({"row":number, "username":row.get("username", ""), "detail":error})
+            continue
+        candidates.append((number, {**row, "user_type": user_type}))
+
+    existing = {
+        column: set(User.objects.filter(
+            **{f"{column}__in": [row[column] for _, row in candidates]}
+        ).values_list(column, flat=True))
+        for column in ("username", "phone_number", "national_code")
+    }
+
+    valid = []
+    for number, row in candidates:
+        duplicate = next(
+            (column for column in existing if row[column] in existing[column] or row[column] in seen[column]),
+            None
+        )
+        if duplicate:
+            errors.append({
+                "row":number,
+                "username":row["username"],
+                "detail":f"{duplicate.replace('_', ' ').capitalize()} already exists."
+            })
+            continue
+        for column in existing:
+            seen[column].add(row[column])
+        valid.append((number, row))
+    return valid, errors
+
+def _insert(rows, passwords):
+    users = [
+        User(
+            username=row["username"],
+            password=password,
+            first_name=row.get("first_name", ""),
+            last_name=row.get("last_name", ""),
+            email=row.get("email", ""),
+            phone_number=row["phone_number"],
+            national_code=row["national_code"],
+            user_type=row["user_type"],
+        )
+        for row, password in zip(rows, passwords)
+    ]
+    with transaction.atomic():
+        User.objects.bulk_create(users)
+        conditional.bump(User)
+        # bulk_create sends no post_save, so the profiles create_student_profile
+        # would make are created here. Ids are read back for MySQL.
+        imported = dict(User.objects.filter(
+            username__in=[row["username"] for row in rows]
+        ).values_list("id", "user_type"))
+        student_ids = [user_id for user_id, user_type in imported.items() if user_type == "student"]
+        StudentProfile.objects.bulk_create([StudentProfile(students_id=student_id) for student_id in student_ids])
+        leaderboard.record(
+            leaderboard.Entry(profile_id, student_id, level, total_point)
+            for profile_id, student_id, level, total_point in StudentProfile.objects.filter(
+                students_id__in=student_ids
+            ).values_list("id", "students_id", "level", "total_point")
+        )
+        index_task.dispatch("user", list(imported))
+    return len(users)
+
+def import_users(rows, batch_size=500, workers=None, progress=None):
+    """
+    Imports `rows` (dicts with the `COLUMNS` keys) and returns an `ImportReport`.
+
+    An `UnreadableLine` raised by `rows` ends the import: the rows read before it are still imported.
+
+    Args:
+        rows: An iterable of row dicts, e.g. from `read_rows`.
+        batch_size (int): Rows validated and inserted per transaction.
+        workers (int): Size of the password hashing pool; 0 hashes in this process. Defaults to the CPU count.
+        progress (callable): Called with the report after every batch.
+    """
+    workers = os.cpu_count() if workers is None else workers
+    report = ImportReport()
+    seen = {"username": set(), "phone_number": set(), "national_code": set()}
+    numbered = enumerate(rows, start=2)  # Row 1 is the header.
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) if workers > 1 else None
+    try:
+        while report.file_error is None:
+            batch = []
+            try:
+                for numbered_row in islice(numbered, batch_size):
+                    batch.append(numbered_row)
+            except UnreadableLine as error:
+                report.file_error = str(error)
+                report.errors.append({"row":error.line, "username":"", "detail":str(error)})
+            if not batch:
+                break
+            report.rows += len(batch)
+
+            valid, errors = _validate(batch, seen)
+            report.errors.extend(errors)
+            if valid:
+                passwords = [row.get("password", "") for _, row in valid]
+                if pool:
+                    hashed = list(pool.map(_hash, passwords, chunksize=max(1, len(passwords) // (workers * 4))))
+                else:
+                    hashed = [_hash(password) for password in passwords]
+                report.created += _insert([row for _, row in valid], hashed)
+
+            if progress:
+                progress(report)
+    finally:
+        if pool:
+            pool.shutdown()
+
+    report.errors.sort(key=lambda error: error["row"])
+    return report
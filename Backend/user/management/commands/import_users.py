@@ -0,0 +1,54 @@
+"""
+Imports users from a CSV or XLSX file.
+
+See `user.importing` for the accepted columns. Progress is printed after
+every batch, and the rejected rows are listed at the end or written to
+--errors as CSV.
+
+Usage:
+    python manage.py import_users students.csv [--batch-size 500] [--workers 4] [--errors errors.csv]
+"""
+
+import csv
+from django.core.management.base import BaseCommand, CommandError
+from user.importing import read_rows, import_users
+
+class Command(BaseCommand):
+    help = "Import users from a CSV or XLSX file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="The .csv or .xlsx file to import.")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--workers", type=int, default=None, help="Password hashing processes, 0 to hash in this process.")
+        parser.add_argument("--errors", help="Write the rejected rows to this CSV file.")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        def progress(report):
+            self.stderr.write(f"{report.rows} row(s) read, {report.created} created, {len(report.errors)} rejected.")
+
+        try:
+            with open(options["path"], "rb") as file:
+                report = import_users(
+                    read_rows(file, options["path"]),
+                    batch_size=options["batch_size"],
+                    workers=options["workers"],
+                    progress=progress
+                )
+        except (OSError, ValueError) as error:
+            raise CommandError(str(error))
+
+        if options["errors"]:
+            with open(options["errors"], "w", newline="") as output:
+                writer = csv.DictWriter(output, fieldnames=["row", "username", "detail"])
+                writer.writeheader()
+                writer.writerows(report.errors)
+        else:
+            for error in report.errors:
+                self.stdout.write(f"Row {error['row']} ({error['username']}): {error['detail']}")
+
+        if report.file_error:
+            raise CommandError(f"{report.file_error} Stopped there: {report.created} of {report.rows} user(s) imported.")
+        self.stdout.write(self.style.SUCCESS(f"{report.created} of {report.rows} user(s) imported."))
@@ -1,9 +1,16 @@
-from django.db.models.signals import post_save 
+from django.db.models.signals import post_save, post_delete 
 from user.models import User 
 from django.dispatch import receiver
+from common.authentication import forget_user_state
 
 @receiver(post_save, sender=User)
 def save_admin_is_staff(instance, created, **kwargs):
     if created and instance.user_type == "admin":
         instance.is_staff = True 
-        instance.save()
\ No newline at end of file
+        instance.save()
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_cached_user_state(instance, **kwargs):
+    # Deactivation and role changes take effect on the next request.
+    forget_user_state(instance.pk)
@@ -0,0 +1,165 @@
+import pytest
+from io import BytesIO, StringIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from rest_framework import status
+from user.models import User
+from user.importing import import_users, read_rows
+from gamification.models import StudentProfile
+
+CSV_HEADER = "username,password,first_name,last_name,email,phone_number,national_code,user_type\n"
+
+def csv_file(*lines, name="users.csv"):
+    return SimpleUploadedFile(name, (CSV_HEADER + "\n".join(lines) + "\n").encode(), content_type="text/csv")
+
+@pytest.mark.django_db
+class TestUserImportView:
+    def setup_method(self):
+        self.admin = User.objects.create_user(
+            username="test_admin1",
+            password="admin1234",
+            phone_number="09309500001",
+            national_code="0960030001",
+            user_type="admin"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_if_user_is_not_admin_return_403(self):
+        # Arrange
+        student = User.objects.create_user(
+            username="test_student1",
+            password="student1234",
+            phone_number="09309500002",
+            national_code="0960030002",
+            user_type="student"
+        )
+        self.client.force_authenticate(user=student)
+
+        # Act
+        response = self.client.post("/users/import/", {"file": csv_file()}, format="multipart")
+
+        # Assert
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_file_is_valid_create_users_and_profiles(self):
+        # Arrange
+        upload = csv_file(
+            "ali,secret123,Ali,Ahmadi,ali@domain.com,09120000001,1000000001,student",
+            "sara,,Sara,Rahimi,,09120000002,1000000002,",
+            "reza,teach123,Reza,Karimi,,09120000003,1000000003,teacher",
+        )
+
+        # Act
+        response = self.client.post("/users/import/", {"file": upload}, format="multipart")
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["data"] == {"rows": 3, "created": 3}
+        assert User.objects.get(username="ali").check_password("secret123")
+        assert not User.objects.get(username="sara").has_usable_password()
+        assert StudentProfile.objects.filter(students__username__in=["ali", "sara", "reza"]).count() == 2
+
+    def test_if_rows_are_invalid_report_each_of_them(self):
+        # Arrange
+        upload = csv_file(
+            "ali,secret123,,,,09120000001,1000000001,student",
+            "dup,secret123,,,,09120000001,1000000009,student",
+            "short,secret123,,,,0912,1000000002,student",
+            "boss,secret123,,,,09120000004,1000000004,admin",
+            "test_admin1,secret123,,,,09120000005,1000000005,student",
+        )
+
+        # Act
+        response = self.client.post("/users/import/", {"file": upload}, format="multipart")
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["data"]["created"] == 1
+        assert [(error["row"], error["detail"]) for error in response.data["errors"]] == [
+            (3, "Phone number already exists."),
+            (4, "Phone number must be 11 digits."),
+            (5, "User type must be one of: student, teacher."),
+            (6, "Username already exists."),
+        ]
+
+    def test_if_file_type_is_not_supported_return_400(self):
+        # Act
+        response = self.client.post(
+            "/users/import/",
+            {"file": SimpleUploadedFile("users.txt", b"username\n")},
+            format="multipart"
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.parametrize("content, line, created", [
+        ((CSV_HEADER + "ali,,,,,09120000001,1000000001,student\nsara,\xff,,,,09120000002,1000000002,\n").encode("latin-1"), 3, 1),
+        ((CSV_HEADER + "ali,," + "x" * 200000 + ",,,09120000001,1000000001,student\n").encode(), 2, 0),
+    ])
+    def test_if_file_cannot_be_read_report_line_and_users_created_before_it(self, content, line, created):
+        # Act
+        response = self.client.post(
+            "/users/import/",
+            {"file": SimpleUploadedFile("users.csv", content, content_type="text/csv")},
+            format="multipart"
+        )
+
+        # Assert
+        assert response.status_code == (status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST)
+        assert response.data["detail"].startswith(f"Line {line}: ")
+        assert response.data["data"]["created"] == created
+        assert response.data["errors"][-1]["row"] == line
+        assert User.objects.filter(username="ali").exists() == bool(created)
+
+    def test_if_file_breaks_after_a_batch_earlier_batches_are_reported(self):
+        # Arrange
+        rows = (CSV_HEADER + "".join(
+            f"student{index},,,,,0912{index:07d},{index:010d},student\n" for index in range(1, 6)
+        )).encode() + b"bad,\xff,,,,09120000009,1000000009,\n"
+
+        # Act
+        report = import_users(read_rows(BytesIO(rows), "users.csv"), batch_size=2, workers=0)
+
+        # Assert
+        assert (report.rows, report.created) == (5, 5)
+        assert report.file_error == "Line 7: the file is not UTF-8 encoded text."
+        assert report.errors == [{"row": 7, "username": "", "detail": report.file_error}]
+
+    def test_if_value_is_too_long_only_its_row_is_rejected(self):
+        # Arrange
+        upload = csv_file(
+            "ali,secret123,,,,09120000001,1000000001,student",
+            f"{'x' * 200},secret123,,,,09120000002,1000000002,student",
+        )
+
+        # Act
+        response = self.client.post("/users/import/", {"file": upload}, format="multipart")
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["data"]["created"] == 1
+        assert [(error["row"], error["detail"]) for error in response.data["errors"]] == [
+            (3, "Username must be at most 150 characters.")
+        ]
+
+@pytest.mark.django_db
+class TestImportUsersCommand:
+    def test_if_file_is_imported_in_batches_with_a_process_pool(self, tmp_path):
+        # Arrange
+        path = tmp_path / "students.csv"
+        path.write_text(CSV_HEADER + "".join(
+            f"student{index},pass{index},,,,0912{index:07d},{index:010d},student\n" for index in range(1, 8)
+        ))
+        stdout, stderr = StringIO(), StringIO()
+
+        # Act
+        call_command("import_users", str(path), "--batch-size", "3", "--workers", "2", stdout=stdout, stderr=stderr)
+
+        # Assert
+        assert "7 of 7 user(s) imported." in stdout.getvalue()
+        assert stderr.getvalue().count("row(s) read") == 3
+        assert User.objects.get(username="student5").check_password("pass5")
+        assert StudentProfile.objects.count() == 7
@@ -1,9 +1,11 @@
 from django.urls import path 
 from user.views import userGetView, userCreateView, userUpdateView, userDeleteView
+from user.user_import_views import userImportView
 
 urlpatterns = [
     path("users/", userGetView, name="user-get"),
     path("users/create/", userCreateView, name="user-create"),
+    path("users/import/", userImportView, name="user-import"),
     path("users/<int:user_id>/update/", userUpdateView, name="user-update"),
     path("users/<int:user_id>/delete/", userDeleteView, name="user-delete"),
 
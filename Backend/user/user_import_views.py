@@ -0,0 +1,74 @@
+"""
+User Import API
+===============
+This module provides the enrolment upload endpoint.
+1. POST `/users/import/` - Create users from an uploaded CSV or XLSX file (admin-only).
+
+Key Features:
+- The file is parsed as a stream and imported in batches by `user.importing.import_users`.
+- Phone numbers and national codes are validated with the same rules as `/users/create/`.
+- Users are inserted with `bulk_create`, with their student profiles. Passwords are hashed in the request:
+  a process pool is not started from a web process, large files go through `python manage.py import_users`.
+- The response reports the number of rows read and created, and an error for every rejected row. A file that
+  cannot be read to its end is reported with its bad line, after the rows before it were imported.
+"""
+
+from rest_framework.decorators import api_view, parser_classes
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from common.is_authenticated import authenticated_required
+from common.is_admin import admin_required
+from user.importing import read_rows, import_users
+
+@swagger_auto_schema(
+    method="post",
+    manual_parameters=[
+        openapi.Parameter("file", openapi.IN_FORM, type=openapi.TYPE_FILE, required=True, description="A .csv or .xlsx file with a header row"),
+    ],
+    responses={
+        201: "Created",
+        400: "Invalid data",
+        401: "Authenticated required",
+        403: "Forbidden"
+    }
+)
+@api_view(["POST"])
+@parser_classes([MultiPartParser])
+@authenticated_required
+@admin_required
+def userImportView(request, *args, **kwargs):
+    """
+    Imports users from an uploaded file (admin-only).
+    - Valid rows are created even if other rows are rejected.
+    - Rejected rows are returned in `errors` with their row number in the file.
+    - An unreadable line ends the import; `detail` names it and the users created before it are reported.
+    """
+    uploaded = request.FILES.get("file")
+    if not uploaded:
+        return Response(
+            {"detail":"A file is required."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        report = import_users(read_rows(uploaded.file, uploaded.name), workers=0)
+    except ValueError as error:
+        return Response(
+            {"detail":str(error)},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    detail = f"{report.created} of {report.rows} user(s) imported."
+    if report.file_error:
+        detail = f"{report.file_error} Stopped there: {report.created} of {report.rows} user(s) imported."
+    return Response(
+        {
+            "detail":detail,
+            "data":{"rows":report.rows, "created":report.created},
+            "errors":report.errors
+        },
+        status=status.HTTP_201_CREATED if report.created else status.HTTP_400_BAD_REQUEST
+    )
@@ -25,7 +25,10 @@ from rest_framework import status
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from django.contrib.auth.hashers import make_password
-from rest_framework.pagination import PageNumberPagination
+from common.pagination import get_paginator, PAGINATION_PARAMETERS
+from common.conditional import conditional
+from common.is_authenticated import authenticated_required
+from common.access import get_access
 from django.conf import settings
 
 # Helper function to validate user input fields
@@ -57,9 +60,11 @@ def validate_user_input(data, required_fields):
         openapi.Parameter('username', openapi.IN_QUERY, description="Filter by username", type=openapi.TYPE_STRING),
         openapi.Parameter('phone_number', openapi.IN_QUERY, description="Filter by phone number", type=openapi.TYPE_STRING),
         openapi.Parameter('national_code', openapi.IN_QUERY, description="Filter by national code", type=openapi.TYPE_STRING),
-    ]
+    ] + PAGINATION_PARAMETERS
 )
 @api_view(["GET"])
+@authenticated_required
+@conditional(User)
 def userGetView(request, *args, **kwargs):
     """
     Retrieves a list of users based on filters.
@@ -67,14 +72,9 @@ def userGetView(request, *args, **kwargs):
     - Non-staff users can only view their own data.
     """
     user = request.user
-    if not user.is_authenticated:
-        return Response(
-            {"detail": "Please sign-in."}, 
-            status=status.HTTP_401_UNAUTHORIZED
-        )
 
     # Staff users can view all users; others can only view their own data.
-    queryset = User.objects.filter(id=user.id) if not user.is_staff else User.objects.all()
+    queryset = User.objects.filter(id=user.id) if not get_access(request).is_staff else User.objects.all()
 
     # Apply filters based on query parameters
     filters = {
@@ -86,8 +86,7 @@ def userGetView(request, *args, **kwargs):
     queryset = queryset.filter(**filters)
 
     # Paginate the results for better performance
-    paginator = PageNumberPagination()
-    paginator.page_size = 10
+    paginator = get_paginator(request)
     paginated_queryset = paginator.paginate_queryset(queryset, request)
     serializer = UserSerializer(paginated_queryset, many=True)
     return paginator.get_paginated_response(serializer.data)
@@ -196,7 +195,7 @@ def userUpdateView(request, *args, **kwargs):
         )
 
     # Ensure only staff or the user themselves can update the data
-    if not user.is_staff and target_user.id != user.id:
+    if not get_access(request).is_staff and target_user.id != user.id:
         return Response(
             {"detail": "You are not allowed to update this user."},
             status=status.HTTP_403_FORBIDDEN
@@ -279,7 +278,7 @@ def userDeleteView(request, *args, **kwargs):
         )
 
     # Ensure only staff or the user themselves can delete the account
-    if not user.is_staff and target_user.id != user.id:
+    if not get_access(request).is_staff and target_user.id != user.id:
         return Response(
             {"detail": "You are not allowed to delete this user."}, 
             status=status.HTTP_403_FORBIDDEN